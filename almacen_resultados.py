@@ -0,0 +1,282 @@
+# --- Almacén de Resultados de Corridas ---
+# Una corrida con semilla es reproducible: con los mismos parámetros, la misma semilla
+# y las mismas reglas de aptitud da siempre el mismo resultado. El almacén guarda el
+# resultado de cada corrida (población final, salón de la fama, logbook y tiempo) en un
+# archivo cuyo nombre es el hash de su configuración completa, así que ejecutar_ag()
+# (piloto_ideal_ag.py) y barrido_parametros.py pueden devolverlo al instante en lugar
+# de volver a correr.
+#
+# La configuración incluye, además de los parámetros y la semilla, una huella de las
+# reglas: el código de config_piloto.py y reglas_piloto.py (cache_aptitud.MODULOS_REGLAS)
+# y las huellas (ver cache_aptitud.huella_funcion) de la evaluación, el cruce y la
+# mutación de la toolbox.
+# Si se edita una regla cambia la huella, cambia la clave y la corrida se vuelve a
+# hacer; las entradas viejas quedan sin usar hasta que se borran con purgar(). Cada
+# entrada guarda además la huella del código de las reglas sola (huella_modulos), así
+# purgar() reconoce las de reglas viejas sea cual sea la función de evaluación con la
+# que se guardaron (la de por defecto, la de --comparar, la compacta, ...).
+#
+# No se guardan (ni se buscan) las corridas sin semilla, con búsqueda local, con punto
+# de control o con un criterio de parada por tiempo, que no son reproducibles o
+# dependen de objetos que no entran en la clave. Cada entrada es un .npz (arreglos de
+# NumPy más un bloque JSON, como punto_control.py) en <directorio>/<2 primeros>/<clave>.npz,
+# escrito a un temporal y después renombrado.
+#
+# Uso:
+#   almacen = AlmacenResultados("resultados_ag")
+#   ejecutar_ag(semilla=1, almacen=almacen)     # la segunda vez no corre el AG
+#   python piloto_ideal_ag.py --semilla 1 --almacen
+#   python barrido_parametros.py --torneo 3 10 40 --almacen
+#   python almacen_resultados.py --purgar        # borra las entradas de reglas viejas
+#   python almacen_resultados.py --purgar --huella <huella_reglas>   # y las de otras configuraciones
+
+import hashlib
+import json
+import os
+import time
+import zipfile
+
+import numpy
+
+from cache_aptitud import COLUMNAS_CACHE, MODULOS_REGLAS, huella_funcion, huella_modulos
+from config_piloto import empaquetar_cromosoma
+from punto_control import individuos_desde_arreglos
+
+VERSION_FORMATO = 1
+DIRECTORIO_ALMACEN = "resultados_ag"
+
+
+# --- Claves ---
+def huella_reglas(toolbox):
+    """
+    Hash corto del código de las reglas y de los operadores de la toolbox.
+    """
+    resumen = hashlib.sha1(huella_modulos(MODULOS_REGLAS).encode())
+    for operador in ("evaluate", "mate", "mutate"):
+        resumen.update(huella_funcion(getattr(toolbox, operador)).encode())
+    return resumen.hexdigest()[:16]
+
+
+def configuracion_corrida(contexto, parametros, semilla, parada=None):
+    """
+    Configuración completa de una corrida (lo que define su resultado), o None si
+    la corrida no se puede reutilizar (ver el comentario del módulo).
+    """
+    from criterios_parada import CriterioParada
+
+    if semilla is None:
+        return None
+    opciones_parada = None
+    if parada is not None:
+        if not isinstance(parada, CriterioParada) or parada.max_segundos is not None:
+            return None
+        opciones_parada = {"estancamiento": parada.estancamiento, "objetivo": parada.objetivo,
+                           "desvio_minimo": parada.desvio_minimo, "max_evaluaciones": parada.max_evaluaciones}
+    return {
+        "version": VERSION_FORMATO,
+        "parametros": parametros,
+        "semilla": semilla,
+        "parada": opciones_parada,
+        "estadisticas": list(contexto.stats.fields) + (COLUMNAS_CACHE if contexto.cache_aptitud is not None else []),
+        "huella_reglas": huella_reglas(contexto.toolbox),
+    }
+
+
+def clave_corrida(configuracion):
+    """
+    Hash (sha256) del JSON canónico de la configuración.
+    """
+    return hashlib.sha256(json.dumps(configuracion, sort_keys=True).encode()).hexdigest()
+
+
+# --- Conversión ---
+def _valor_simple(valor):
+    return valor.item() if hasattr(valor, "item") else valor
+
+
+def _arreglos_individuos(individuos):
+    """
+    (genotipos uint16, aptitudes float64 (N, objetivos)) de una lista de individuos.
+    """
+    genotipos = numpy.fromiter((ind.genotipo if hasattr(ind, "genotipo") else empaquetar_cromosoma(ind)
+                                for ind in individuos), dtype=numpy.uint16, count=len(individuos))
+    objetivos = len(individuos[0].fitness.values) if individuos else 1
+    aptitudes = numpy.array([ind.fitness.values for ind in individuos], dtype=numpy.float64)
+    return genotipos, aptitudes.reshape(len(individuos), objetivos)
+
+
+def logbook_compacto(logbook):
+    """
+    El logbook por columnas ({"header": [...], "columnas": {clave: valores}}); las
+    claves que faltan en una generación quedan en None.
+    """
+    claves = list(dict.fromkeys(clave for registro in logbook for clave in registro))
+    return {"header": logbook.header,
+            "columnas": {clave: [_valor_simple(registro.get(clave)) for registro in logbook] for clave in claves}}
+
+
+def registros_logbook(compacto):
+    """
+    Las generaciones (diccionarios) de un logbook_compacto().
+    """
+    columnas = compacto["columnas"]
+    largo = len(next(iter(columnas.values()), []))
+    return [{clave: valores[i] for clave, valores in columnas.items() if valores[i] is not None}
+            for i in range(largo)]
+
+
+class AlmacenResultados:
+    """
+    Resultados de corridas en un directorio, direccionados por el hash de su
+    configuración (ver el comentario del módulo).
+    """
+
+    def __init__(self, directorio=DIRECTORIO_ALMACEN):
+        self.directorio = directorio
+        self.aciertos = 0
+        self.guardados = 0
+        self.ultimo = None  # meta de la última entrada leída
+
+    def ruta(self, clave):
+        return os.path.join(self.directorio, clave[:2], clave + ".npz")
+
+    def buscar(self, configuracion):
+        """
+        Devuelve la entrada guardada para la configuración (diccionario con meta,
+        tipo, poblacion, salon_fama y registros) o None. Un archivo ilegible cuenta
+        como ausente.
+        """
+        ruta = self.ruta(clave_corrida(configuracion))
+        if not os.path.exists(ruta):
+            return None
+        try:
+            with numpy.load(ruta) as datos:
+                meta = json.loads(datos["meta"].tobytes().decode("utf-8"))
+                arreglos = {nombre: datos[nombre] for nombre in ("poblacion", "aptitudes", "hof_genotipos",
+                                                                 "hof_aptitudes")}
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+        if meta.get("version") != VERSION_FORMATO or meta.get("configuracion") != configuracion:
+            return None
+        tipo = meta["tipo"]
+        self.aciertos += 1
+        self.ultimo = meta
+        return {
+            "meta": meta,
+            "tipo": tipo,
+            "poblacion": individuos_desde_arreglos(tipo, arreglos["poblacion"], arreglos["aptitudes"]),
+            "salon_fama": individuos_desde_arreglos(tipo, arreglos["hof_genotipos"], arreglos["hof_aptitudes"]),
+            "header": meta["logbook"]["header"],
+            "registros": registros_logbook(meta["logbook"]),
+        }
+
+    def guardar(self, configuracion, poblacion, halloffame, logbook, tiempo):
+        """
+        Guarda el resultado de una corrida (de forma atómica) y devuelve su clave.
+        """
+        clave = clave_corrida(configuracion)
+        genotipos, aptitudes = _arreglos_individuos(poblacion)
+        hof_genotipos, hof_aptitudes = _arreglos_individuos(list(halloffame))
+        meta = {
+            "version": VERSION_FORMATO,
+            "clave": clave,
+            "configuracion": configuracion,
+            "tipo": "compacto" if poblacion and hasattr(poblacion[0], "genotipo") else "lista",
+            "tiempo_s": tiempo,
+            "huella_modulos": huella_modulos(MODULOS_REGLAS),
+            "fecha": time.time(),
+            "logbook": logbook_compacto(logbook),
+        }
+        ruta = self.ruta(clave)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        # Temporal por proceso: en un barrido varios procesos escriben en el mismo directorio
+        ruta_temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(ruta_temporal, "wb") as archivo:
+            numpy.savez(archivo, poblacion=genotipos, aptitudes=aptitudes, hof_genotipos=hof_genotipos,
+                        hof_aptitudes=hof_aptitudes,
+                        meta=numpy.frombuffer(json.dumps(meta).encode("utf-8"), dtype=numpy.uint8))
+        os.replace(ruta_temporal, ruta)
+        self.guardados += 1
+        return clave
+
+    def entradas(self):
+        """
+        Recorre (ruta, meta) de todas las entradas del almacén.
+        """
+        if not os.path.isdir(self.directorio):
+            return
+        for prefijo in sorted(os.listdir(self.directorio)):
+            carpeta = os.path.join(self.directorio, prefijo)
+            if not os.path.isdir(carpeta):
+                continue
+            for nombre in sorted(os.listdir(carpeta)):
+                if not nombre.endswith(".npz"):
+                    continue
+                ruta = os.path.join(carpeta, nombre)
+                try:
+                    with numpy.load(ruta) as datos:
+                        meta = json.loads(datos["meta"].tobytes().decode("utf-8"))
+                except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                    meta = None
+                yield ruta, meta
+
+    def purgar(self, huella=None):
+        """
+        Borra las entradas ilegibles, de otra versión del formato o guardadas con otro
+        código de reglas (ver entrada_vigente) y, si se indica una huella, también las
+        de cualquier otra configuración (huella_reglas distinta). Devuelve cuántas borró.
+        """
+        borradas = 0
+        for ruta, meta in list(self.entradas()):
+            vigente = entrada_vigente(meta) and (huella is None or meta["configuracion"]["huella_reglas"] == huella)
+            if not vigente:
+                os.remove(ruta)
+                borradas += 1
+        return borradas
+
+
+def entrada_vigente(meta):
+    """
+    False si la entrada es ilegible, de otra versión del formato o se guardó con otro
+    código de reglas. Las entradas sin huella_modulos (anteriores a ese campo) cuentan
+    como vigentes: no hay forma de saber con qué reglas se guardaron.
+    """
+    if meta is None or meta.get("version") != VERSION_FORMATO:
+        return False
+    return meta.get("huella_modulos", huella_modulos(MODULOS_REGLAS)) == huella_modulos(MODULOS_REGLAS)
+
+
+def _argumentos():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Almacén de resultados de corridas del AG.")
+    parser.add_argument("--directorio", default=DIRECTORIO_ALMACEN)
+    parser.add_argument("--purgar", action="store_true",
+                        help="borrar las entradas ilegibles o guardadas con reglas distintas de las actuales")
+    parser.add_argument("--huella", default=None,
+                        help="con --purgar, borrar también las entradas con otra huella_reglas")
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    import piloto_ideal_ag
+
+    argumentos = _argumentos()
+    almacen = AlmacenResultados(argumentos.directorio)
+    huella = huella_reglas(piloto_ideal_ag.obtener_contexto().toolbox)
+    if argumentos.purgar:
+        print(f"{almacen.purgar(argumentos.huella)} entradas borradas")
+    vigentes = 0
+    for ruta, meta in almacen.entradas():
+        if not entrada_vigente(meta):
+            print(f"{ruta}: ilegible, de otra versión o de reglas viejas (se borra con --purgar)")
+            continue
+        vigentes += 1
+        parametros = meta["configuracion"]["parametros"]
+        print(f"{meta['clave'][:12]} semilla={meta['configuracion']['semilla']} "
+              f"pobl={parametros['tam_poblacion']} ngen={parametros['num_generaciones']} "
+              f"{parametros['seleccion']} torneo={parametros['tam_torneo']} "
+              f"reglas={meta['configuracion']['huella_reglas']} t={meta['tiempo_s']:.2f} s")
+    print(f"{vigentes} entradas con las reglas vigentes en {argumentos.directorio} "
+          f"(huella_reglas de la configuración por defecto: {huella})")
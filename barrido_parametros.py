@@ -0,0 +1,300 @@
+# --- Barrido de Parámetros en Paralelo ---
+# Ejecuta ejecutar_ag() (piloto_ideal_ag.py) para muchas combinaciones de parámetros,
+# con varias semillas por combinación, repartiendo las corridas entre todos los núcleos.
+#
+# Cada corrida recibe su propia semilla, derivada de una semilla base con
+# numpy.random.SeedSequence, así que los resultados no dependen de qué proceso ejecutó
+# cada corrida y cualquier fila de la tabla se puede repetir con ejecutar_ag(semilla=...).
+#
+# Uso (grilla completa, 20 semillas por punto):
+#   python barrido_parametros.py --poblacion 50 100 200 --torneo 3 10 40 --semillas 20
+# Uso (20 puntos al azar de esos valores):
+#   python barrido_parametros.py --poblacion 50 100 200 --mutacion 0.1 0.2 0.3 --aleatorio 20
+# Uso (cortando cada corrida tras 15 generaciones sin mejora o al llegar al óptimo, ver criterios_parada.py):
+#   python barrido_parametros.py --torneo 3 10 40 --estancamiento 15 --objetivo optimo
+# Uso (con el avance de cada proceso en http://127.0.0.1:9100/metrics, ver metricas_http.py):
+#   python barrido_parametros.py --torneo 3 10 40 --metricas-puerto 9100
+# Uso (reutilizando las corridas que ya se hicieron con las mismas reglas, ver almacen_resultados.py):
+#   python barrido_parametros.py --torneo 3 10 40 --almacen
+
+import argparse
+import csv
+import itertools
+import os
+import random
+import statistics
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+# Parámetros de ejecutar_ag() que se pueden barrer, con sus valores por defecto
+# (los mismos que usa piloto_ideal_ag.py)
+PARAMETROS_BASE = {
+    "tam_poblacion": 100,
+    "prob_cruce": 0.7,
+    "prob_mutacion": 0.3,
+    "num_generaciones": 100,
+    "seleccion": "torneo",
+    "tam_torneo": 40,
+}
+
+COLUMNAS_RESULTADO = (["punto"] + list(PARAMETROS_BASE) +
+                      ["semilla", "mejor_aptitud", "mejor_genotipo", "gen_mejor", "avg_final",
+                       "evaluaciones", "evaluaciones_reales", "gen_final", "parada", "reutilizada", "tiempo_s"])
+
+
+# --- Generación de configuraciones ---
+def grilla(**valores):
+    """
+    Devuelve todas las combinaciones (producto cartesiano) de los valores dados.
+    Los parámetros que no se indiquen toman su valor de PARAMETROS_BASE.
+    Ej: grilla(tam_poblacion=[50, 100], tam_torneo=[3, 40]) -> 4 configuraciones.
+    """
+    nombres = list(valores)
+    configuraciones = []
+    for combinacion in itertools.product(*(valores[nombre] for nombre in nombres)):
+        configuracion = dict(PARAMETROS_BASE)
+        configuracion.update(zip(nombres, combinacion))
+        configuraciones.append(configuracion)
+    return configuraciones
+
+
+def muestra_aleatoria(espacio, n, semilla=None):
+    """
+    Devuelve n configuraciones al azar. En el espacio, cada parámetro puede ser
+    una lista de valores (se elige uno) o una tupla (minimo, maximo) (se sortea
+    un valor uniforme; entero si ambos extremos son enteros).
+    """
+    generador = random.Random(semilla)
+    configuraciones = []
+    for _ in range(n):
+        configuracion = dict(PARAMETROS_BASE)
+        for nombre, valores in espacio.items():
+            if isinstance(valores, tuple):
+                minimo, maximo = valores
+                if isinstance(minimo, int) and isinstance(maximo, int):
+                    configuracion[nombre] = generador.randint(minimo, maximo)
+                else:
+                    configuracion[nombre] = generador.uniform(minimo, maximo)
+            else:
+                configuracion[nombre] = generador.choice(list(valores))
+        configuraciones.append(configuracion)
+    return configuraciones
+
+
+def generar_trabajos(configuraciones, semillas_por_punto, semilla_base=0):
+    """
+    Arma la lista de corridas: cada configuración se repite semillas_por_punto veces,
+    cada vez con una semilla independiente derivada de semilla_base.
+    """
+    total = len(configuraciones) * semillas_por_punto
+    secuencias = numpy.random.SeedSequence(semilla_base).spawn(total)
+    trabajos = []
+    for i, configuracion in enumerate(configuraciones):
+        for repeticion in range(semillas_por_punto):
+            secuencia = secuencias[i * semillas_por_punto + repeticion]
+            trabajo = dict(configuracion)
+            trabajo["punto"] = i
+            trabajo["semilla"] = int(secuencia.generate_state(1)[0])
+            trabajos.append(trabajo)
+    return trabajos
+
+
+# --- Ejecución ---
+def ejecutar_trabajo(trabajo):
+    """
+    Ejecuta una corrida (dentro de un proceso del pool) y devuelve su fila de resultados.
+    Si el trabajo trae "parada" (parámetros de CriterioParada) la corrida puede
+    terminar antes de num_generaciones. Si el proceso se conectó a una TablaMetricas
+    (ver ejecutar_barrido) cada generación se publica en su fila. Si el trabajo trae
+    "almacen" (un directorio) la corrida se toma de ahí cuando ya se hizo.
+    """
+    import piloto_ideal_ag
+    from config_piloto import empaquetar_cromosoma
+    from criterios_parada import CriterioParada
+    from metricas_http import sumidero_trabajador
+    from almacen_resultados import AlmacenResultados
+
+    parametros = {nombre: trabajo[nombre] for nombre in PARAMETROS_BASE}
+    parada = CriterioParada(**trabajo["parada"]) if trabajo.get("parada") else None
+    almacen = AlmacenResultados(trabajo["almacen"]) if trabajo.get("almacen") else None
+    metricas = sumidero_trabajador()
+    if metricas is not None:
+        metricas.iniciar_corrida()
+    inicio = time.perf_counter()
+    # Un contexto nuevo por corrida, así la cache de aptitud (y la columna evaluaciones_reales)
+    # no depende de qué otras corridas hizo antes el mismo proceso
+    _, logbook, hof = piloto_ideal_ag.ejecutar_ag(semilla=trabajo["semilla"], verbose=False,
+                                                  contexto=piloto_ideal_ag.crear_contexto(), parada=parada,
+                                                  sumidero=metricas, almacen=almacen, **parametros)
+    tiempo = time.perf_counter() - inicio
+    if metricas is not None:
+        metricas.terminar_corrida()
+
+    maximos = logbook.select("max")
+    mejor = hof[0].fitness.values[0]
+    fila = {"punto": trabajo["punto"], **parametros, "semilla": trabajo["semilla"]}
+    fila.update({
+        "mejor_aptitud": mejor,
+        "mejor_genotipo": empaquetar_cromosoma(hof[0]),
+        "gen_mejor": next(gen for gen, maximo in zip(logbook.select("gen"), maximos) if maximo >= mejor),
+        "avg_final": logbook[-1]["avg"],
+        "evaluaciones": sum(logbook.select("nevals")),
+        "evaluaciones_reales": sum(logbook.select("fallos")) if "fallos" in logbook.header else "",
+        "gen_final": logbook[-1]["gen"],
+        "parada": logbook[-1].get("parada", ""),
+        "reutilizada": almacen is not None and almacen.aciertos > 0,
+        "tiempo_s": round(tiempo, 4),
+    })
+    return fila
+
+
+def ejecutar_barrido(trabajos, procesos=None, metricas=None):
+    """
+    Ejecuta todas las corridas en un pool de procesos (por defecto, uno por núcleo)
+    y devuelve las filas de resultados en el mismo orden que los trabajos.
+    Con metricas (una TablaMetricas de metricas_http.py con una fila por proceso)
+    cada proceso publica ahí el avance de sus corridas.
+    """
+    from metricas_http import conectar_trabajador
+
+    procesos = procesos or os.cpu_count()
+    contador = multiprocessing.Value("i", 0) if metricas is not None else None
+    if procesos == 1:
+        if metricas is not None:
+            conectar_trabajador(metricas, contador)
+        return [ejecutar_trabajo(trabajo) for trabajo in trabajos]
+    # Mandamos las corridas en tandas para no pagar la comunicación entre procesos en cada una
+    tanda = max(1, len(trabajos) // (procesos * 4))
+    inicializar = {"initializer": conectar_trabajador, "initargs": (metricas, contador)} if metricas is not None else {}
+    with ProcessPoolExecutor(max_workers=procesos, **inicializar) as pool:
+        return list(pool.map(ejecutar_trabajo, trabajos, chunksize=tanda))
+
+
+# --- Resultados ---
+def guardar_resultados_csv(filas, ruta):
+    """
+    Escribe la tabla consolidada de resultados (una fila por corrida).
+    """
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=COLUMNAS_RESULTADO)
+        escritor.writeheader()
+        escritor.writerows(filas)
+
+
+def resumir(filas, optimo=None):
+    """
+    Agrupa las filas por configuración y devuelve una fila resumen por punto:
+    corridas, media y mediana de la mejor aptitud, tasa de éxito (si se conoce el
+    óptimo), mediana de la generación en que se alcanzó el mejor y tiempo medio.
+    """
+    por_punto = {}
+    for fila in filas:
+        por_punto.setdefault(fila["punto"], []).append(fila)
+
+    resumen = []
+    for punto, grupo in sorted(por_punto.items()):
+        mejores = [fila["mejor_aptitud"] for fila in grupo]
+        resumen.append({
+            "punto": punto,
+            **{nombre: grupo[0][nombre] for nombre in PARAMETROS_BASE},
+            "corridas": len(grupo),
+            "media_mejor": statistics.mean(mejores),
+            "mediana_mejor": statistics.median(mejores),
+            "tasa_exito": (sum(1 for m in mejores if m >= optimo) / len(mejores)) if optimo is not None else None,
+            "mediana_gen_mejor": statistics.median(fila["gen_mejor"] for fila in grupo),
+            "tiempo_medio_s": statistics.mean(fila["tiempo_s"] for fila in grupo),
+        })
+    return resumen
+
+
+def imprimir_resumen(resumen):
+    print(f"{'punto':>5} {'pobl':>5} {'cxpb':>5} {'mutpb':>5} {'ngen':>5} {'selección':>10} {'torneo':>6} "
+          f"{'runs':>5} {'media':>7} {'mediana':>7} {'éxito':>6} {'gen':>5} {'t(s)':>6}")
+    for fila in resumen:
+        exito = f"{fila['tasa_exito']:.0%}" if fila["tasa_exito"] is not None else "-"
+        print(f"{fila['punto']:>5} {fila['tam_poblacion']:>5} {fila['prob_cruce']:>5} {fila['prob_mutacion']:>5} "
+              f"{fila['num_generaciones']:>5} {fila['seleccion']:>10} {fila['tam_torneo']:>6} {fila['corridas']:>5} "
+              f"{fila['media_mejor']:>7.2f} {fila['mediana_mejor']:>7.1f} {exito:>6} "
+              f"{fila['mediana_gen_mejor']:>5} {fila['tiempo_medio_s']:>6.2f}")
+
+
+def _argumentos():
+    from criterios_parada import agregar_argumentos as agregar_argumentos_parada
+
+    parser = argparse.ArgumentParser(description="Barrido de parámetros del AG en paralelo.")
+    parser.add_argument("--poblacion", type=int, nargs="+", default=[PARAMETROS_BASE["tam_poblacion"]])
+    parser.add_argument("--cruce", type=float, nargs="+", default=[PARAMETROS_BASE["prob_cruce"]])
+    parser.add_argument("--mutacion", type=float, nargs="+", default=[PARAMETROS_BASE["prob_mutacion"]])
+    parser.add_argument("--generaciones", type=int, nargs="+", default=[PARAMETROS_BASE["num_generaciones"]])
+    parser.add_argument("--seleccion", choices=["torneo", "ruleta"], nargs="+", default=[PARAMETROS_BASE["seleccion"]])
+    parser.add_argument("--torneo", type=int, nargs="+", default=[PARAMETROS_BASE["tam_torneo"]])
+    parser.add_argument("--aleatorio", type=int, default=None,
+                        help="en lugar de la grilla completa, sortear esta cantidad de puntos")
+    parser.add_argument("--semillas", type=int, default=10, help="corridas por punto")
+    parser.add_argument("--semilla-base", type=int, default=0)
+    parser.add_argument("--procesos", type=int, default=None, help="por defecto, uno por núcleo")
+    parser.add_argument("--salida", default="resultados_barrido.csv")
+    parser.add_argument("--metricas-puerto", type=int, default=None,
+                        help="servir métricas en vivo (formato Prometheus) en http://127.0.0.1:PUERTO/metrics")
+    parser.add_argument("--almacen", nargs="?", const="resultados_ag", default=None, metavar="DIRECTORIO",
+                        help="reutilizar (y guardar) los resultados de corridas ya hechas")
+    agregar_argumentos_parada(parser)
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    argumentos = _argumentos()
+    espacio = {
+        "tam_poblacion": argumentos.poblacion,
+        "prob_cruce": argumentos.cruce,
+        "prob_mutacion": argumentos.mutacion,
+        "num_generaciones": argumentos.generaciones,
+        "seleccion": argumentos.seleccion,
+        "tam_torneo": argumentos.torneo,
+    }
+    if argumentos.aleatorio:
+        configuraciones = muestra_aleatoria(espacio, argumentos.aleatorio, argumentos.semilla_base)
+    else:
+        configuraciones = grilla(**espacio)
+    trabajos = generar_trabajos(configuraciones, argumentos.semillas, argumentos.semilla_base)
+    from criterios_parada import opciones_desde_argumentos
+    opciones_parada = opciones_desde_argumentos(argumentos, "nueva")
+    if opciones_parada:
+        for trabajo in trabajos:
+            trabajo["parada"] = opciones_parada
+    if argumentos.almacen:
+        for trabajo in trabajos:
+            trabajo["almacen"] = argumentos.almacen
+
+    procesos = argumentos.procesos or os.cpu_count()
+    print(f"Barrido: {len(configuraciones)} puntos x {argumentos.semillas} semillas = {len(trabajos)} corridas "
+          f"en {procesos} procesos...")
+    metricas = servidor = None
+    if argumentos.metricas_puerto is not None:
+        from metricas_http import ServidorMetricas, TablaMetricas
+        metricas = TablaMetricas(procesos)
+        metricas.corridas_planeadas = len(trabajos)
+        servidor = ServidorMetricas(metricas, argumentos.metricas_puerto)
+        print(f"Métricas en {servidor.url}")
+    inicio = time.perf_counter()
+    try:
+        filas = ejecutar_barrido(trabajos, procesos, metricas)
+    finally:
+        if servidor is not None:
+            servidor.cerrar()
+    print(f"Listo en {time.perf_counter() - inicio:.1f} s "
+          f"({sum(fila['evaluaciones'] for fila in filas)} evaluaciones, "
+          f"{sum(fila['gen_final'] for fila in filas)} generaciones, "
+          f"{sum(fila['reutilizada'] for fila in filas)} corridas reutilizadas del almacén)")
+
+    guardar_resultados_csv(filas, argumentos.salida)
+    print(f"Resultados por corrida en {argumentos.salida}\n")
+
+    # El óptimo exacto sale de la tabla exhaustiva (ver tabla_aptitud.py)
+    from tabla_aptitud import obtener_tabla, optimo_global
+    optimo, _ = optimo_global(obtener_tabla("nueva"))
+    imprimir_resumen(resumir(filas, optimo))
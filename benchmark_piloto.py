@@ -0,0 +1,211 @@
+# --- Benchmarks de Rendimiento ---
+# Mide tres cosas y las guarda en un archivo JSON para poder comparar entre commits:
+#   1. Evaluaciones por segundo de cada función de aptitud (y sus variantes rápidas).
+#   2. Generaciones por segundo del AG completo (ejecutar_ag) para distintos tamaños de población.
+#   3. Tasa de éxito y mediana de generaciones hasta alcanzar el óptimo global exacto,
+#      sobre muchas semillas (el óptimo sale de la tabla exhaustiva, ver tabla_aptitud.py).
+#
+# Uso:
+#   python benchmark_piloto.py                                   -> benchmark_resultados.json
+#   python benchmark_piloto.py --poblaciones 100 10000 1000000 --generaciones 3
+#   python benchmark_piloto.py --comparar benchmark_anterior.json -> muestra la variación
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+
+import numpy
+
+from config_piloto import LONGITUD_CROMOSOMA, evaluar_aptitud_piloto, evaluar_aptitud_piloto_nueva
+
+
+def _commit_actual():
+    """
+    Devuelve el hash corto del commit actual, o None si no se puede obtener.
+    """
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        return salida.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _mejor_tiempo(funcion, repeticiones):
+    """
+    Ejecuta la función varias veces y devuelve el menor tiempo (en segundos).
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+# --- 1. Evaluaciones por segundo ---
+def variantes_evaluacion():
+    """
+    Devuelve las variantes de evaluación a medir como {nombre: (tipo, funcion)}.
+    El tipo indica cómo se le pasan los individuos: "lista" (uno por uno, lista de
+    bits), "compacto" (uno por uno, IndividuoCompacto) o "lote" (todos juntos,
+    arreglo de enteros empaquetados). Como se toma el mejor de varias repeticiones,
+    "nueva_cache" mide el caso con la cache ya cargada, como en un AG convergido.
+    """
+    from tabla_aptitud import obtener_tabla, crear_evaluador_tabla
+    from reglas_piloto import obtener_motor
+    from cromosoma_compacto import crear_evaluador_compacto
+    from cache_aptitud import CacheAptitud
+
+    tabla = obtener_tabla("nueva")
+    return {
+        "original": ("lista", evaluar_aptitud_piloto),
+        "nueva": ("lista", evaluar_aptitud_piloto_nueva),
+        "nueva_cache": ("lista", CacheAptitud(evaluar_aptitud_piloto_nueva)),
+        "nueva_tabla": ("lista", crear_evaluador_tabla(tabla)),
+        "nueva_compacto_tabla": ("compacto", crear_evaluador_compacto(tabla)),
+        "nueva_reglas_lote": ("lote", obtener_motor("nueva").puntuar_enteros),
+    }
+
+
+def medir_evaluaciones(num_cromosomas=20_000, repeticiones=3, semilla=0):
+    """
+    Devuelve {variante: evaluaciones por segundo} sobre los mismos cromosomas al azar.
+    """
+    from config_piloto import desempaquetar_cromosoma
+    from cromosoma_compacto import IndividuoCompacto
+
+    generador = random.Random(semilla)
+    enteros = [generador.getrandbits(LONGITUD_CROMOSOMA) for _ in range(num_cromosomas)]
+    listas = [desempaquetar_cromosoma(entero) for entero in enteros]
+    compactos = [IndividuoCompacto(entero) for entero in enteros]
+    arreglo = numpy.array(enteros, dtype=numpy.uint16)
+
+    resultados = {}
+    for nombre, (tipo, funcion) in variantes_evaluacion().items():
+        if tipo == "lote":
+            tiempo = _mejor_tiempo(lambda: funcion(arreglo), repeticiones)
+        else:
+            individuos = listas if tipo == "lista" else compactos
+            tiempo = _mejor_tiempo(lambda: [funcion(ind) for ind in individuos], repeticiones)
+        resultados[nombre] = num_cromosomas / tiempo
+    return resultados
+
+
+# --- 2. Generaciones por segundo ---
+def medir_generaciones(poblaciones=(100, 1_000, 10_000), generaciones=10, semilla=0):
+    """
+    Devuelve {tam_poblacion: generaciones por segundo} del AG completo.
+    """
+    import piloto_ideal_ag
+
+    resultados = {}
+    for tam_poblacion in poblaciones:
+        inicio = time.perf_counter()
+        piloto_ideal_ag.ejecutar_ag(tam_poblacion=tam_poblacion, num_generaciones=generaciones,
+                                    semilla=semilla, verbose=False, contexto=piloto_ideal_ag.crear_contexto())
+        resultados[str(tam_poblacion)] = generaciones / (time.perf_counter() - inicio)
+    return resultados
+
+
+# --- 3. Tiempo hasta el óptimo ---
+def medir_convergencia(num_semillas=50, procesos=None, **parametros):
+    """
+    Ejecuta el AG con muchas semillas (en paralelo, ver barrido_parametros.py) y
+    devuelve la tasa de éxito y la mediana de generaciones hasta el óptimo exacto.
+    """
+    from barrido_parametros import PARAMETROS_BASE, generar_trabajos, ejecutar_barrido
+    from tabla_aptitud import obtener_tabla, optimo_global
+
+    optimo, _ = optimo_global(obtener_tabla("nueva"))
+    configuracion = dict(PARAMETROS_BASE, **parametros)
+    inicio = time.perf_counter()
+    filas = ejecutar_barrido(generar_trabajos([configuracion], num_semillas), procesos)
+    tiempo = time.perf_counter() - inicio
+
+    exitosas = [fila for fila in filas if fila["mejor_aptitud"] >= optimo]
+    return {
+        "parametros": configuracion,
+        "optimo": optimo,
+        "corridas": len(filas),
+        "tasa_exito": len(exitosas) / len(filas),
+        "mediana_gen_optimo": statistics.median(fila["gen_mejor"] for fila in exitosas) if exitosas else None,
+        "mediana_evaluaciones_reales_optimo": (statistics.median(fila["evaluaciones_reales"] for fila in exitosas)
+                                               if exitosas and exitosas[0]["evaluaciones_reales"] != "" else None),
+        "tiempo_total_s": tiempo,
+    }
+
+
+# --- Guardado y comparación ---
+def guardar_json(resultados, ruta):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+
+
+def comparar(anterior, actual):
+    """
+    Imprime la variación de cada métrica de rendimiento entre dos resultados.
+    """
+    for seccion in ("evaluaciones_por_segundo", "generaciones_por_segundo"):
+        for clave, valor in actual.get(seccion, {}).items():
+            previo = anterior.get(seccion, {}).get(clave)
+            if previo:
+                print(f"  {seccion}[{clave}]: {previo:,.0f} -> {valor:,.0f} ({valor / previo - 1:+.1%})")
+    previa, nueva = anterior.get("convergencia"), actual.get("convergencia")
+    if previa and nueva:
+        print(f"  tasa_exito: {previa['tasa_exito']:.0%} -> {nueva['tasa_exito']:.0%}, "
+              f"mediana_gen_optimo: {previa['mediana_gen_optimo']} -> {nueva['mediana_gen_optimo']}")
+
+
+def _argumentos():
+    parser = argparse.ArgumentParser(description="Benchmarks de evaluación y del AG.")
+    parser.add_argument("--cromosomas", type=int, default=20_000, help="cromosomas para medir evaluaciones/s")
+    parser.add_argument("--poblaciones", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--generaciones", type=int, default=10, help="generaciones para medir generaciones/s")
+    parser.add_argument("--semillas", type=int, default=50, help="corridas para la tasa de éxito")
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--salida", default="benchmark_resultados.json")
+    parser.add_argument("--comparar", default=None, help="JSON de un benchmark anterior")
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    argumentos = _argumentos()
+    resultados = {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _commit_actual(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "cpu": platform.processor() or platform.machine(),
+        "nucleos": os.cpu_count(),
+    }
+
+    print("Evaluaciones por segundo:")
+    resultados["evaluaciones_por_segundo"] = medir_evaluaciones(argumentos.cromosomas)
+    for nombre, valor in resultados["evaluaciones_por_segundo"].items():
+        print(f"  {nombre:<22} {valor:>14,.0f}")
+
+    print("Generaciones por segundo (ejecutar_ag):")
+    resultados["generaciones_por_segundo"] = medir_generaciones(argumentos.poblaciones, argumentos.generaciones)
+    for tam_poblacion, valor in resultados["generaciones_por_segundo"].items():
+        print(f"  población {tam_poblacion:>9}: {valor:>10.2f}")
+
+    print(f"Convergencia al óptimo ({argumentos.semillas} semillas):")
+    resultados["convergencia"] = medir_convergencia(argumentos.semillas, argumentos.procesos)
+    convergencia = resultados["convergencia"]
+    print(f"  óptimo {convergencia['optimo']}: éxito {convergencia['tasa_exito']:.0%}, "
+          f"mediana de generaciones {convergencia['mediana_gen_optimo']}")
+
+    guardar_json(resultados, argumentos.salida)
+    print(f"\nResultados guardados en {argumentos.salida}")
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as archivo:
+            print(f"Comparación con {argumentos.comparar}:")
+            comparar(json.load(archivo), resultados)
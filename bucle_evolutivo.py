@@ -0,0 +1,243 @@
+# --- Bucle Evolutivo Propio ---
+# Reimplementación de algorithms.eaSimple (y de algorithms.varAnd) de DEAP, con los
+# mismos pasos y en el mismo orden, así que con la misma semilla da exactamente el
+# mismo resultado. La diferencia es que acá podemos medir cuánto tarda cada fase
+# de una generación:
+#   seleccion    -> toolbox.select (el torneo)
+#   variacion    -> copia de los hijos + toolbox.mate + toolbox.mutate
+#   evaluacion   -> toolbox.evaluate de los individuos con aptitud inválida
+#   salon_fama   -> halloffame.update
+#   estadisticas -> stats.compile
+#
+# Con medir_tiempos=True se agregan al logbook, por generación, las columnas
+# t_<fase> (segundos), t_generacion, cruces y mutaciones. Con medir_tiempos=False
+# el logbook queda igual que el de eaSimple y el reloj no se consulta.
+#
+# Con un sumidero (ver registro_corrida.py) cada generación además se escribe en
+# disco apenas se calcula, y con conservar_logbook=False el logbook en memoria solo
+# guarda la última generación, así la memoria no crece con la cantidad de generaciones.
+#
+# Con un punto_control (ver punto_control.py) se guarda periódicamente el estado de la
+# corrida, y con reanudar_desde=(gen, logbook) se sigue desde la generación gen + 1 con
+# la población y el salón de la fama recibidos (el estado de random ya restaurado).
+#
+# Con una busqueda_local (ver busqueda_local.py, modo memético) después de evaluar cada
+# generación se mejora la élite con búsqueda local, antes de actualizar el salón de la
+# fama; su tiempo cuenta como evaluación y el logbook suma las columnas evals_locales y
+# mejoras_locales.
+#
+# Con medir_diversidad=True el logbook suma las métricas de diversidad de la población
+# (unicos, hamming, entropia y la entropía de cada atributo, ver diversidad.py), que
+# cuentan como tiempo de estadísticas. Con deduplicar="compartir", "nuevos" o "mutar"
+# los genotipos repetidos se detectan antes de evaluar (ver diversidad.py) y la columna
+# repetidos dice cuántas copias había en la generación (con "compartir", cuántas copias
+# había entre los individuos con aptitud inválida, que son las que se dejan de evaluar).
+#
+# Con una cache_aptitud (ver cache_aptitud.py) el logbook suma las columnas aciertos y
+# fallos de la cache en cada generación.
+#
+# Con un criterio de parada (ver criterios_parada.py) la corrida termina antes de ngen
+# cuando se cumple alguno de sus criterios, y la columna parada de la última generación
+# dice por qué terminó.
+
+import json
+import random
+import time
+
+from deap import tools
+
+from cache_aptitud import COLUMNAS_CACHE
+
+FASES = ("seleccion", "variacion", "evaluacion", "salon_fama", "estadisticas")
+COLUMNAS_TIEMPOS = [f"t_{fase}" for fase in FASES] + ["t_generacion", "cruces", "mutaciones"]
+COLUMNAS_BUSQUEDA_LOCAL = ["evals_locales", "mejoras_locales"]
+COLUMNA_REPETIDOS = "repetidos"
+COLUMNA_PARADA = "parada"
+
+
+def variar(descendencia, toolbox, cxpb, mutpb):
+    """
+    Igual que algorithms.varAnd: copia los individuos, los cruza de a pares con
+    probabilidad cxpb y muta cada uno con probabilidad mutpb. Devuelve
+    (hijos, cantidad_de_cruces, cantidad_de_mutaciones).
+    """
+    hijos = [toolbox.clone(ind) for ind in descendencia]
+    cruces = mutaciones = 0
+
+    for i in range(1, len(hijos), 2):
+        if random.random() < cxpb:
+            hijos[i - 1], hijos[i] = toolbox.mate(hijos[i - 1], hijos[i])
+            del hijos[i - 1].fitness.values, hijos[i].fitness.values
+            cruces += 1
+
+    for i in range(len(hijos)):
+        if random.random() < mutpb:
+            hijos[i], = toolbox.mutate(hijos[i])
+            del hijos[i].fitness.values
+            mutaciones += 1
+
+    return hijos, cruces, mutaciones
+
+
+def evaluar_invalidos(individuos, toolbox):
+    """
+    Evalúa los individuos con aptitud inválida y devuelve cuántos fueron.
+    """
+    invalidos = [ind for ind in individuos if not ind.fitness.valid]
+    for ind, aptitud in zip(invalidos, toolbox.map(toolbox.evaluate, invalidos)):
+        ind.fitness.values = aptitud
+    return len(invalidos)
+
+
+def ea_simple(poblacion, toolbox, cxpb, mutpb, ngen, stats=None, halloffame=None, verbose=False,
+              medir_tiempos=False, sumidero=None, conservar_logbook=True, punto_control=None,
+              reanudar_desde=None, busqueda_local=None, medir_diversidad=False, deduplicar=None,
+              parada=None, cache_aptitud=None):
+    """
+    Mismo algoritmo que algorithms.eaSimple. Devuelve (poblacion, logbook).
+    """
+    if medir_diversidad or deduplicar is not None:
+        import diversidad
+        if deduplicar is not None and deduplicar not in diversidad.MODOS_DEDUPLICACION:
+            raise ValueError(f"Modo de deduplicación desconocido: {deduplicar} "
+                             f"(usar {', '.join(diversidad.MODOS_DEDUPLICACION)}).")
+    reloj = time.perf_counter
+    logbook = tools.Logbook()
+    logbook.header = (["gen", "nevals"] + (stats.fields if stats else []) +
+                      (COLUMNAS_CACHE if cache_aptitud is not None else []) +
+                      (COLUMNAS_BUSQUEDA_LOCAL if busqueda_local is not None else []) +
+                      (diversidad.COLUMNAS_DIVERSIDAD if medir_diversidad else []) +
+                      ([COLUMNA_REPETIDOS] if deduplicar is not None else []) +
+                      ([COLUMNA_PARADA] if parada is not None else []) +
+                      (COLUMNAS_TIEMPOS if medir_tiempos else []))
+
+    def evaluar(individuos):
+        """
+        Evalúa los individuos inválidos según el modo de deduplicación y devuelve
+        (evaluaciones, copias_repetidas).
+        """
+        if deduplicar is None:
+            return evaluar_invalidos(individuos, toolbox), 0
+        if deduplicar == "compartir":
+            invalidos = [ind for ind in individuos if not ind.fitness.valid]
+            repetidas = int(diversidad.repetidos(diversidad.genotipos_poblacion(invalidos)).sum())
+            return diversidad.evaluar_sin_repetir(individuos, toolbox), repetidas
+        repetidas = diversidad.reemplazar_repetidos(individuos, toolbox, deduplicar)
+        return evaluar_invalidos(individuos, toolbox), repetidas
+
+    def registrar(gen, nevals, tiempos, cruces, mutaciones, repetidas):
+        """
+        Registra la generación y devuelve el motivo para parar (None si sigue).
+        """
+        inicio = reloj() if medir_tiempos else None
+        registro = stats.compile(poblacion) if stats else {}
+        if cache_aptitud is not None:
+            registro.update(cache_aptitud.columnas_generacion())
+        if busqueda_local is not None:
+            registro.update(busqueda_local.columnas_generacion())
+        if medir_diversidad:
+            registro.update(diversidad.metricas_diversidad(diversidad.genotipos_poblacion(poblacion)))
+        if deduplicar is not None:
+            registro[COLUMNA_REPETIDOS] = repetidas
+        motivo = None
+        if parada is not None:
+            motivo = parada(gen, nevals + registro.get("evals_locales", 0), poblacion, halloffame)
+            registro[COLUMNA_PARADA] = motivo or ("generaciones" if gen >= ngen else "")
+        if medir_tiempos:
+            tiempos["estadisticas"] = reloj() - inicio
+            registro.update({f"t_{fase}": tiempos.get(fase, 0.0) for fase in FASES})
+            registro.update(t_generacion=sum(tiempos.values()), cruces=cruces, mutaciones=mutaciones)
+        if not conservar_logbook and len(logbook):
+            # Solo se conserva la última generación; el encabezado ya se imprimió
+            logbook.pop()
+            logbook.log_header = False
+        logbook.record(gen=gen, nevals=nevals, **registro)
+        if sumidero is not None:
+            sumidero.escribir(logbook[-1], halloffame)
+        if verbose:
+            print(logbook.stream)
+        if punto_control is not None:
+            punto_control.guardar_si_corresponde(gen, poblacion, halloffame, logbook, toolbox, busqueda_local)
+        return motivo
+
+    if parada is not None:
+        parada.iniciar()
+
+    if reanudar_desde is None:
+        # Generación 0: evaluar la población inicial
+        t0 = reloj() if medir_tiempos else None
+        nevals, repetidas = evaluar(poblacion)
+        if busqueda_local is not None:
+            busqueda_local(poblacion)
+        t1 = reloj() if medir_tiempos else None
+        if halloffame is not None:
+            halloffame.update(poblacion)
+        tiempos = None
+        if medir_tiempos:
+            t2 = reloj()
+            tiempos = {"evaluacion": t1 - t0, "salon_fama": t2 - t1}
+        motivo = registrar(0, nevals, tiempos, 0, 0, repetidas)
+        gen_inicial = ngen + 1 if motivo else 1
+    else:
+        # Las generaciones ya registradas no se vuelven a imprimir
+        gen_anterior, logbook = reanudar_desde
+        logbook.buffindex = len(logbook)
+        gen_inicial = gen_anterior + 1
+
+    for gen in range(gen_inicial, ngen + 1):
+        t0 = reloj() if medir_tiempos else None
+        descendencia = toolbox.select(poblacion, len(poblacion))
+        t1 = reloj() if medir_tiempos else None
+        descendencia, cruces, mutaciones = variar(descendencia, toolbox, cxpb, mutpb)
+        t2 = reloj() if medir_tiempos else None
+        nevals, repetidas = evaluar(descendencia)
+        if busqueda_local is not None:
+            busqueda_local(descendencia)
+        t3 = reloj() if medir_tiempos else None
+        if halloffame is not None:
+            halloffame.update(descendencia)
+        tiempos = None
+        if medir_tiempos:
+            t4 = reloj()
+            tiempos = {"seleccion": t1 - t0, "variacion": t2 - t1, "evaluacion": t3 - t2, "salon_fama": t4 - t3}
+        poblacion[:] = descendencia
+        if registrar(gen, nevals, tiempos, cruces, mutaciones, repetidas):
+            break
+
+    return poblacion, logbook
+
+
+def resumen_tiempos(registros):
+    """
+    Suma los tiempos de cada fase en toda la corrida y devuelve
+    {fase: {"segundos": ..., "porcentaje": ...}} más los totales de cruces y mutaciones.
+    Acepta un logbook o cualquier iterable de registros (por ejemplo leer_registro(ruta)).
+    """
+    totales = {fase: 0.0 for fase in FASES}
+    evaluaciones = cruces = mutaciones = 0
+    for registro in registros:
+        for fase in FASES:
+            totales[fase] += registro.get(f"t_{fase}", 0.0)
+        evaluaciones += registro.get("nevals", 0)
+        cruces += registro.get("cruces", 0)
+        mutaciones += registro.get("mutaciones", 0)
+
+    total = sum(totales.values())
+    resumen = {fase: {"segundos": segundos, "porcentaje": 100 * segundos / (total or 1.0)}
+               for fase, segundos in totales.items()}
+    resumen.update(total_segundos=total, evaluaciones=evaluaciones, cruces=cruces, mutaciones=mutaciones)
+    return resumen
+
+
+def exportar_tiempos_json(logbook, ruta):
+    """
+    Guarda en JSON los tiempos por generación y el resumen de toda la corrida.
+    """
+    columnas = ["gen", "nevals"] + COLUMNAS_TIEMPOS
+    datos = {
+        "generaciones": [{columna: registro[columna] for columna in columnas if columna in registro}
+                         for registro in logbook],
+        "resumen": resumen_tiempos(logbook),
+    }
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, indent=2)
@@ -0,0 +1,215 @@
+# --- Búsqueda Local sobre la Élite (Modo Memético) ---
+# El AG solo refina las soluciones con cxTwoPoint y mutFlipBit, así que puede pasar
+# muchas generaciones dando vueltas cerca de un óptimo local. En modo memético, después
+# de evaluar cada generación, los mejores individuos (una fracción de la población)
+# hacen búsqueda local por ascenso:
+#   * vecindario "bit":   los 16 cromosomas que difieren en un solo bit
+#   * vecindario "campo": los 24 que cambian un atributo (campo de 2 bits) a otro de sus valores
+#   * estrategia "maximo":  en cada paso se mueve al mejor vecino (si mejora)
+#   * estrategia "primera": recorre los atributos en orden al azar y se mueve al primer
+#                           vecino que mejora
+# Se repite hasta que ningún vecino mejora (o hasta max_pasos). Los vecinos de toda la
+# élite se evalúan juntos con una función por lotes (un arreglo de cromosomas
+# empaquetados -> arreglo de aptitudes, por ejemplo crear_evaluador_lote de
+# motor_vectorizado.py). Las mejoras se escriben en los individuos, así ea_simple las
+# pasa al salón de la fama.
+#
+# Cuando la población converge la élite repite los mismos genotipos generación tras
+# generación: cada genotipo distinto de la élite se busca una sola vez por generación y
+# los que ya se sabe que son óptimos locales del vecindario (ningún vecino mejora) se
+# recuerdan durante toda la corrida y no se vuelven a revisar. Como ese recuerdo cambia
+# lo que hace la búsqueda (con "primera", cuántas veces se baraja el orden de los
+# atributos), los puntos de control guardan los óptimos conocidos y los contadores
+# (exportar_estado / restaurar_estado) para que una corrida reanudada siga igual.
+#
+# Uso:
+#   ejecutar_ag(busqueda_local=BusquedaLocal(crear_evaluador_lote("nueva")))
+#   python piloto_ideal_ag.py --memetico 0.1 --vecindario campo --estrategia maximo
+
+import math
+import random
+
+import numpy
+
+from config_piloto import ORDEN_ATRIBUTOS, LONGITUD_CROMOSOMA, empaquetar_cromosoma, desempaquetar_cromosoma
+
+VECINDARIOS = ("bit", "campo")
+ESTRATEGIAS = ("maximo", "primera")
+
+
+def mascaras_vecindario(vecindario):
+    """
+    Lista con, por atributo, las máscaras XOR que llevan un cromosoma a sus vecinos
+    que difieren en ese atributo.
+    """
+    if vecindario not in VECINDARIOS:
+        raise ValueError(f"Vecindario desconocido: {vecindario} (usar {' o '.join(VECINDARIOS)}).")
+    grupos = []
+    for _, inicio_bit, num_bits in ORDEN_ATRIBUTOS:
+        desplazamiento = LONGITUD_CROMOSOMA - inicio_bit - num_bits
+        if vecindario == "bit":
+            grupos.append([1 << (desplazamiento + bit) for bit in reversed(range(num_bits))])
+        else:
+            grupos.append([valor << desplazamiento for valor in range(1, 1 << num_bits)])
+    return grupos
+
+
+class BusquedaLocal:
+    """
+    Paso memético para ea_simple (bucle_evolutivo.py): búsqueda local por ascenso
+    sobre la fracción de mejores individuos de la población, con los vecinos
+    evaluados por lotes con evaluar_lote.
+    """
+
+    def __init__(self, evaluar_lote, vecindario="campo", estrategia="maximo", fraccion=0.1, max_pasos=None):
+        if estrategia not in ESTRATEGIAS:
+            raise ValueError(f"Estrategia desconocida: {estrategia} (usar {' o '.join(ESTRATEGIAS)}).")
+        self.evaluar_lote = evaluar_lote
+        self.vecindario = vecindario
+        self.estrategia = estrategia
+        self.fraccion = fraccion
+        self.max_pasos = max_pasos
+        self._grupos = [numpy.array(grupo, dtype=numpy.uint16) for grupo in mascaras_vecindario(vecindario)]
+        self._todas = numpy.concatenate(self._grupos)
+        # Genotipos que ya se sabe que son óptimos locales con este vecindario
+        self._optimos = numpy.zeros(1 << LONGITUD_CROMOSOMA, dtype=bool)
+        # Contadores totales de la corrida
+        self.evaluaciones = 0
+        self.mejoras = 0
+        # Valores de los contadores en el último registro del logbook
+        self._evaluaciones_registradas = 0
+        self._mejoras_registradas = 0
+
+    def configuracion(self):
+        """
+        Opciones de la búsqueda (las que tienen que coincidir para reanudar una corrida).
+        """
+        return {"vecindario": self.vecindario, "estrategia": self.estrategia, "fraccion": self.fraccion,
+                "max_pasos": self.max_pasos}
+
+    def __repr__(self):
+        return (f"BusquedaLocal(vecindario={self.vecindario!r}, estrategia={self.estrategia!r}, "
+                f"fraccion={self.fraccion}, max_pasos={self.max_pasos})")
+
+    def __call__(self, poblacion):
+        """
+        Mejora en el lugar la élite de la población (ya evaluada) y devuelve cuántos
+        vecinos se evaluaron.
+        """
+        if not poblacion or self.fraccion <= 0:
+            return 0
+        cantidad = min(len(poblacion), max(1, math.ceil(self.fraccion * len(poblacion))))
+        elite = sorted(poblacion, key=lambda ind: ind.fitness.wvalues, reverse=True)[:cantidad]
+        iniciales = numpy.array([ind.genotipo if hasattr(ind, "genotipo") else empaquetar_cromosoma(ind)
+                                 for ind in elite], dtype=numpy.uint16)
+        # Un mismo genotipo tiene la misma aptitud: se busca una vez por genotipo distinto
+        genotipos, primeros, inversa = numpy.unique(iniciales, return_index=True, return_inverse=True)
+        aptitudes = numpy.array([elite[i].fitness.values[0] for i in primeros.tolist()], dtype=numpy.float64)
+        evaluaciones_previas = self.evaluaciones
+
+        activos = numpy.flatnonzero(~self._optimos[genotipos])
+        pasos = 0
+        while len(activos) and (self.max_pasos is None or pasos < self.max_pasos):
+            if self.estrategia == "maximo":
+                mejorados = self._paso_maximo(genotipos, aptitudes, activos)
+            else:
+                mejorados = self._paso_primera(genotipos, aptitudes, activos)
+            # Los que no mejoraron probaron todo su vecindario: son óptimos locales
+            self._optimos[genotipos[activos[~mejorados]]] = True
+            activos = activos[mejorados]
+            pasos += 1
+
+        for ind, genotipo, inicial, aptitud in zip(elite, genotipos[inversa].tolist(), iniciales.tolist(),
+                                                   aptitudes[inversa].tolist()):
+            if genotipo != inicial:
+                if hasattr(ind, "genotipo"):
+                    ind.genotipo = genotipo
+                else:
+                    ind[:] = desempaquetar_cromosoma(genotipo)
+                ind.fitness.values = (aptitud,)
+                self.mejoras += 1
+        return self.evaluaciones - evaluaciones_previas
+
+    def _evaluar(self, vecinos):
+        self.evaluaciones += vecinos.size
+        return numpy.asarray(self.evaluar_lote(vecinos.ravel()), dtype=numpy.float64).reshape(vecinos.shape)
+
+    def _paso_maximo(self, genotipos, aptitudes, activos):
+        """
+        Mueve cada individuo activo a su mejor vecino si mejora. Devuelve la máscara
+        (sobre activos) de los que se movieron.
+        """
+        vecinos = genotipos[activos, None] ^ self._todas
+        puntajes = self._evaluar(vecinos)
+        mejor = puntajes.argmax(axis=1)
+        filas = numpy.arange(len(activos))
+        mejorados = puntajes[filas, mejor] > aptitudes[activos]
+        genotipos[activos[mejorados]] = vecinos[filas[mejorados], mejor[mejorados]]
+        aptitudes[activos[mejorados]] = puntajes[filas[mejorados], mejor[mejorados]]
+        return mejorados
+
+    def _paso_primera(self, genotipos, aptitudes, activos):
+        """
+        Recorre los atributos en orden al azar; cada individuo se mueve al primer vecino
+        que lo mejora y deja de evaluar. Devuelve la máscara de los que se movieron.
+        """
+        mejorados = numpy.zeros(len(activos), dtype=bool)
+        orden = list(range(len(self._grupos)))
+        random.shuffle(orden)
+        for indice_grupo in orden:
+            pendientes = numpy.flatnonzero(~mejorados)
+            if not len(pendientes):
+                break
+            indices = activos[pendientes]
+            vecinos = genotipos[indices, None] ^ self._grupos[indice_grupo]
+            puntajes = self._evaluar(vecinos)
+            mejora = puntajes > aptitudes[indices, None]
+            encontrados = mejora.any(axis=1)
+            primero = mejora.argmax(axis=1)
+            filas = numpy.flatnonzero(encontrados)
+            genotipos[indices[filas]] = vecinos[filas, primero[filas]]
+            aptitudes[indices[filas]] = puntajes[filas, primero[filas]]
+            mejorados[pendientes[filas]] = True
+        return mejorados
+
+    # --- Reporte por generación ---
+    def columnas_generacion(self):
+        """
+        Vecinos evaluados e individuos mejorados desde la llamada anterior (ea_simple
+        las agrega al logbook como "evals_locales" y "mejoras_locales").
+        """
+        columnas = {"evals_locales": self.evaluaciones - self._evaluaciones_registradas,
+                    "mejoras_locales": self.mejoras - self._mejoras_registradas}
+        self._evaluaciones_registradas = self.evaluaciones
+        self._mejoras_registradas = self.mejoras
+        return columnas
+
+    # --- Estado para puntos de control ---
+    def exportar_estado(self):
+        """
+        Devuelve la configuración, los contadores y los óptimos locales conocidos
+        (arreglo uint16 de genotipos).
+        """
+        return {
+            "configuracion": self.configuracion(),
+            "optimos": numpy.flatnonzero(self._optimos).astype(numpy.uint16),
+            "evaluaciones": self.evaluaciones,
+            "mejoras": self.mejoras,
+            "evaluaciones_registradas": self._evaluaciones_registradas,
+            "mejoras_registradas": self._mejoras_registradas,
+        }
+
+    def restaurar_estado(self, estado):
+        """
+        Deja la búsqueda como estaba al llamar a exportar_estado(). La configuración
+        tiene que ser la misma.
+        """
+        if estado["configuracion"] != self.configuracion():
+            raise ValueError(f"La búsqueda local se guardó con {estado['configuracion']} y ahora es "
+                             f"{self.configuracion()}.")
+        self._optimos[:] = False
+        self._optimos[numpy.asarray(estado["optimos"], dtype=numpy.intp)] = True
+        self.evaluaciones = estado["evaluaciones"]
+        self.mejoras = estado["mejoras"]
+        self._evaluaciones_registradas = estado["evaluaciones_registradas"]
+        self._mejoras_registradas = estado["mejoras_registradas"]
@@ -0,0 +1,190 @@
+# --- Cache de Aptitud ---
+# algorithms.eaSimple llama a toolbox.evaluate por cada hijo con aptitud inválida.
+# Con 16 bits y selección fuerte (tournsize=40) la población converge rápido a pocos
+# genotipos, así que la mayoría de esas llamadas puntúan perfiles ya vistos.
+#
+# CacheAptitud envuelve cualquier función de evaluación y guarda los resultados por
+# (huella de la función, genotipo), con un tamaño máximo y descarte LRU (se descarta
+# el menos usado recientemente). Además cuenta aciertos y fallos para poder ver en el
+# logbook cuánto trabajo de evaluación hace realmente cada generación.
+#
+# Uso:
+#   cache = CacheAptitud(evaluar_aptitud_piloto_nueva)
+#   toolbox.register("evaluate", cache)
+#   ea_simple(..., cache_aptitud=cache)       -> columnas "aciertos" y "fallos" en el logbook
+
+import functools
+import hashlib
+import importlib
+import inspect
+from collections import OrderedDict
+
+# Módulos con el código de las reglas de aptitud (la decodificación, ATRIBUTOS_CONFIG y
+# las tablas de reglas): su código entra en todas las huellas
+MODULOS_REGLAS = ("config_piloto", "reglas_piloto")
+
+# Columnas que agrega al logbook por generación (ver CacheAptitud.columnas_generacion)
+COLUMNAS_CACHE = ["aciertos", "fallos"]
+
+
+@functools.lru_cache(maxsize=None)
+def huella_modulo(nombre):
+    """
+    Hash corto del código fuente de un módulo ("" si no se puede leer).
+    """
+    try:
+        codigo = inspect.getsource(importlib.import_module(nombre))
+    except (ImportError, OSError, TypeError, ValueError):
+        return ""
+    return hashlib.sha1(codigo.encode()).hexdigest()[:16]
+
+
+def huella_modulos(nombres):
+    """
+    Hash corto del código fuente de varios módulos.
+    """
+    return hashlib.sha1(" ".join(huella_modulo(nombre) for nombre in nombres).encode()).hexdigest()[:16]
+
+
+def huella_funcion(funcion):
+    """
+    Devuelve un hash corto que identifica el código de una función de evaluación
+    (y, si es una clausura o un functools.partial, también los datos que usa).
+    Si se editan las reglas de la función, cambia la huella. También depende de todo
+    el código de su módulo y de MODULOS_REGLAS, así un cambio en una función auxiliar
+    (por ejemplo decodificar_cromosoma) o en ATRIBUTOS_CONFIG también la cambia.
+    """
+    resumen = hashlib.sha1()
+    while True:
+        # functools.partial (toolbox.register los crea): la huella depende de la función
+        # y de sus argumentos fijos, si tiene
+        if hasattr(funcion, "func") and hasattr(funcion, "keywords"):
+            if funcion.args or funcion.keywords:
+                resumen.update(repr((funcion.args, sorted(funcion.keywords.items()))).encode())
+            funcion = funcion.func
+        # Objetos invocables (por ejemplo otra CacheAptitud): usamos su función envuelta
+        elif not inspect.isfunction(funcion) and hasattr(funcion, "funcion"):
+            funcion = funcion.funcion
+        else:
+            break
+
+    modulo = getattr(funcion, "__module__", None) or ""
+    resumen.update(f"{modulo}.{getattr(funcion, '__qualname__', repr(funcion))}".encode())
+    resumen.update(huella_modulos((modulo,) + MODULOS_REGLAS).encode())
+    try:
+        resumen.update(inspect.getsource(funcion).encode())
+    except (OSError, TypeError):
+        codigo = getattr(funcion, "__code__", None)
+        if codigo is not None:
+            resumen.update(codigo.co_code)
+            resumen.update(repr(codigo.co_consts).encode())
+
+    for celda in getattr(funcion, "__closure__", None) or ():
+        contenido = celda.cell_contents
+        if hasattr(contenido, "tobytes"):
+            # Arreglos de NumPy (por ejemplo una tabla de aptitudes)
+            resumen.update(contenido.tobytes())
+        elif inspect.isfunction(contenido):
+            resumen.update(huella_funcion(contenido).encode())
+        else:
+            resumen.update(repr(contenido).encode())
+    return resumen.hexdigest()[:16]
+
+
+def clave_genotipo(individuo):
+    """
+    Clave hashable del genotipo: el entero si el individuo es compacto
+    (ver cromosoma_compacto.py) o la tupla de bits si es una lista.
+    """
+    genotipo = getattr(individuo, "genotipo", None)
+    return genotipo if genotipo is not None else tuple(individuo)
+
+
+class CacheAptitud:
+    """
+    Envoltorio con memoria para una función de evaluación de DEAP.
+    Se registra en la toolbox en lugar de la función original.
+    """
+
+    def __init__(self, funcion_evaluacion, tam_maximo=100_000):
+        self.funcion = funcion_evaluacion
+        self.huella = huella_funcion(funcion_evaluacion)
+        self.tam_maximo = tam_maximo
+        self._entradas = OrderedDict()
+        # Contadores totales de la corrida
+        self.aciertos = 0
+        self.fallos = 0
+        self.descartes = 0
+        # Valores de los contadores en el último registro del logbook
+        self._aciertos_registrados = 0
+        self._fallos_registrados = 0
+
+    def __call__(self, individuo):
+        clave = (self.huella, clave_genotipo(individuo))
+        resultado = self._entradas.get(clave)
+        if resultado is not None:
+            self.aciertos += 1
+            self._entradas.move_to_end(clave)
+            return resultado
+
+        self.fallos += 1
+        resultado = tuple(self.funcion(individuo))
+        self._entradas[clave] = resultado
+        if self.tam_maximo is not None and len(self._entradas) > self.tam_maximo:
+            self._entradas.popitem(last=False)
+            self.descartes += 1
+        return resultado
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def limpiar(self):
+        """
+        Vacía la cache (los contadores se mantienen).
+        """
+        self._entradas.clear()
+
+    def tasa_aciertos(self):
+        """
+        Fracción de llamadas que se resolvieron sin evaluar (0 si no hubo llamadas).
+        """
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+    # --- Estado para puntos de control (ver punto_control.py) ---
+    def exportar_estado(self):
+        """
+        Devuelve el contenido de la cache, como pares (genotipo, aptitud) del menos al
+        más usado recientemente, y sus contadores.
+        """
+        return {
+            "entradas": [(clave[1], valor) for clave, valor in self._entradas.items()],
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "descartes": self.descartes,
+            "aciertos_registrados": self._aciertos_registrados,
+            "fallos_registrados": self._fallos_registrados,
+        }
+
+    def restaurar_estado(self, estado):
+        """
+        Deja la cache como estaba al llamar a exportar_estado().
+        """
+        self._entradas = OrderedDict(((self.huella, genotipo), tuple(valor)) for genotipo, valor in estado["entradas"])
+        self.aciertos = estado["aciertos"]
+        self.fallos = estado["fallos"]
+        self.descartes = estado["descartes"]
+        self._aciertos_registrados = estado["aciertos_registrados"]
+        self._fallos_registrados = estado["fallos_registrados"]
+
+    # --- Reporte por generación ---
+    def columnas_generacion(self):
+        """
+        Aciertos y fallos desde la llamada anterior (ea_simple la llama una vez por
+        generación y las agrega al logbook como "aciertos" y "fallos").
+        """
+        columnas = {"aciertos": self.aciertos - self._aciertos_registrados,
+                    "fallos": self.fallos - self._fallos_registrados}
+        self._aciertos_registrados = self.aciertos
+        self._fallos_registrados = self.fallos
+        return columnas
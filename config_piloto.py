@@ -92,195 +92,35 @@ def decodificar_cromosoma(cromosoma_bits):
 
     return perfil_decodificado
 
-# --- Función de Aptitud ---
-def evaluar_aptitud_piloto(cromosoma_bits):
+# --- Funciones para Empaquetar/Desempaquetar un Cromosoma ---
+# El bit 0 del cromosoma es el más significativo del entero, así el entero
+# coincide con leer la cadena de bits "A1A2...A8" en binario.
+def empaquetar_cromosoma(cromosoma_bits):
     """
-    Calcula la aptitud de un perfil de piloto representado por un cromosoma,
+    Convierte un cromosoma (lista de 16 bits) en un entero entre 0 y 2**16 - 1.
     """
-    perfil = decodificar_cromosoma(cromosoma_bits)
-    
-    puntaje_base = 0
-    bonificaciones_individuales = 0
-    bonificaciones_sinergia = 0
-    penalizaciones = 0 # Un solo acumulador para todas las penalizaciones
-
-    # --- A. Bonificaciones por Atributos Individuales Positivos (BIs) ---
-    if perfil["A1_Experiencia"] == "Joven Promesa": bonificaciones_individuales += 2
-    elif perfil["A1_Experiencia"] == "Establecido": bonificaciones_individuales += 2
-    elif perfil["A1_Experiencia"] == "Veterano": bonificaciones_individuales += 1
-
-    if perfil["A2_EstiloConduccion"] == "Agresivo Controlado": bonificaciones_individuales += 4 # antes era 2
-    elif perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico": bonificaciones_individuales += 2
-
-    if perfil["A3_VelocidadPura"] == "Excepcional": bonificaciones_individuales += 4
-    elif perfil["A3_VelocidadPura"] == "Muy Buena": bonificaciones_individuales += 2
+    entero = 0
+    for bit in cromosoma_bits:
+        entero = (entero << 1) | bit
+    return entero
 
-    if perfil["A4_ConsistenciaCarrera"] == "Extremadamente Consistente": bonificaciones_individuales += 4
-    elif perfil["A4_ConsistenciaCarrera"] == "Muy Consistente": bonificaciones_individuales += 2
-
-    if perfil["A5_FeedbackTecnico"] == "Excepcional": bonificaciones_individuales += 4
-    elif perfil["A5_FeedbackTecnico"] == "Fuerte": bonificaciones_individuales += 2
-
-    if perfil["A6_MentalidadEquipo"] == "Jugador de Equipo Nato": bonificaciones_individuales += 2
-    elif perfil["A6_MentalidadEquipo"] == "Totalmente Alineado con el Equipo": bonificaciones_individuales += 3
-    elif perfil["A6_MentalidadEquipo"] == "Equilibrado": bonificaciones_individuales += 1
-
-    if perfil["A7_EncajeMarca"] == "Encaje Perfecto": bonificaciones_individuales += 3
-    elif perfil["A7_EncajeMarca"] == "Buen Encaje": bonificaciones_individuales += 2
-
-    if perfil["A8_ExigenciaSalarial"] == "Salario Muy Bajo": bonificaciones_individuales += 2 # antes 3
-    elif perfil["A8_ExigenciaSalarial"] == "Salario Bajo": bonificaciones_individuales += 1 # antes 2
-
-    # --- B. Bonificaciones por Sinergias (BDs) ---
-    # BD1
-    if (perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"] and 
-        perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"]):
-        bonificaciones_sinergia += 10
-    # BD2
-    if (perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"] and
-        perfil["A5_FeedbackTecnico"] in ["Fuerte", "Excepcional"]):
-        bonificaciones_sinergia += 8
-    # BD3
-    if ((perfil["A1_Experiencia"] in ["Novato"] or                            #, "Joven Promesa"] or // comento esto para separar la bd3 de la 5 
-         perfil["A7_EncajeMarca"] in ["Buen Encaje", "Encaje Perfecto"]) and
-        (perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"])):
-        bonificaciones_sinergia += 6 # antes 7
-    # BD4
-    if (perfil["A5_FeedbackTecnico"] == "Fuerte" and
-        perfil["A6_MentalidadEquipo"] == "Jugador de Equipo Nato"):
-        bonificaciones_sinergia += 9
-    # BD5
-    if (perfil["A1_Experiencia"] == "Joven Promesa" and
-        (perfil["A7_EncajeMarca"] in ["Buen Encaje", "Encaje Perfecto"]) and
-        perfil["A8_ExigenciaSalarial"] == "Salario Bajo"):
-        bonificaciones_sinergia += 7
-    # BD6
-    if (perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico" and
-        perfil["A4_ConsistenciaCarrera"] == "Muy Consistente"):
-        bonificaciones_sinergia += 6
-    # BD7 
-    if (perfil["A1_Experiencia"] in ["Establecido", "Veterano"] and
-        perfil["A5_FeedbackTecnico"] == "Excepcional" and
-        perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"]):
-        bonificaciones_sinergia += 10
-    # BD8 
-    if (perfil["A1_Experiencia"] == "Veterano" and
-        perfil["A7_EncajeMarca"] in ["Buen Encaje"] and # saque encaje perfecto xq raro que un veterano se asocie con la imagen redbull
-        perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"]):
-        bonificaciones_sinergia += 8
-    # BD9 
-    if ((perfil["A3_VelocidadPura"] == "Excepcional" or perfil["A5_FeedbackTecnico"] == "Excepcional") and
-        perfil["A8_ExigenciaSalarial"] == "Salario Medio"):
-        bonificaciones_sinergia += 4
-        
-    # --- C. Reglas de Incompatibilidad (Penalizaciones - INCs) ---
-    # INC1
-    if (perfil["A1_Experiencia"] == "Veterano" and 
-        perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"]):
-        penalizaciones += 9 # antes era 6
-    # INC2
-    if (perfil["A3_VelocidadPura"] == "Excepcional" and 
-        perfil["A6_MentalidadEquipo"] == "Totalmente Alineado con el Equipo"):
-        penalizaciones += 5
-    # INC3
-    if (perfil["A1_Experiencia"] == "Novato" and 
-        perfil["A5_FeedbackTecnico"] == "Excepcional"):
-        penalizaciones += 4
-    # INC4
-    if (perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"] and 
-        perfil["A2_EstiloConduccion"] == "Agresivo Controlado"):
-        penalizaciones += 3
-    # INC5
-    condiciones_elite_inc5 = 0
-    if perfil["A3_VelocidadPura"] == "Excepcional": condiciones_elite_inc5 += 1
-    if perfil["A4_ConsistenciaCarrera"] == "Extremadamente Consistente": condiciones_elite_inc5 += 1
-    if perfil["A5_FeedbackTecnico"] == "Excepcional": condiciones_elite_inc5 += 1
-    if perfil["A7_EncajeMarca"] == "Encaje Perfecto": condiciones_elite_inc5 += 1
-    if condiciones_elite_inc5 >= 2 and perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"]:
-        penalizaciones += 13 # antes 9
-    # INC6
-    if (perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico" and 
-        perfil["A5_FeedbackTecnico"] == "Limitada"):
-        penalizaciones += 4
-    # INC7
-    if (perfil["A8_ExigenciaSalarial"] == "Salario Alto" and 
-        perfil["A7_EncajeMarca"] == "Bajo Encaje"):
-        penalizaciones += 5
-    # INC8
-    if (perfil["A1_Experiencia"] in ["Establecido", "Veterano"] and 
-        perfil["A4_ConsistenciaCarrera"] == "Inconsistente"):
-        penalizaciones += 4
-    # INC9
-    if (perfil["A2_EstiloConduccion"] == "Consistente y Calculador" and 
-        perfil["A3_VelocidadPura"] == "Excepcional"):
-        penalizaciones += 3
-    # INC10
-    if (perfil["A1_Experiencia"] in ["Novato", "Joven Promesa"] and
-        perfil["A5_FeedbackTecnico"] in ["Fuerte", "Excepcional"]):
-        penalizaciones += 2
-    # INC11
-    if (perfil["A3_VelocidadPura"] == "Excepcional" and
-        perfil["A4_ConsistenciaCarrera"] == "Extremadamente Consistente"):
-        penalizaciones += 3
-    # INC12
-    if (perfil["A1_Experiencia"] == "Joven Promesa" and
-        perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico" and
-        perfil["A7_EncajeMarca"] in ["Buen Encaje", "Encaje Perfecto"] and
-        (perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"] or 
-         perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"])):
-        penalizaciones += 6 # antes era 3
-    # INC13
-    if (perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"] and
-        perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"]):
-        penalizaciones += 4
-    # INC14
-    if (perfil["A1_Experiencia"] in ["Novato", "Joven Promesa"] and
-        perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"] and
-        perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"] and
-        perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"]):
-        penalizaciones += 8 # antes era 5
-    # INC15
-    if (perfil["A1_Experiencia"] == "Veterano" and
-        perfil["A3_VelocidadPura"] == "Excepcional" and
-        perfil["A8_ExigenciaSalarial"] == "Salario Alto" and
-        perfil["A6_MentalidadEquipo"] in ["Equilibrado", "Primariamente Individualista"]):
-        penalizaciones += 9
-    # INC16
-    if (perfil["A1_Experiencia"] in ["Establecido", "Veterano"] and
-        perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"] and
-        perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"]):
-        penalizaciones += 6
-    # INC17
-    if (perfil["A1_Experiencia"] in ["Establecido", "Veterano"] and
-        perfil["A5_FeedbackTecnico"] in ["Fuerte", "Excepcional"] and
-        perfil["A8_ExigenciaSalarial"] in ["Salario Medio", "Salario Alto"]):
-        penalizaciones += 7
-    # INC18
-    if (perfil["A1_Experiencia"] == "Veterano" and
-        perfil["A2_EstiloConduccion"] == "Agresivo Controlado"):
-        penalizaciones += 5
-    # INC19 (Ajustada)
-    if (perfil["A2_EstiloConduccion"] == "Agresivo Controlado" and
-        perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"] and 
-        perfil["A4_ConsistenciaCarrera"] != "Extremadamente Consistente"):
-        penalizaciones += 4
-    #INC20
-    if (perfil["A4_ConsistenciaCarrera"] in ["Extremadamente Consistente","Muy Consistente"] and
-        perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"]):
-        penalizaciones += 9
-    #INC21
-    if (perfil["A1_Experiencia"] == "Veterano" and
-        perfil["A7_EncajeMarca"] == "Encaje Perfecto"):
-        penalizaciones += 5
+def desempaquetar_cromosoma(entero):
+    """
+    Convierte un entero entre 0 y 2**16 - 1 en un cromosoma (lista de 16 bits).
+    """
+    return [(entero >> (LONGITUD_CROMOSOMA - 1 - i)) & 1 for i in range(LONGITUD_CROMOSOMA)]
 
-    # TODO (al menos considerar): salvar de restricciones de salarios muy bajos a los novatos, o premiarlos x eso
-        
-    aptitud_final = (puntaje_base + 
-                     bonificaciones_individuales + 
-                     bonificaciones_sinergia - 
-                     penalizaciones)
-    
-    return (max(0, aptitud_final),)
+# --- Funciones de Aptitud ---
+# Las reglas (bonificaciones individuales, sinergias y penalizaciones, con sus pesos)
+# están escritas como datos en reglas_piloto.py (REGLAS_ORIGINAL y REGLAS_NUEVA); para
+# cambiar un peso se edita la tabla. Estas funciones son las que registra la toolbox.
+def evaluar_aptitud_piloto(cromosoma_bits):
+    """
+    Calcula la aptitud de un perfil de piloto representado por un cromosoma,
+    con las reglas originales (REGLAS_ORIGINAL).
+    """
+    from reglas_piloto import obtener_motor # acá y no arriba: reglas_piloto importa este módulo
+    return (obtener_motor("original").puntuar_cromosoma(cromosoma_bits),)
 
 
 
@@ -324,217 +164,8 @@ except Exception as e: # Captura cualquier otro error
 print("--- FIN DE PRUEBA DE config_piloto.py ---")  """
 
 def evaluar_aptitud_piloto_nueva(cromosoma_bits):
-    perfil = decodificar_cromosoma(cromosoma_bits)
-
-    puntaje_base = 0
-    bonificaciones_individuales = 0
-    bonificaciones_sinergia = 0
-    penalizaciones = 0
-
-    # --- Bonificaciones Individuales ---
-    #BI1
-    if perfil["A1_Experiencia"] == "Joven Promesa": bonificaciones_individuales += 2
-    elif perfil["A1_Experiencia"] == "Establecido": bonificaciones_individuales += 1
-    elif perfil["A1_Experiencia"] == "Veterano": bonificaciones_individuales += 2
-    #BI2
-    if perfil["A2_EstiloConduccion"] == "Agresivo Controlado": bonificaciones_individuales += 2
-    elif perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico": bonificaciones_individuales += 1
-    if perfil["A2_EstiloConduccion"] == "Consistente y Calculador": bonificaciones_individuales += 1
-    elif (perfil["A2_EstiloConduccion"] == "Técnico y Metódico" and
-        perfil["A5_FeedbackTecnico"] in ["Adecuada", "Fuerte"]): bonificaciones_individuales += 1 # complemento logico como para premiar ese estilo
-    #BI3
-    if perfil["A3_VelocidadPura"] == "Excepcional": bonificaciones_individuales += 3
-    elif perfil["A3_VelocidadPura"] == "Muy Buena": bonificaciones_individuales += 2
-    #BI4
-    if perfil["A4_ConsistenciaCarrera"] == "Extremadamente Consistente": bonificaciones_individuales += 4
-    elif perfil["A4_ConsistenciaCarrera"] == "Muy Consistente": bonificaciones_individuales += 2
-    if (perfil["A4_ConsistenciaCarrera"] == "Algo Consistente" and
-        perfil["A1_Experiencia"] in ["Novato", "Joven Promesa"]): bonificaciones_individuales += 1  # Coherente con curva de aprendizaje, no habria por que sumarle este punto por poca consistencia para un establecido o veterano
-
-    #BI5
-    if perfil["A5_FeedbackTecnico"] == "Excepcional": bonificaciones_individuales += 4
-    elif perfil["A5_FeedbackTecnico"] == "Fuerte": bonificaciones_individuales += 2
-    if perfil["A5_FeedbackTecnico"] == "Adecuada" and perfil["A1_Experiencia"] != "Veterano": bonificaciones_individuales += 1 # no es logico un veterano con feedback flojito
-    #BI6
-    if perfil["A6_MentalidadEquipo"] == "Jugador de Equipo Nato": bonificaciones_individuales += 2
-    elif perfil["A6_MentalidadEquipo"] == "Totalmente Alineado con el Equipo": bonificaciones_individuales += 3
-    elif (perfil["A6_MentalidadEquipo"] == "Equilibrado" and
-        perfil["A2_EstiloConduccion"] != "Agresivo Controlado"): bonificaciones_individuales += 1 # tranquilo sin entrar en conflicto
-    #BI7
-    if perfil["A7_EncajeMarca"] == "Encaje Perfecto": bonificaciones_individuales += 3
-    elif perfil["A7_EncajeMarca"] == "Buen Encaje": bonificaciones_individuales += 2
-    #BI8
-    if perfil["A8_ExigenciaSalarial"] == "Salario Muy Bajo": bonificaciones_individuales += 2
-    elif perfil["A8_ExigenciaSalarial"] == "Salario Bajo": bonificaciones_individuales += 1
-
-    # --- Bonificaciones por Sinergia ---
-    #BD1
-    BD1_aplicado = False
-    if (perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"] and 
-        perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"]):
-        bonificaciones_sinergia += 10
-        BD1_aplicado = True
-    #BD2
-    if (perfil["A5_FeedbackTecnico"] in ["Fuerte", "Excepcional"] and
-        perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"]):
-        bonificaciones_sinergia += 10
-    #BD3
-    if (perfil["A1_Experiencia"] in ["Novato", "Joven Promesa"] and
-        perfil["A7_EncajeMarca"] in ["Buen Encaje", "Encaje Perfecto"] and
-        perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"]):
-        bonificaciones_sinergia += 6
-    #BD4
-    if (perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico" and
-        perfil["A4_ConsistenciaCarrera"] == "Muy Consistente" and
-        perfil["A5_FeedbackTecnico"] in ["Fuerte", "Excepcional"]):
-        bonificaciones_sinergia += 5
-    #BD5
-    if (perfil["A1_Experiencia"] in ["Establecido", "Veterano"] and
-        perfil["A5_FeedbackTecnico"] == "Excepcional" and
-        perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"] and
-        perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"]):
-        bonificaciones_sinergia += 6
-    #BD6
-    if (perfil["A1_Experiencia"] == "Veterano" and
-        perfil["A7_EncajeMarca"] == "Buen Encaje" and
-        perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"]):
-        bonificaciones_sinergia += 8
-    #BD7
-    if ((perfil["A3_VelocidadPura"] == "Excepcional" and perfil["A5_FeedbackTecnico"] == "Excepcional") and
-        perfil["A8_ExigenciaSalarial"] == "Salario Medio"):
-        bonificaciones_sinergia += 4
-    #BD8
-    if (perfil["A1_Experiencia"] == "Establecido" and
-        perfil["A5_FeedbackTecnico"] == "Fuerte" and
-        perfil["A6_MentalidadEquipo"] == "Jugador de Equipo Nato" and
-        perfil["A8_ExigenciaSalarial"] == "Salario Medio"):
-        bonificaciones_sinergia += 6
-    #BD9
-    if (perfil["A1_Experiencia"] == "Novato" and
-        perfil["A5_FeedbackTecnico"] == "Adecuada" and
-        perfil["A6_MentalidadEquipo"] == "Equilibrado" and
-        perfil["A8_ExigenciaSalarial"] == "Salario Muy Bajo"):
-        bonificaciones_sinergia += 5
-    #BD10
-    if (perfil["A1_Experiencia"] in ["Joven Promesa", "Establecido"] and
-        perfil["A5_FeedbackTecnico"] == "Adecuada" and
-        perfil["A6_MentalidadEquipo"] == "Jugador de Equipo Nato" and
-        perfil["A8_ExigenciaSalarial"] == "Salario Bajo"):
-        bonificaciones_sinergia += 6
-    #BD11
-    #if (perfil["A8_ExigenciaSalarial"] == "Salario Medio" and 
-    #    perfil["A1_Experiencia"] == "Establecido"):
-    #    bonificaciones_sinergia+= 2
-    #BD12
-    if (perfil["A1_Experiencia"] == "Joven Promesa" and
-        perfil["A5_FeedbackTecnico"] == "Adecuada" and
-        perfil["A4_ConsistenciaCarrera"] == "Algo Consistente" and
-        perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"] and
-        perfil["A8_ExigenciaSalarial"] == "Salario Bajo"):
-        bonificaciones_sinergia += 5
-    #BD13
-    if (perfil["A2_EstiloConduccion"] == "Técnico y Metódico" and
-        perfil["A5_FeedbackTecnico"] in ["Fuerte", "Adecuada"] and
-        perfil["A7_EncajeMarca"] == "Encaje Aceptable"):
-        bonificaciones_sinergia += 4
-    #BD14
-    if (perfil["A6_MentalidadEquipo"] == "Equilibrado" and
-        perfil["A5_FeedbackTecnico"] in ["Adecuada", "Fuerte"] and
-        perfil["A8_ExigenciaSalarial"] == "Salario Medio" and
-        perfil["A1_Experiencia"] in ["Establecido", "Joven Promesa"]):
-        bonificaciones_sinergia += 5
-    #BD15
-    if (perfil["A1_Experiencia"] == "Novato" and
-        perfil["A6_MentalidadEquipo"] in ["Equilibrado", "Jugador de Equipo Nato"] and
-        perfil["A8_ExigenciaSalarial"] == "Salario Muy Bajo" and
-        perfil["A4_ConsistenciaCarrera"] == "Algo Consistente"):
-        bonificaciones_sinergia += 4
-    #BD16
-    if (perfil["A1_Experiencia"] == "Joven Promesa" and
-        perfil["A3_VelocidadPura"] in ["Buena", "Muy Buena"] and
-        perfil["A5_FeedbackTecnico"] in ["Adecuada", "Fuerte"] and
-        perfil["A8_ExigenciaSalarial"] in ["Salario Bajo", "Salario Medio"]):
-        bonificaciones_sinergia += 5
-    # BD17
-    if (perfil["A3_VelocidadPura"] == "Muy Buena" and
-        perfil["A5_FeedbackTecnico"] in ["Fuerte", "Excepcional"] and
-        perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"]):
-        bonificaciones_sinergia += 5
-
-
-    # --- Penalizaciones agrupadas escalonadas ---
-    #INC_AVANZADA1
-    penalizador_elite = 0
-    if perfil["A3_VelocidadPura"] == "Excepcional": penalizador_elite += 1
-    if perfil["A4_ConsistenciaCarrera"] == "Extremadamente Consistente": penalizador_elite += 1
-    if perfil["A5_FeedbackTecnico"] == "Excepcional": penalizador_elite += 1
-    if perfil["A7_EncajeMarca"] == "Encaje Perfecto": penalizador_elite += 1
-    if perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"] and penalizador_elite >= 2:
-        penalizaciones += 10 + (penalizador_elite - 2) * 2
-    #INC_AVANZADA2 - Penalización por "perfil incoherente"
-    penalizador_incoherente = 0
-    if perfil["A1_Experiencia"] in ["Establecido", "Veterano"]: penalizador_incoherente += 1
-    if perfil["A5_FeedbackTecnico"] in ["Fuerte", "Excepcional"]: penalizador_incoherente += 1
-    if perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"]: penalizador_incoherente += 1
-    if penalizador_incoherente >= 2:
-        penalizaciones += 9 + (penalizador_incoherente - 2) * 2
-    #INC3 - Penalización por “perfil Dios”
-    if (BD1_aplicado and
-        perfil["A3_VelocidadPura"] == "Excepcional" and
-        perfil["A4_ConsistenciaCarrera"] == "Extremadamente Consistente"):
-        penalizaciones += 6
-    #INC4 - veterano perfecto es raro
-    if (perfil["A1_Experiencia"] == "Veterano" and
-        perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"] and
-        perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"] and
-        perfil["A5_FeedbackTecnico"] == "Excepcional" and
-        perfil["A6_MentalidadEquipo"] in ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"]):
-        penalizaciones += 6
-    #INC_5
-    if (perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico" and
-        perfil["A1_Experiencia"] == "Veterano"):
-        penalizaciones += 2
-   # INC6 – penaliza pilotos con poca experiencia muy adaptables
-    if perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico" and perfil["A1_Experiencia"] in ["Novato", "Joven Promesa"]:
-        penalizaciones += 3
-    # INC7 – penaliza salario medio con poco merito
-    if (perfil["A8_ExigenciaSalarial"] == "Salario Medio" and
-        perfil["A1_Experiencia"] in ["Novato", "Joven Promesa"] and
-        perfil["A5_FeedbackTecnico"] in ["Adecuada", "Limitada"]):
-        penalizaciones += 4
-    # INC8 – penaliza leve por mucho de salario medio
-    if perfil["A8_ExigenciaSalarial"] == "Salario Medio":
-        penalizaciones += 1
-    # INC9 – feedback tccnico exagerado en joven promesa
-    if perfil["A1_Experiencia"] in ["Novato", "Joven Promesa"] and perfil["A5_FeedbackTecnico"] == "Excepcional":
-        penalizaciones += 4
-    # INC10 – penaliza a joven promesa perfecto y barato
-    if (perfil["A1_Experiencia"] == "Joven Promesa" and
-        perfil["A3_VelocidadPura"] in ["Muy Buena", "Excepcional"] and
-        perfil["A4_ConsistenciaCarrera"] in ["Muy Consistente", "Extremadamente Consistente"] and
-        perfil["A8_ExigenciaSalarial"] in ["Salario Muy Bajo", "Salario Bajo"]):
-        penalizaciones += 6
-    #INC11
-    if (perfil["A1_Experiencia"] == "Establecido" and
-        perfil["A2_EstiloConduccion"] == "Adaptable Camaleónico" and
-        perfil["A5_FeedbackTecnico"] in ["Limitada", "Adecuada"]):
-        penalizaciones += 3
-    #INC12
-    if (perfil["A8_ExigenciaSalarial"] == "Salario Medio" and
-        perfil["A1_Experiencia"] == "Establecido" and
-        (perfil["A4_ConsistenciaCarrera"] == "Extremadamente Consistente" or 
-        perfil["A3_VelocidadPura"] == "Excepcional") and
-        perfil["A5_FeedbackTecnico"] in ["Adecuada", "Fuerte"]):
-        penalizaciones += 4
-    #INC13 – excepcional sin base tecnica o experiencia solida
-    if (perfil["A3_VelocidadPura"] == "Excepcional" and
-        perfil["A1_Experiencia"] in ["Novato", "Joven Promesa"] and
-        perfil["A5_FeedbackTecnico"] in ["Limitada", "Adecuada"]):
-        penalizaciones += 4
-    # INC14 – Excepcional sin alineación de equipo (riesgo de individualismo)
-    if (perfil["A3_VelocidadPura"] == "Excepcional" and
-        perfil["A6_MentalidadEquipo"] in ["Primariamente Individualista", "Equilibrado"]):
-        penalizaciones += 3
- 
-    aptitud_final = max(0, puntaje_base + bonificaciones_individuales + bonificaciones_sinergia - penalizaciones)
-    return (aptitud_final,)
+    """
+    Calcula la aptitud de un perfil de piloto con las reglas nuevas (REGLAS_NUEVA).
+    """
+    from reglas_piloto import obtener_motor
+    return (obtener_motor("nueva").puntuar_cromosoma(cromosoma_bits),)
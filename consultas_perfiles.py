@@ -0,0 +1,188 @@
+# --- Consultas con Restricciones sobre el Espacio de Perfiles ---
+# Para preguntas como "el mejor perfil con A8_ExigenciaSalarial hasta Salario Medio y
+# A1_Experiencia distinta de Novato" no hace falta agregar penalizaciones y volver a
+# correr el AG: con 16 bits se pueden recorrer todos los perfiles.
+#
+# IndiceConsultas ordena una sola vez los 65.536 cromosomas de mayor a menor aptitud
+# (a igual aptitud, menor entero primero, como tabla_aptitud.top_k) y guarda, para cada
+# atributo y cada código, un mapa de bits sobre ese orden (bit i = el i-ésimo mejor
+# cromosoma tiene ese código). Una consulta es:
+#   * OR de los mapas de los códigos permitidos de cada atributo restringido
+#   * AND entre atributos
+#   * los primeros k bits en 1 del resultado, que son directamente el top-k
+# Son operaciones sobre 8 KB por mapa, así que una consulta tarda microsegundos.
+#
+# Restricciones (por atributo de ATRIBUTOS_CONFIG, valores como etiqueta o como bits):
+#   "Veterano"                                   -> igual a
+#   ["Novato", "Joven Promesa"]                  -> alguno de
+#   {"desde": ..., "hasta": ..., "excluir": ...} -> rango por código (inclusivo) y/o exclusiones
+#
+# Uso:
+#   indice = obtener_indice("nueva")
+#   indice.consultar({"A8_ExigenciaSalarial": {"hasta": "Salario Medio"},
+#                     "A1_Experiencia": {"excluir": "Novato"}}, k=5)
+#   python consultas_perfiles.py "A8_ExigenciaSalarial<=Salario Medio" "A1_Experiencia!=Novato" --k 5
+
+import numpy
+
+from config_piloto import ORDEN_ATRIBUTOS, LONGITUD_CROMOSOMA
+from puntuar_perfiles import CODIGO_POR_VALOR
+from reglas_piloto import INDICE_ATRIBUTO
+from tabla_aptitud import TAM_ESPACIO
+
+
+def _codigo(nombre_attr, valor):
+    codigo = CODIGO_POR_VALOR[nombre_attr].get(valor)
+    if codigo is None:
+        raise ValueError(f"Valor desconocido para {nombre_attr}: {valor!r}")
+    return codigo
+
+
+def codigos_permitidos(nombre_attr, restriccion):
+    """
+    Conjunto de códigos de un atributo que cumplen la restricción (ver el comentario del módulo).
+    """
+    if nombre_attr not in INDICE_ATRIBUTO:
+        raise ValueError(f"Atributo desconocido: {nombre_attr}")
+    num_bits = ORDEN_ATRIBUTOS[INDICE_ATRIBUTO[nombre_attr]][2]
+    if isinstance(restriccion, str):
+        return {_codigo(nombre_attr, restriccion)}
+    if isinstance(restriccion, dict):
+        desconocidas = set(restriccion) - {"desde", "hasta", "excluir"}
+        if desconocidas:
+            raise ValueError(f"Claves de restricción desconocidas para {nombre_attr}: {sorted(desconocidas)}")
+        desde = _codigo(nombre_attr, restriccion["desde"]) if "desde" in restriccion else 0
+        hasta = _codigo(nombre_attr, restriccion["hasta"]) if "hasta" in restriccion else (1 << num_bits) - 1
+        excluir = restriccion.get("excluir", [])
+        excluir = [excluir] if isinstance(excluir, str) else excluir
+        return set(range(desde, hasta + 1)) - {_codigo(nombre_attr, valor) for valor in excluir}
+    return {_codigo(nombre_attr, valor) for valor in restriccion}
+
+
+class IndiceConsultas:
+    """
+    Cromosomas ordenados por aptitud con un mapa de bits por atributo y código,
+    para responder consultas top-k con restricciones de forma exacta.
+    """
+
+    def __init__(self, tabla):
+        tabla = numpy.asarray(tabla)
+        # argsort estable sobre la aptitud negada: a igual aptitud, menor entero primero
+        self.orden = numpy.argsort(-tabla.astype(numpy.int32), kind="stable").astype(numpy.uint16)
+        self.aptitudes = tabla[self.orden]
+        # mapas[i][c]: bits (empaquetados en bytes, en el orden de self.orden) de los
+        # cromosomas cuyo atributo i tiene el código c
+        self.mapas = []
+        for _, inicio_bit, num_bits in ORDEN_ATRIBUTOS:
+            codigos = (self.orden >> (LONGITUD_CROMOSOMA - inicio_bit - num_bits)) & ((1 << num_bits) - 1)
+            self.mapas.append([numpy.packbits(codigos == codigo) for codigo in range(1 << num_bits)])
+
+    def mascara(self, restricciones):
+        """
+        Mapa de bits (empaquetado) de los cromosomas que cumplen todas las restricciones.
+        """
+        resultado = numpy.full(TAM_ESPACIO // 8, 0xFF, dtype=numpy.uint8)
+        for nombre_attr, restriccion in restricciones.items():
+            permitidos = codigos_permitidos(nombre_attr, restriccion)
+            mapas_attr = self.mapas[INDICE_ATRIBUTO[nombre_attr]]
+            if len(permitidos) == len(mapas_attr):
+                continue
+            atributo = numpy.zeros_like(resultado)
+            for codigo in permitidos:
+                atributo |= mapas_attr[codigo]
+            resultado &= atributo
+        return resultado
+
+    def consultar(self, restricciones, k=10):
+        """
+        Los k mejores cromosomas que cumplen las restricciones, como lista de tuplas
+        (entero, aptitud) ordenada igual que tabla_aptitud.top_k.
+        """
+        mascara = self.mascara(restricciones)
+        # Solo se desempaquetan los bloques de 64 cromosomas que tienen algún bit en 1
+        bloques = numpy.flatnonzero(mascara.view(numpy.uint64))
+        posiciones = []
+        for bloque in bloques.tolist():
+            bits = numpy.unpackbits(mascara[bloque * 8:(bloque + 1) * 8])
+            posiciones.extend((bloque * 64 + numpy.flatnonzero(bits)).tolist())
+            if len(posiciones) >= k:
+                break
+        return [(int(self.orden[posicion]), int(self.aptitudes[posicion])) for posicion in posiciones[:k]]
+
+    def contar(self, restricciones):
+        """
+        Cantidad de cromosomas que cumplen las restricciones.
+        """
+        return int(numpy.bitwise_count(self.mascara(restricciones)).sum())
+
+
+_INDICES = {}
+
+def obtener_indice(nombre_funcion):
+    """
+    Devuelve (construyéndolo una sola vez) el índice de la función "original" o "nueva".
+    """
+    if nombre_funcion not in _INDICES:
+        from tabla_aptitud import obtener_tabla
+        _INDICES[nombre_funcion] = IndiceConsultas(obtener_tabla(nombre_funcion))
+    return _INDICES[nombre_funcion]
+
+
+# Operadores de la línea de comandos, de más largo a más corto para reconocerlos bien
+_OPERADORES = ("<=", ">=", "!=", "=")
+
+
+def restriccion_desde_texto(texto):
+    """
+    Convierte "atributo<operador>valores" en (atributo, restriccion). Operadores:
+    = (uno de los valores separados por coma), != (ninguno), <= y >= (rango por código).
+    """
+    for operador in _OPERADORES:
+        if operador in texto:
+            nombre_attr, valores = (parte.strip() for parte in texto.split(operador, 1))
+            break
+    else:
+        raise ValueError(f"Restricción sin operador (=, !=, <=, >=): {texto!r}")
+    lista = [valor.strip() for valor in valores.split(",")]
+    if operador == "=":
+        return nombre_attr, lista
+    if operador == "!=":
+        return nombre_attr, {"excluir": lista}
+    return nombre_attr, {"hasta" if operador == "<=" else "desde": valores}
+
+
+def _argumentos():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mejores perfiles que cumplen restricciones sobre los atributos.")
+    parser.add_argument("restricciones", nargs="*",
+                        help='por ejemplo "A8_ExigenciaSalarial<=Salario Medio" "A1_Experiencia!=Novato"')
+    parser.add_argument("--funcion", choices=["original", "nueva"], default="nueva")
+    parser.add_argument("--k", type=int, default=10)
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    import time
+    from config_piloto import desempaquetar_cromosoma, imprimir_perfil_piloto
+
+    argumentos = _argumentos()
+    restricciones = {}
+    for texto in argumentos.restricciones:
+        nombre_attr, restriccion = restriccion_desde_texto(texto)
+        if nombre_attr in restricciones:
+            raise SystemExit(f"El atributo {nombre_attr} aparece en más de una restricción.")
+        restricciones[nombre_attr] = restriccion
+
+    indice = obtener_indice(argumentos.funcion)
+    inicio = time.perf_counter()
+    resultado = indice.consultar(restricciones, argumentos.k)
+    tiempo = time.perf_counter() - inicio
+
+    print(f"{indice.contar(restricciones)} perfiles cumplen las restricciones; "
+          f"top {len(resultado)} en {tiempo * 1000:.3f} ms:")
+    for entero, aptitud in resultado:
+        print(f"  {entero:016b} -> {aptitud}")
+    if resultado:
+        imprimir_perfil_piloto(desempaquetar_cromosoma(resultado[0][0]))
@@ -0,0 +1,126 @@
+# --- Criterios de Parada ---
+# Con NUM_GENERACIONES = 100 la corrida llega siempre al final, aunque la columna max
+# no cambie desde la generación 10. Un CriterioParada se le pasa a ea_simple (o a
+# ejecutar_ag / reanudar_ag) y corta la corrida apenas se cumple alguno de sus criterios:
+#   estancamiento    -> K generaciones seguidas sin mejorar la mejor aptitud del salón
+#                       de la fama (o de la población, si no hay salón)
+#   objetivo         -> la mejor aptitud llega al valor indicado; con "optimo" se usa el
+#                       óptimo exacto de la tabla exhaustiva (ver tabla_aptitud.py)
+#   desvio_minimo    -> el desvío estándar de la aptitud de la población baja del umbral
+#   max_segundos     -> tiempo de reloj de la corrida
+#   max_evaluaciones -> evaluaciones hechas (nevals más evals_locales del modo memético)
+# La columna "parada" del logbook queda vacía hasta la última generación, donde dice el
+# motivo ("estancamiento", "objetivo", "desvio", "tiempo", "evaluaciones" o
+# "generaciones" si se llegó a ngen). Al reanudar desde un punto de control el tiempo,
+# las evaluaciones y el estancamiento se vuelven a contar desde ahí.
+#
+# Uso:
+#   ejecutar_ag(parada=CriterioParada(estancamiento=15, objetivo=resolver_objetivo("optimo")))
+#   python piloto_ideal_ag.py --estancamiento 15 --objetivo optimo
+#   python barrido_parametros.py --torneo 3 10 40 --estancamiento 15 --objetivo optimo
+
+import time
+
+import numpy
+
+MOTIVOS = ("estancamiento", "objetivo", "desvio", "tiempo", "evaluaciones", "generaciones")
+
+
+def resolver_objetivo(valor, nombre_funcion="nueva"):
+    """
+    Convierte el objetivo de la línea de comandos en un número: "optimo" es la
+    aptitud máxima exacta de la función; cualquier otro valor se lee como float.
+    """
+    if valor is None:
+        return None
+    if valor == "optimo":
+        from tabla_aptitud import obtener_tabla, optimo_global
+        return float(optimo_global(obtener_tabla(nombre_funcion))[0])
+    return float(valor)
+
+
+class CriterioParada:
+    """
+    Criterios de terminación anticipada para ea_simple (bucle_evolutivo.py). Los
+    criterios en None no se usan.
+    """
+
+    def __init__(self, estancamiento=None, objetivo=None, desvio_minimo=None, max_segundos=None,
+                 max_evaluaciones=None):
+        self.estancamiento = estancamiento
+        self.objetivo = objetivo
+        self.desvio_minimo = desvio_minimo
+        self.max_segundos = max_segundos
+        self.max_evaluaciones = max_evaluaciones
+        self.iniciar()
+
+    def __repr__(self):
+        return (f"CriterioParada(estancamiento={self.estancamiento}, objetivo={self.objetivo}, "
+                f"desvio_minimo={self.desvio_minimo}, max_segundos={self.max_segundos}, "
+                f"max_evaluaciones={self.max_evaluaciones})")
+
+    def iniciar(self):
+        """
+        Vuelve a cero el reloj, las evaluaciones y el estancamiento (ea_simple lo
+        llama al empezar).
+        """
+        self._inicio = time.perf_counter()
+        self.evaluaciones = 0
+        self.mejor = None
+        self.gen_mejora = None
+
+    def __call__(self, gen, evaluaciones, poblacion, halloffame=None):
+        """
+        Registra la generación gen (ya evaluada) y devuelve el motivo para parar, o
+        None si la corrida sigue.
+        """
+        self.evaluaciones += evaluaciones
+        if halloffame is not None and len(halloffame):
+            mejor = halloffame[0].fitness.values[0]
+        else:
+            mejor = max(ind.fitness.values[0] for ind in poblacion)
+        if self.mejor is None or mejor > self.mejor:
+            self.mejor, self.gen_mejora = mejor, gen
+
+        if self.objetivo is not None and mejor >= self.objetivo:
+            return "objetivo"
+        if self.estancamiento is not None and gen - self.gen_mejora >= self.estancamiento:
+            return "estancamiento"
+        if self.desvio_minimo is not None:
+            desvio = numpy.std([ind.fitness.values[0] for ind in poblacion])
+            if desvio < self.desvio_minimo:
+                return "desvio"
+        if self.max_evaluaciones is not None and self.evaluaciones >= self.max_evaluaciones:
+            return "evaluaciones"
+        if self.max_segundos is not None and time.perf_counter() - self._inicio >= self.max_segundos:
+            return "tiempo"
+        return None
+
+
+# --- Línea de comandos ---
+def agregar_argumentos(parser):
+    """
+    Agrega a un argparse.ArgumentParser las opciones de parada.
+    """
+    grupo = parser.add_argument_group("parada anticipada")
+    grupo.add_argument("--estancamiento", type=int, default=None, metavar="K",
+                       help="parar tras K generaciones sin mejorar la mejor aptitud")
+    grupo.add_argument("--objetivo", default=None, metavar="APTITUD",
+                       help='parar al alcanzar esta aptitud ("optimo" = óptimo exacto de la tabla)')
+    grupo.add_argument("--desvio-minimo", type=float, default=None,
+                       help="parar cuando el desvío de la aptitud de la población baja de este valor")
+    grupo.add_argument("--max-segundos", type=float, default=None)
+    grupo.add_argument("--max-evaluaciones", type=int, default=None)
+
+
+def opciones_desde_argumentos(argumentos, nombre_funcion="nueva"):
+    """
+    Diccionario de parámetros de CriterioParada según las opciones de agregar_argumentos
+    (vacío si no se pidió ningún criterio).
+    """
+    opciones = {"estancamiento": argumentos.estancamiento,
+                "objetivo": resolver_objetivo(argumentos.objetivo, nombre_funcion),
+                "desvio_minimo": argumentos.desvio_minimo,
+                "max_segundos": argumentos.max_segundos,
+                "max_evaluaciones": argumentos.max_evaluaciones}
+    return {nombre: valor for nombre, valor in opciones.items() if valor is not None}
@@ -0,0 +1,204 @@
+# --- Cromosoma Compacto (un entero de 16 bits) ---
+# En piloto_ideal_ag.py cada individuo es una lista de 16 enteros y, para evaluarlo,
+# decodificar_cromosoma arma una cadena "01" por atributo. Acá el individuo guarda
+# un solo entero (el cromosoma empaquetado, ver empaquetar_cromosoma) y los atributos
+# se leen con desplazamientos y máscaras de bits.
+#
+# Los operadores de cruce y mutación consumen los mismos números aleatorios que
+# tools.cxTwoPoint / tools.mutFlipBit, así que con la misma semilla la evolución es
+# idéntica a la de la versión con listas.
+#
+# Para poblaciones muy grandes conviene guardar solo los genotipos en un arreglo
+# uint16 de NumPy (2 bytes por individuo), ver arreglo_genotipos / poblacion_desde_arreglo.
+
+import random
+import numpy
+from deap import base, tools
+from config_piloto import ATRIBUTOS_CONFIG, ORDEN_ATRIBUTOS, LONGITUD_CROMOSOMA
+
+# (nombre_atributo, desplazamiento, mascara) para leer cada atributo del entero
+CAMPOS_ATRIBUTOS = [
+    (nombre_attr, LONGITUD_CROMOSOMA - inicio_bit - num_bits, (1 << num_bits) - 1)
+    for nombre_attr, inicio_bit, num_bits in ORDEN_ATRIBUTOS
+]
+
+# Valores legibles de cada atributo indexados por su código (0-3)
+VALORES_POR_CODIGO = {
+    nombre_attr: [ATRIBUTOS_CONFIG[nombre_attr][format(codigo, f"0{num_bits}b")] for codigo in range(1 << num_bits)]
+    for nombre_attr, _, num_bits in ORDEN_ATRIBUTOS
+}
+
+
+class FitnessMaxCompacta(base.Fitness):
+    """
+    Igual que creator.FitnessMax (maximizar una sola aptitud), pero definida acá
+    para no depender de creator.create.
+    """
+    weights = (1.0,)
+
+
+class IndividuoCompacto:
+    """
+    Individuo representado por un único entero de 16 bits. También se comporta
+    como una secuencia de bits de solo lectura (len, índices y slices), así que
+    sirve con decodificar_cromosoma, imprimir_perfil_piloto y las funciones de aptitud.
+    """
+    __slots__ = ("genotipo", "fitness")
+
+    def __init__(self, genotipo=0, fitness=None):
+        self.genotipo = genotipo
+        self.fitness = FitnessMaxCompacta() if fitness is None else fitness
+
+    def __len__(self):
+        return LONGITUD_CROMOSOMA
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [(self.genotipo >> (LONGITUD_CROMOSOMA - 1 - i)) & 1
+                    for i in range(*indice.indices(LONGITUD_CROMOSOMA))]
+        if indice < 0:
+            indice += LONGITUD_CROMOSOMA
+        if not 0 <= indice < LONGITUD_CROMOSOMA:
+            raise IndexError("Índice de bit fuera del cromosoma.")
+        return (self.genotipo >> (LONGITUD_CROMOSOMA - 1 - indice)) & 1
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __eq__(self, otro):
+        # El HallOfFame de DEAP compara con == para no repetir individuos
+        if isinstance(otro, IndividuoCompacto):
+            return self.genotipo == otro.genotipo
+        return NotImplemented
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        # toolbox.clone usa deepcopy; esto evita la copia genérica por __slots__
+        fitness = self.fitness.__class__()
+        fitness.wvalues = self.fitness.wvalues
+        return IndividuoCompacto(self.genotipo, fitness)
+
+    def __repr__(self):
+        return f"IndividuoCompacto({self.genotipo:0{LONGITUD_CROMOSOMA}b})"
+
+
+# --- Decodificación por bits ---
+def decodificar_genotipo(genotipo):
+    """
+    Devuelve una tupla con el código (0-3) de cada atributo, en el orden de ORDEN_ATRIBUTOS.
+    """
+    return tuple((genotipo >> desplazamiento) & mascara for _, desplazamiento, mascara in CAMPOS_ATRIBUTOS)
+
+
+def perfil_desde_genotipo(genotipo):
+    """
+    Igual que decodificar_cromosoma pero a partir del entero: devuelve el diccionario
+    {atributo: valor legible}.
+    """
+    return {nombre_attr: VALORES_POR_CODIGO[nombre_attr][(genotipo >> desplazamiento) & mascara]
+            for nombre_attr, desplazamiento, mascara in CAMPOS_ATRIBUTOS}
+
+
+# --- Inicialización y Operadores Genéticos ---
+def individuo_compacto_aleatorio():
+    """
+    Crea un individuo al azar. Sortea los 16 bits uno por uno con random.randint(0, 1),
+    igual que tools.initRepeat con attr_bool.
+    """
+    genotipo = 0
+    for _ in range(LONGITUD_CROMOSOMA):
+        genotipo = (genotipo << 1) | random.randint(0, 1)
+    return IndividuoCompacto(genotipo)
+
+
+def _mascara_tramo(desde, hasta):
+    """
+    Máscara con los bits del cromosoma en las posiciones [desde, hasta).
+    """
+    return ((1 << (LONGITUD_CROMOSOMA - desde)) - 1) ^ ((1 << (LONGITUD_CROMOSOMA - hasta)) - 1)
+
+
+def cx_dos_puntos_compacto(ind1, ind2):
+    """
+    Cruce de dos puntos sobre el entero (mismos sorteos que tools.cxTwoPoint).
+    Modifica ambos individuos y los devuelve.
+    """
+    punto1 = random.randint(1, LONGITUD_CROMOSOMA)
+    punto2 = random.randint(1, LONGITUD_CROMOSOMA - 1)
+    if punto2 >= punto1:
+        punto2 += 1
+    else:
+        punto1, punto2 = punto2, punto1
+
+    mascara = _mascara_tramo(punto1, punto2)
+    diferencia = (ind1.genotipo ^ ind2.genotipo) & mascara
+    ind1.genotipo ^= diferencia
+    ind2.genotipo ^= diferencia
+    return ind1, ind2
+
+
+def mut_flip_bit_compacto(individuo, indpb):
+    """
+    Invierte cada bit con probabilidad indpb (mismos sorteos que tools.mutFlipBit).
+    """
+    for i in range(LONGITUD_CROMOSOMA):
+        if random.random() < indpb:
+            individuo.genotipo ^= 1 << (LONGITUD_CROMOSOMA - 1 - i)
+    return individuo,
+
+
+# --- Evaluación ---
+def crear_evaluador_compacto(tabla):
+    """
+    Función de evaluación para IndividuoCompacto que lee la aptitud de una tabla
+    exhaustiva (ver tabla_aptitud.py) sin decodificar nada.
+    """
+    def evaluar_aptitud_compacto(individuo):
+        return (int(tabla[individuo.genotipo]),)
+    return evaluar_aptitud_compacto
+
+
+def evaluar_poblacion_compacta(poblacion, motor):
+    """
+    Evalúa de una sola vez con un MotorReglas (ver reglas_piloto.py) todos los
+    individuos con aptitud inválida. Devuelve cuántos se evaluaron.
+    """
+    invalidos = [ind for ind in poblacion if not ind.fitness.valid]
+    if invalidos:
+        aptitudes = motor.puntuar_enteros(arreglo_genotipos(invalidos))
+        for ind, aptitud in zip(invalidos, aptitudes):
+            ind.fitness.values = (int(aptitud),)
+    return len(invalidos)
+
+
+# --- Poblaciones como arreglos ---
+def arreglo_genotipos(poblacion):
+    """
+    Devuelve un arreglo uint16 con los genotipos de la población.
+    """
+    return numpy.fromiter((ind.genotipo for ind in poblacion), dtype=numpy.uint16, count=len(poblacion))
+
+
+def poblacion_desde_arreglo(genotipos, aptitudes=None):
+    """
+    Crea una lista de IndividuoCompacto a partir de un arreglo de genotipos
+    (y opcionalmente de sus aptitudes).
+    """
+    poblacion = [IndividuoCompacto(int(genotipo)) for genotipo in genotipos]
+    if aptitudes is not None:
+        for ind, aptitud in zip(poblacion, aptitudes):
+            ind.fitness.values = (float(aptitud),)
+    return poblacion
+
+
+def configurar_toolbox_compacto(toolbox, funcion_evaluacion, indpb=0.05):
+    """
+    Registra en la toolbox la versión compacta de individuo, población, cruce,
+    mutación y evaluación. La selección se deja como esté registrada.
+    """
+    toolbox.register("individual", individuo_compacto_aleatorio)
+    toolbox.register("population", tools.initRepeat, list, toolbox.individual)
+    toolbox.register("mate", cx_dos_puntos_compacto)
+    toolbox.register("mutate", mut_flip_bit_compacto, indpb=indpb)
+    toolbox.register("evaluate", funcion_evaluacion)
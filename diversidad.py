@@ -0,0 +1,155 @@
+# --- Diversidad de la Población y Genotipos Repetidos ---
+# Con tournsize=40 y 100 individuos la población se llena enseguida de copias del mismo
+# genotipo: eaSimple las lleva todas y las estadísticas solo miran la aptitud.
+#
+# Métricas por generación (ea_simple(..., medir_diversidad=True) las agrega al logbook),
+# calculadas sobre el arreglo de genotipos empaquetados:
+#   unicos    -> cantidad de genotipos distintos
+#   hamming   -> distancia de Hamming promedio entre dos individuos distintos de la
+#                población (popcount del XOR entre los genotipos únicos, pesado por sus
+#                copias; con muchos únicos se usa la cuenta de unos por bit, que da lo mismo)
+#   entropia  -> entropía promedio (en bits, entre 0 y 2) de los atributos
+#   H_A1..H_A8 -> entropía de cada atributo
+#
+# Genotipos repetidos (ea_simple(..., deduplicar=modo)), detectados por el entero
+# empaquetado de cada individuo antes de evaluar:
+#   "compartir" -> cada genotipo distinto se evalúa una sola vez y sus copias reciben la
+#                  misma aptitud (no cambia la evolución, solo ahorra evaluaciones)
+#   "nuevos"    -> las copias de un genotipo ya presente se reemplazan por individuos nuevos al azar
+#   "mutar"     -> las copias se reemplazan por una versión mutada (toolbox.mutate) de sí mismas
+#
+# Uso:
+#   ejecutar_ag(medir_diversidad=True, deduplicar="compartir")
+#   python piloto_ideal_ag.py --diversidad --deduplicar nuevos
+
+import numpy
+
+from config_piloto import ORDEN_ATRIBUTOS, LONGITUD_CROMOSOMA, empaquetar_cromosoma
+
+MODOS_DEDUPLICACION = ("compartir", "nuevos", "mutar")
+COLUMNAS_DIVERSIDAD = ["unicos", "hamming", "entropia"] + [f"H_{nombre.split('_')[0]}" for nombre, _, _ in ORDEN_ATRIBUTOS]
+
+# Hasta esta cantidad de genotipos únicos la distancia se calcula con la matriz de XOR entre ellos
+MAXIMO_UNICOS_MATRIZ = 2048
+INTENTOS_REEMPLAZO = 10
+
+
+def genotipo(individuo):
+    """
+    Entero empaquetado de un individuo (lista de bits o IndividuoCompacto).
+    """
+    valor = getattr(individuo, "genotipo", None)
+    return valor if valor is not None else empaquetar_cromosoma(individuo)
+
+
+def genotipos_poblacion(poblacion):
+    """
+    Arreglo con los genotipos empaquetados de la población.
+    """
+    return numpy.fromiter((genotipo(ind) for ind in poblacion), dtype=numpy.int64, count=len(poblacion))
+
+
+# --- Métricas ---
+def hamming_promedio(unicos, copias, longitud=LONGITUD_CROMOSOMA):
+    """
+    Distancia de Hamming promedio entre pares de individuos distintos, a partir de los
+    genotipos únicos y la cantidad de copias de cada uno.
+    """
+    total = int(copias.sum())
+    if total < 2:
+        return 0.0
+    copias = copias.astype(numpy.float64)
+    if len(unicos) <= MAXIMO_UNICOS_MATRIZ:
+        distancias = numpy.bitwise_count(unicos[:, None] ^ unicos[None, :])
+        suma = copias @ distancias @ copias
+    else:
+        # Cada bit suma 2 * unos * ceros a la distancia total entre pares ordenados
+        unos = numpy.array([copias @ ((unicos >> bit) & 1) for bit in range(longitud)])
+        suma = (2 * unos * (total - unos)).sum()
+    return float(suma / (total * (total - 1)))
+
+
+def entropias_atributos(unicos, copias):
+    """
+    Entropía (en bits) de la distribución de códigos de cada atributo.
+    """
+    entropias = []
+    total = copias.sum()
+    for _, inicio_bit, num_bits in ORDEN_ATRIBUTOS:
+        codigos = (unicos >> (LONGITUD_CROMOSOMA - inicio_bit - num_bits)) & ((1 << num_bits) - 1)
+        p = numpy.bincount(codigos, weights=copias, minlength=1 << num_bits) / total
+        p = p[p > 0]
+        entropias.append(float(-(p * numpy.log2(p)).sum()) + 0.0)
+    return entropias
+
+
+def metricas_diversidad(genotipos):
+    """
+    Diccionario con las columnas de COLUMNAS_DIVERSIDAD para un arreglo de genotipos.
+    """
+    unicos, copias = numpy.unique(genotipos, return_counts=True)
+    entropias = entropias_atributos(unicos, copias)
+    metricas = {"unicos": len(unicos), "hamming": hamming_promedio(unicos, copias),
+                "entropia": sum(entropias) / len(entropias)}
+    metricas.update(zip(COLUMNAS_DIVERSIDAD[3:], entropias))
+    return metricas
+
+
+# --- Genotipos repetidos ---
+def repetidos(genotipos):
+    """
+    Máscara de los individuos cuyo genotipo ya apareció antes en el arreglo.
+    """
+    mascara = numpy.ones(len(genotipos), dtype=bool)
+    _, primeros = numpy.unique(genotipos, return_index=True)
+    mascara[primeros] = False
+    return mascara
+
+
+def reemplazar_repetidos(individuos, toolbox, modo):
+    """
+    Reemplaza (en el lugar) las copias de genotipos repetidos por individuos nuevos
+    ("nuevos") o por versiones mutadas de sí mismos ("mutar"), reintentando unas
+    pocas veces si el reemplazo también está repetido. Devuelve cuántas copias había.
+    """
+    genotipos = genotipos_poblacion(individuos)
+    indices = numpy.flatnonzero(repetidos(genotipos))
+    presentes = set(genotipos.tolist())
+    for i in indices.tolist():
+        for _ in range(INTENTOS_REEMPLAZO):
+            if modo == "nuevos":
+                nuevo = toolbox.individual()
+            else:
+                nuevo, = toolbox.mutate(toolbox.clone(individuos[i]))
+                del nuevo.fitness.values
+            if genotipo(nuevo) not in presentes:
+                break
+        individuos[i] = nuevo
+        presentes.add(genotipo(nuevo))
+    return len(indices)
+
+
+def evaluar_sin_repetir(individuos, toolbox):
+    """
+    Como bucle_evolutivo.evaluar_invalidos, pero evaluando una sola vez cada genotipo:
+    las copias toman la aptitud de un individuo válido con el mismo genotipo o de la
+    primera copia evaluada. Devuelve cuántos individuos se evaluaron.
+    """
+    conocidas = {}
+    invalidos = []
+    for ind in individuos:
+        if ind.fitness.valid:
+            conocidas.setdefault(genotipo(ind), ind.fitness.values)
+        else:
+            invalidos.append(ind)
+
+    a_evaluar = {}
+    for ind in invalidos:
+        clave = genotipo(ind)
+        if clave not in conocidas:
+            a_evaluar.setdefault(clave, ind)
+    for (clave, ind), aptitud in zip(a_evaluar.items(), toolbox.map(toolbox.evaluate, a_evaluar.values())):
+        conocidas[clave] = aptitud
+    for ind in invalidos:
+        ind.fitness.values = conocidas[genotipo(ind)]
+    return len(a_evaluar)
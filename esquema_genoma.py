@@ -0,0 +1,297 @@
+# --- Esquema General del Genoma ---
+# config_piloto.py fija 8 atributos de 2 bits (ATRIBUTOS_CONFIG, ORDEN_ATRIBUTOS y
+# LONGITUD_CROMOSOMA = 16). Acá el genoma se describe con un esquema: una lista de campos
+# (nombre y valores posibles) de los que se calculan solos el ancho en bits de cada
+# campo y su posición. Así se pueden agregar atributos, usar más niveles por atributo
+# (campos de 3 o más bits) o juntar varios perfiles en un mismo genoma (por ejemplo una
+# pareja de pilotos), con genomas de cientos de bits.
+#
+# Representación: una población es un arreglo (N, palabras) uint64. El bit 0 del genoma
+# es el más significativo de la palabra 0 (misma convención que empaquetar_cromosoma),
+# así el entero de Python del genoma es leer todos sus bits en binario. Un campo nunca
+# cruza el límite entre dos palabras: si no entra en lo que queda de una, empieza en la
+# siguiente (los bits que quedan en el medio no se usan). Así decodificar un campo es
+# siempre un desplazamiento y una máscara sobre una sola palabra.
+#
+# Los operadores (cruce de dos puntos, mutación por inversión de bits) trabajan sobre
+# las palabras de todos los individuos a la vez. La mutación sortea directamente las
+# posiciones de los bits a invertir (con saltos geométricos, que da exactamente un
+# sorteo independiente con probabilidad indpb por bit), así su costo es proporcional
+# a la cantidad de bits invertidos y no a la longitud del genoma.
+#
+# Si un campo tiene una cantidad de valores que no es potencia de 2 (por ejemplo 5
+# valores en 3 bits), el cruce o la mutación pueden dejar códigos sin valor; reparar()
+# los lleva a un código válido.
+#
+# Uso:
+#   esquema = EsquemaGenoma.desde_atributos(ATRIBUTOS_CONFIG)     # el de config_piloto.py
+#   pareja = EsquemaGenoma.combinar([ESQUEMA_PILOTO, ESQUEMA_PILOTO], ["P1_", "P2_"])
+#   genomas = esquema.poblacion_aleatoria(numpy.random.default_rng(1), 1000)
+#   esquema.decodificar(genomas[0])   -> {"A1_Experiencia": "Veterano", ...}
+
+import numpy
+
+from config_piloto import ATRIBUTOS_CONFIG
+
+BITS_PALABRA = 64
+_UNOS = numpy.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+class EsquemaGenoma:
+    """
+    Campos del genoma con su ancho en bits y su posición calculados a partir de la
+    cantidad de valores de cada uno. campos es una lista de (nombre, valores), con
+    los valores en el orden de su código (0, 1, 2, ...).
+    """
+
+    def __init__(self, campos):
+        self.nombres = []
+        self.valores = []
+        # (nombre, inicio_bit, num_bits) por campo, como ORDEN_ATRIBUTOS
+        self.orden = []
+        # (palabra, desplazamiento, mascara) por campo, para leerlo de su palabra
+        self._lectura = []
+
+        inicio_bit = 0
+        for nombre, valores in campos:
+            valores = list(valores)
+            if nombre in self.nombres:
+                raise ValueError(f"Campo repetido en el esquema: {nombre}")
+            if len(valores) < 2:
+                raise ValueError(f"El campo {nombre} necesita al menos 2 valores.")
+            num_bits = (len(valores) - 1).bit_length()
+            if num_bits > BITS_PALABRA:
+                raise ValueError(f"El campo {nombre} no entra en una palabra de {BITS_PALABRA} bits.")
+            libres = BITS_PALABRA - inicio_bit % BITS_PALABRA
+            if num_bits > libres:
+                inicio_bit += libres
+            self.nombres.append(nombre)
+            self.valores.append(valores)
+            self.orden.append((nombre, inicio_bit, num_bits))
+            self._lectura.append((inicio_bit // BITS_PALABRA,
+                                  numpy.uint64(BITS_PALABRA - inicio_bit % BITS_PALABRA - num_bits),
+                                  numpy.uint64((1 << num_bits) - 1)))
+            inicio_bit += num_bits
+
+        self.longitud = inicio_bit
+        self.palabras = max(1, -(-self.longitud // BITS_PALABRA))
+        self.niveles = numpy.array([len(valores) for valores in self.valores], dtype=numpy.uint64)
+        # Palabra, desplazamiento y máscara de cada campo como arreglos, para leer todos de una vez
+        self._palabra_campo = numpy.array([palabra for palabra, _, _ in self._lectura], dtype=numpy.intp)
+        self._desplazamiento_campo = numpy.array([d for _, d, _ in self._lectura], dtype=numpy.uint64)
+        self._mascara_campo = numpy.array([m for _, _, m in self._lectura], dtype=numpy.uint64)
+        # Campos con códigos sin valor (menos de 2^bits valores), que hay que reparar
+        self._incompletos = numpy.array([i for i, (valores, (_, _, num_bits)) in enumerate(zip(self.valores, self.orden))
+                                         if len(valores) != 1 << num_bits], dtype=numpy.intp)
+        # Bits que pertenecen a algún campo, por palabra (los huecos y el final quedan en 0)
+        self.mascara_bits = numpy.zeros(self.palabras, dtype=numpy.uint64)
+        for palabra, desplazamiento, mascara in self._lectura:
+            self.mascara_bits[palabra] |= mascara << desplazamiento
+
+    @classmethod
+    def desde_atributos(cls, atributos_config):
+        """
+        Esquema a partir de un diccionario como ATRIBUTOS_CONFIG ({nombre: {"bits": valor}}).
+        """
+        campos = []
+        for nombre, valores in atributos_config.items():
+            por_codigo = sorted(valores.items(), key=lambda par: int(par[0], 2))
+            if [int(bits, 2) for bits, _ in por_codigo] != list(range(len(por_codigo))):
+                raise ValueError(f"Los códigos del atributo {nombre} deben ser 0, 1, 2, ... sin huecos.")
+            campos.append((nombre, [valor for _, valor in por_codigo]))
+        return cls(campos)
+
+    @classmethod
+    def combinar(cls, esquemas, prefijos):
+        """
+        Un solo esquema con los campos de varios, uno detrás de otro, con un prefijo
+        por esquema para que los nombres no se repitan (por ejemplo "P1_", "P2_").
+        """
+        return cls([(prefijo + nombre, valores) for esquema, prefijo in zip(esquemas, prefijos)
+                    for nombre, valores in zip(esquema.nombres, esquema.valores)])
+
+    def __len__(self):
+        return len(self.nombres)
+
+    # --- Conversiones ---
+    def codigos(self, genomas):
+        """
+        Arreglo (N, campos) con el código de cada campo de cada genoma.
+        """
+        genomas = numpy.atleast_2d(genomas)
+        return (genomas[:, self._palabra_campo] >> self._desplazamiento_campo) & self._mascara_campo
+
+    def codificar(self, codigos):
+        """
+        Arreglo (N, palabras) de genomas con los códigos (N, campos) dados.
+        """
+        codigos = numpy.atleast_2d(numpy.asarray(codigos, dtype=numpy.uint64))
+        genomas = numpy.zeros((codigos.shape[0], self.palabras), dtype=numpy.uint64)
+        self._combinar_en_palabras(genomas, (codigos & self._mascara_campo) << self._desplazamiento_campo,
+                                   numpy.arange(len(self)))
+        return genomas
+
+    def _combinar_en_palabras(self, genomas, bits_campos, campos):
+        """
+        Aplica con XOR (en el lugar) los bits (N, len(campos)) de los campos dados, ya
+        desplazados a su posición. Los campos vienen en orden, así los de una misma
+        palabra están juntos y se combinan antes con un solo reduceat.
+        """
+        palabras, inicios = numpy.unique(self._palabra_campo[campos], return_index=True)
+        genomas[:, palabras] ^= numpy.bitwise_xor.reduceat(bits_campos, inicios, axis=1)
+
+    def decodificar(self, genoma):
+        """
+        Diccionario {campo: valor legible} de un genoma (una fila de palabras).
+        """
+        codigos = self.codigos(genoma)[0].tolist()
+        return {nombre: valores[codigo % len(valores)]
+                for nombre, valores, codigo in zip(self.nombres, self.valores, codigos)}
+
+    def a_entero(self, genoma):
+        """
+        Entero de Python con los bits del genoma (el bit 0 es el más significativo).
+        """
+        entero = 0
+        for palabra in numpy.asarray(genoma, dtype=numpy.uint64).tolist():
+            entero = (entero << BITS_PALABRA) | palabra
+        return entero >> (self.palabras * BITS_PALABRA - self.longitud)
+
+    def desde_entero(self, entero):
+        """
+        Genoma (una fila de palabras) a partir del entero que devuelve a_entero.
+        """
+        entero <<= self.palabras * BITS_PALABRA - self.longitud
+        palabras = [(entero >> (BITS_PALABRA * (self.palabras - 1 - i))) & int(_UNOS) for i in range(self.palabras)]
+        return numpy.array(palabras, dtype=numpy.uint64)
+
+    # --- Operadores ---
+    def reparar(self, genomas):
+        """
+        Lleva (en el lugar) los códigos sin valor de los campos con menos de 2^bits
+        valores a código % cantidad_de_valores. No hace nada si todos los campos usan
+        todos sus códigos.
+        """
+        campos = self._incompletos
+        if not len(campos):
+            return genomas
+        desplazamientos = self._desplazamiento_campo[campos]
+        codigos = (genomas[:, self._palabra_campo[campos]] >> desplazamientos) & self._mascara_campo[campos]
+        # XOR entre el código actual y el reparado (0 en los que ya eran válidos)
+        cambios = (codigos ^ (codigos % self.niveles[campos])) << desplazamientos
+        self._combinar_en_palabras(genomas, cambios, campos)
+        return genomas
+
+    def poblacion_aleatoria(self, generador, tam_poblacion):
+        """
+        Genomas al azar (cada bit 0 o 1 con la misma probabilidad, luego reparados).
+        """
+        genomas = generador.integers(0, _UNOS, size=(tam_poblacion, self.palabras), dtype=numpy.uint64,
+                                     endpoint=True)
+        genomas &= self.mascara_bits
+        return self.reparar(genomas)
+
+    def cruce_dos_puntos(self, generador, genomas, prob_cruce):
+        """
+        Cruza (en el lugar) los pares 0-1, 2-3, ... con probabilidad prob_cruce,
+        intercambiando los bits entre dos puntos de corte (como tools.cxTwoPoint).
+        Devuelve la máscara de individuos cruzados.
+        """
+        pares = len(genomas) // 2
+        cruzan = numpy.flatnonzero(generador.random(pares) < prob_cruce)
+        punto1 = generador.integers(1, self.longitud + 1, size=len(cruzan))
+        punto2 = generador.integers(1, self.longitud, size=len(cruzan))
+        punto2 = numpy.where(punto2 >= punto1, punto2 + 1, punto2)
+        desde = numpy.minimum(punto1, punto2)[:, None]
+        hasta = numpy.maximum(punto1, punto2)[:, None]
+
+        # Tramo [desde, hasta) recortado a cada palabra, en bits desde el más significativo
+        inicio_palabra = numpy.arange(self.palabras) * BITS_PALABRA
+        local_desde = numpy.clip(desde - inicio_palabra, 0, BITS_PALABRA).astype(numpy.uint64)
+        local_hasta = numpy.clip(hasta - inicio_palabra, 0, BITS_PALABRA).astype(numpy.uint64)
+        # Un desplazamiento de 64 da 0 en NumPy, que es justo lo que hace falta acá
+        mascara = (_UNOS >> local_desde) & ~(_UNOS >> local_hasta)
+
+        pares_a, pares_b = 2 * cruzan, 2 * cruzan + 1
+        diferencia = (genomas[pares_a] ^ genomas[pares_b]) & mascara
+        genomas[pares_a] ^= diferencia
+        genomas[pares_b] ^= diferencia
+
+        cruzados = numpy.zeros(len(genomas), dtype=bool)
+        cruzados[pares_a] = True
+        cruzados[pares_b] = True
+        return cruzados
+
+    def mutacion_flip_bit(self, generador, genomas, prob_mutacion, indpb):
+        """
+        Con probabilidad prob_mutacion, invierte (en el lugar) cada bit del individuo con
+        probabilidad indpb, como tools.mutFlipBit. Devuelve la máscara de individuos mutados.
+        """
+        mutados = generador.random(len(genomas)) < prob_mutacion
+        indices = numpy.flatnonzero(mutados)
+        total_bits = len(indices) * self.longitud
+        if not total_bits or indpb <= 0:
+            return mutados
+
+        # Posiciones (en los bits de los mutados puestos uno detrás de otro) de los bits a
+        # invertir: los saltos entre una y la siguiente son geométricos de parámetro indpb
+        esperados = int(total_bits * indpb + 6 * (total_bits * indpb) ** 0.5 + 16)
+        posiciones = numpy.cumsum(generador.geometric(indpb, size=esperados)) - 1
+        while posiciones[-1] < total_bits:
+            extra = numpy.cumsum(generador.geometric(indpb, size=esperados)) + posiciones[-1]
+            posiciones = numpy.concatenate([posiciones, extra])
+        posiciones = posiciones[:numpy.searchsorted(posiciones, total_bits)]
+
+        individuo, bit = numpy.divmod(posiciones, self.longitud)
+        palabra = individuo * self.palabras + bit // BITS_PALABRA
+        valores = numpy.left_shift(numpy.uint64(1), (BITS_PALABRA - 1 - bit % BITS_PALABRA).astype(numpy.uint64))
+        # Las posiciones están ordenadas: se juntan con OR las que caen en la misma palabra
+        palabras, inicios = numpy.unique(palabra, return_index=True)
+        mascaras = numpy.bitwise_or.reduceat(valores, inicios) if len(inicios) else valores
+
+        seleccion = genomas[indices].reshape(-1)
+        seleccion[palabras] ^= mascaras
+        genomas[indices] = seleccion.reshape(len(indices), self.palabras) & self.mascara_bits
+        return mutados
+
+
+def distancia_hamming(genomas_a, genomas_b):
+    """
+    Cantidad de bits distintos entre genomas (arreglos de palabras, con broadcasting).
+    """
+    return numpy.bitwise_count(numpy.bitwise_xor(genomas_a, genomas_b)).sum(axis=-1, dtype=numpy.int64)
+
+
+# El esquema de config_piloto.py: mismos campos, bits y posiciones que ORDEN_ATRIBUTOS
+ESQUEMA_PILOTO = EsquemaGenoma.desde_atributos(ATRIBUTOS_CONFIG)
+
+# Ejemplo de esquema ampliado: dos atributos nuevos, uno con 5 niveles (3 bits)
+ESQUEMA_EXTENDIDO = EsquemaGenoma(list(zip(ESQUEMA_PILOTO.nombres, ESQUEMA_PILOTO.valores)) + [
+    ("A9_ManejoNeumaticos", ["Agresivo con los Neumáticos", "Normal", "Cuidadoso", "Excepcional"]),
+    ("A10_RitmoLluvia", ["Muy Lento", "Lento", "Normal", "Rápido", "Especialista en Lluvia"]),
+])
+
+
+# --- Bloque Principal: rendimiento según el tamaño del genoma ---
+if __name__ == "__main__":
+    import time
+
+    generador = numpy.random.default_rng(1)
+    tam_poblacion = 100_000
+    print(f"{'Pilotos':>8} {'Bits':>6} {'Palabras':>9} {'Operadores (ns/individuo)':>26} "
+          f"{'Decodificación (ns/campo)':>26}")
+    for pilotos in (1, 4, 16, 64):
+        esquema = EsquemaGenoma.combinar([ESQUEMA_EXTENDIDO] * pilotos, [f"P{i + 1}_" for i in range(pilotos)])
+        genomas = esquema.poblacion_aleatoria(generador, tam_poblacion)
+        inicio = time.perf_counter()
+        esquema.cruce_dos_puntos(generador, genomas, 0.7)
+        # indpb escalado para invertir en promedio tantos bits como 0.05 en 16 bits
+        esquema.mutacion_flip_bit(generador, genomas, 0.3, 0.8 / esquema.longitud)
+        esquema.reparar(genomas)
+        tiempo_operadores = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        esquema.codigos(genomas)
+        tiempo_codigos = time.perf_counter() - inicio
+        print(f"{pilotos:>8} {esquema.longitud:>6} {esquema.palabras:>9} "
+              f"{1e9 * tiempo_operadores / tam_poblacion:>26.0f} "
+              f"{1e9 * tiempo_codigos / (tam_poblacion * len(esquema)):>26.1f}")
@@ -0,0 +1,173 @@
+# --- Evaluación Incremental de la Aptitud ---
+# Una mutación con mutFlipBit (indpb=0.05) casi siempre cambia un solo atributo de 2
+# bits, pero evaluar_aptitud_piloto_nueva vuelve a revisar todas las reglas BI/BD/INC.
+#
+# EvaluadorIncremental usa las tablas de reglas de reglas_piloto.py y:
+#   * arma un índice atributo -> reglas que lo leen (indice_dependencias)
+#   * guarda en cada individuo el aporte de cada regla y la suma total
+#   * al evaluar un hijo (que heredó esos datos al clonarse del padre) compara sus
+#     atributos con los que tenía el padre y recalcula solo las reglas que leen algún
+#     atributo que cambió, sumando la diferencia al total
+#
+# Cada regla se precompila a una tabla con su aporte para cada combinación de valores
+# de los atributos que lee (como mucho 4^5 entradas), así recalcularla es un acceso.
+# El resultado es exactamente el mismo que el de la función original. Sirve sobre todo
+# cuando hay muchas reglas (cientos); con las ~40 de cada función la mejora es chica.
+#
+# Uso (en piloto_ideal_ag.py):
+#   crear_contexto(EvaluadorIncremental(REGLAS_NUEVA))
+
+import hashlib
+import itertools
+
+import numpy
+
+from config_piloto import ORDEN_ATRIBUTOS
+from reglas_piloto import INDICE_ATRIBUTO, MotorReglas
+
+
+def atributos_de_regla(regla):
+    """
+    Devuelve los índices (en ORDEN_ATRIBUTOS) de los atributos que lee una regla.
+    """
+    if "puntos" in regla:
+        return (INDICE_ATRIBUTO[regla["atributo"]],)
+    indices = set()
+    for condicion in regla.get("conteo", []) + regla.get("si", []):
+        for nombre_attr, _ in (condicion if isinstance(condicion, list) else [condicion]):
+            indices.add(INDICE_ATRIBUTO[nombre_attr])
+    return tuple(sorted(indices))
+
+
+def indice_dependencias(reglas):
+    """
+    Devuelve una lista con, para cada atributo de ORDEN_ATRIBUTOS, los índices de
+    las reglas que lo leen.
+    """
+    dependencias = [[] for _ in ORDEN_ATRIBUTOS]
+    for indice_regla, regla in enumerate(reglas):
+        for indice_attr in atributos_de_regla(regla):
+            dependencias[indice_attr].append(indice_regla)
+    return dependencias
+
+
+def _tabla_aportes(regla, atributos):
+    """
+    Aporte de la regla (sin recortar) para cada combinación de códigos de sus
+    atributos, indexado por codigo[0] * base + codigo[1] * ... (ver _aporte).
+    """
+    rangos = [range(1 << ORDEN_ATRIBUTOS[i][2]) for i in atributos]
+    combinaciones = list(itertools.product(*rangos))
+    codigos = numpy.zeros((len(combinaciones), len(ORDEN_ATRIBUTOS)), dtype=numpy.uint8)
+    codigos[:, list(atributos)] = combinaciones
+    return MotorReglas([regla]).puntuar(codigos, recortar=False).tolist()
+
+
+def codigos_individuo(individuo):
+    """
+    Códigos (0-3) de los atributos de un individuo (lista de bits o IndividuoCompacto).
+    """
+    genotipo = getattr(individuo, "genotipo", None)
+    if genotipo is not None:
+        from cromosoma_compacto import decodificar_genotipo
+        return decodificar_genotipo(genotipo)
+    codigos = []
+    for _, inicio_bit, num_bits in ORDEN_ATRIBUTOS:
+        codigo = 0
+        for bit in individuo[inicio_bit:inicio_bit + num_bits]:
+            codigo = (codigo << 1) | bit
+        codigos.append(codigo)
+    return tuple(codigos)
+
+
+class EstadoReglas:
+    """
+    Códigos de atributos, aporte de cada regla y total de un individuo ya evaluado.
+    No se modifica nunca, así que al clonar el individuo (deepcopy) el hijo comparte
+    el mismo objeto en lugar de copiar los aportes.
+    """
+
+    __slots__ = ("codigos", "aportes", "total")
+
+    def __init__(self, codigos, aportes, total):
+        self.codigos = codigos
+        self.aportes = aportes
+        self.total = total
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class EvaluadorIncremental:
+    """
+    Función de evaluación para la toolbox que recalcula solo las reglas afectadas
+    por los atributos que cambiaron respecto del padre. El estado de cada individuo
+    se guarda en su atributo estado_reglas (un EstadoReglas); los individuos que no
+    admiten atributos nuevos (IndividuoCompacto) se evalúan siempre completos.
+    """
+
+    def __init__(self, reglas):
+        self.reglas = reglas
+        self.atributos = [atributos_de_regla(regla) for regla in reglas]
+        self.dependencias = indice_dependencias(reglas)
+        self.tablas = [_tabla_aportes(regla, atributos) for regla, atributos in zip(reglas, self.atributos)]
+        # Para cada regla, (indice_atributo, multiplicador) para armar el índice en su tabla
+        self._pasos = []
+        for atributos in self.atributos:
+            pasos, multiplicador = [], 1
+            for indice_attr in reversed(atributos):
+                pasos.append((indice_attr, multiplicador))
+                multiplicador <<= ORDEN_ATRIBUTOS[indice_attr][2]
+            self._pasos.append(pasos)
+        self._firma = hashlib.sha1(repr(reglas).encode()).hexdigest()[:16]
+        # Contadores
+        self.completas = 0
+        self.incrementales = 0
+        self.reglas_evaluadas = 0
+
+    def __repr__(self):
+        # Estable entre procesos, para que huella_funcion (cache_aptitud.py) dependa de las reglas
+        return f"EvaluadorIncremental({self._firma})"
+
+    def _aporte(self, indice_regla, codigos):
+        indice = 0
+        for indice_attr, multiplicador in self._pasos[indice_regla]:
+            indice += codigos[indice_attr] * multiplicador
+        return self.tablas[indice_regla][indice]
+
+    def aportes(self, codigos):
+        """
+        Aporte de cada regla (sin recortar) para los códigos de atributos dados.
+        """
+        return [self._aporte(r, codigos) for r in range(len(self.reglas))]
+
+    def __call__(self, individuo):
+        codigos = codigos_individuo(individuo)
+        estado = getattr(individuo, "estado_reglas", None)
+
+        if estado is None:
+            aportes = self.aportes(codigos)
+            total = sum(aportes)
+            self.completas += 1
+            self.reglas_evaluadas += len(aportes)
+        else:
+            aportes, total = estado.aportes, estado.total
+            afectadas = set()
+            for indice_attr, (codigo, previo) in enumerate(zip(codigos, estado.codigos)):
+                if codigo != previo:
+                    afectadas.update(self.dependencias[indice_attr])
+            self.incrementales += 1
+            self.reglas_evaluadas += len(afectadas)
+            if not afectadas:
+                return (max(total, 0),)
+            aportes = list(aportes)
+            for r in afectadas:
+                nuevo = self._aporte(r, codigos)
+                total += nuevo - aportes[r]
+                aportes[r] = nuevo
+
+        try:
+            individuo.estado_reglas = EstadoReglas(codigos, aportes, total)
+        except AttributeError:
+            pass
+        return (max(total, 0),)
@@ -0,0 +1,172 @@
+# --- Evaluación con Varios Modelos de Aptitud en una Sola Pasada ---
+# Para comparar evaluar_aptitud_piloto (original) con evaluar_aptitud_piloto_nueva había
+# que correr el AG dos veces y decodificar cada cromosoma dos veces. EvaluadorMultiple
+# decodifica cada genotipo una sola vez (a los códigos 0-3 de sus atributos) y lo
+# puntúa con todas las tablas de reglas registradas (ver reglas_piloto.py). El AG
+# se guía solo por el modelo primario; los demás se miran en el logbook:
+#   avg_<modelo>, max_<modelo> -> aptitud de la población según cada modelo secundario
+#   rho_<modelo>               -> correlación de Spearman entre el orden de la población
+#                                 según el primario y según ese modelo (1 = mismo orden;
+#                                 vacío si uno de los dos no distingue a nadie)
+#
+# Los puntajes de cada genotipo se guardan en una tabla (65.536 x modelos) que se
+# llena a medida que aparecen genotipos nuevos, así cada genotipo se decodifica y
+# puntúa una sola vez en toda la corrida. Los individuos con aptitud inválida de una
+# generación se evalúan juntos: registrar() pone EvaluadorMultiple.map como
+# toolbox.map, que ea_simple (y algorithms.eaSimple) usa para evaluar.
+#
+# Uso:
+#   evaluador = EvaluadorMultiple(["nueva", "original"], primario="nueva")
+#   contexto = crear_contexto(evaluador, usar_cache=False)
+#   evaluador.registrar(contexto)
+#   ejecutar_ag(contexto=contexto)
+#   evaluador.puntajes(poblacion)   -> arreglo (N, modelos)
+#   python piloto_ideal_ag.py --comparar original
+
+import hashlib
+
+import numpy
+
+from config_piloto import LONGITUD_CROMOSOMA
+from diversidad import genotipos_poblacion
+from reglas_piloto import MotorReglas, codigos_desde_enteros, compilar_reglas, obtener_motor
+
+
+def rangos(valores):
+    """
+    Rango (desde 1) de cada valor, con el rango promedio para los empates.
+    """
+    _, inversa, cuentas = numpy.unique(valores, return_inverse=True, return_counts=True)
+    acumuladas = numpy.cumsum(cuentas)
+    return (acumuladas - (cuentas - 1) / 2)[inversa]
+
+
+def correlacion_rangos(x, y):
+    """
+    Correlación de Spearman (con empates) entre dos arreglos, o None si alguno es constante.
+    """
+    rx, ry = rangos(x), rangos(y)
+    rx, ry = rx - rx.mean(), ry - ry.mean()
+    denominador = numpy.sqrt((rx @ rx) * (ry @ ry))
+    return float(rx @ ry / denominador) if denominador else None
+
+
+class EvaluadorMultiple:
+    """
+    Función de evaluación para DEAP que puntúa cada genotipo con varios modelos
+    (tablas de reglas) a la vez y devuelve la aptitud del primario.
+    """
+
+    def __init__(self, modelos=("nueva", "original"), primario=None):
+        # modelos: nombres de REGLAS_POR_FUNCION o un diccionario nombre -> reglas (o MotorReglas)
+        if not isinstance(modelos, dict):
+            modelos = {nombre: obtener_motor(nombre) for nombre in modelos}
+        self.motores = {nombre: motor if isinstance(motor, MotorReglas) else compilar_reglas(motor)
+                        for nombre, motor in modelos.items()}
+        self.nombres = list(self.motores)
+        self.primario = primario if primario is not None else self.nombres[0]
+        if self.primario not in self.motores:
+            raise ValueError(f"El modelo primario {self.primario!r} no está entre los modelos {self.nombres}.")
+        self.secundarios = [nombre for nombre in self.nombres if nombre != self.primario]
+        self._columna_primario = self.nombres.index(self.primario)
+
+        self._tabla = numpy.zeros((1 << LONGITUD_CROMOSOMA, len(self.nombres)), dtype=numpy.int32)
+        self._calculados = numpy.zeros(1 << LONGITUD_CROMOSOMA, dtype=bool)
+        self.evaluaciones = 0  # genotipos distintos decodificados y puntuados
+
+        reglas = [(nombre, self.motores[nombre].reglas) for nombre in self.nombres]
+        self._firma = hashlib.sha1(repr((self.primario, reglas)).encode()).hexdigest()[:16]
+
+    def __repr__(self):
+        # Estable entre procesos, para que huella_funcion (cache_aptitud.py) dependa de las reglas
+        return f"EvaluadorMultiple({self._firma})"
+
+    # --- Puntuación ---
+    def puntuar_genotipos(self, genotipos):
+        """
+        Arreglo (N, modelos) con los puntajes de cada genotipo empaquetado.
+        """
+        genotipos = numpy.asarray(genotipos, dtype=numpy.int64)
+        nuevos = numpy.unique(genotipos[~self._calculados[genotipos]])
+        if len(nuevos):
+            codigos = codigos_desde_enteros(nuevos)
+            for columna, nombre in enumerate(self.nombres):
+                self._tabla[nuevos, columna] = self.motores[nombre].puntuar(codigos)
+            self._calculados[nuevos] = True
+            self.evaluaciones += len(nuevos)
+        return self._tabla[genotipos]
+
+    def puntajes(self, individuos):
+        """
+        Arreglo (N, modelos) con los puntajes de cada individuo (columnas en el orden de nombres).
+        """
+        return self.puntuar_genotipos(genotipos_poblacion(individuos))
+
+    def __call__(self, individuo):
+        return (int(self.puntajes([individuo])[0, self._columna_primario]),)
+
+    def map(self, funcion, individuos):
+        """
+        Reemplazo de toolbox.map: si se mapea este evaluador, puntúa todos los
+        individuos juntos; cualquier otra función se mapea normalmente.
+        """
+        # toolbox.register guarda el evaluador dentro de un functools.partial
+        if getattr(funcion, "func", funcion) is not self:
+            return map(funcion, individuos)
+        individuos = list(individuos)
+        if not individuos:
+            return []
+        return [(aptitud,) for aptitud in self.puntajes(individuos)[:, self._columna_primario].tolist()]
+
+    # --- Estadísticas por modelo ---
+    def columnas(self):
+        """
+        Columnas que agrega al logbook (ver el comentario del módulo).
+        """
+        return [f"{columna}_{nombre}" for nombre in self.secundarios for columna in ("avg", "max", "rho")]
+
+    def estadisticas(self, poblacion):
+        """
+        Valores de columnas() para una población.
+        """
+        puntajes = self.puntajes(poblacion)
+        primario = puntajes[:, self._columna_primario]
+        registro = {}
+        for nombre in self.secundarios:
+            valores = puntajes[:, self.nombres.index(nombre)]
+            registro[f"avg_{nombre}"] = float(valores.mean())
+            registro[f"max_{nombre}"] = int(valores.max())
+            rho = correlacion_rangos(primario, valores)
+            registro[f"rho_{nombre}"] = "" if rho is None else rho
+        return registro
+
+    def registrar(self, contexto):
+        """
+        Conecta el evaluador a un ContextoAG (piloto_ideal_ag.py) creado con
+        crear_contexto(evaluador, usar_cache=False): evaluación por lotes con
+        toolbox.map y las columnas por modelo en las estadísticas.
+        """
+        if contexto.toolbox.evaluate is not self and getattr(contexto.toolbox.evaluate, "func", None) is not self:
+            raise ValueError("El contexto tiene que evaluar con este EvaluadorMultiple (y sin cache de aptitud).")
+        contexto.toolbox.register("map", self.map)
+        contexto.stats = EstadisticasModelos(contexto.stats, self)
+
+
+class EstadisticasModelos:
+    """
+    tools.Statistics con las columnas por modelo de un EvaluadorMultiple agregadas
+    al final (ea_simple solo usa fields y compile).
+    """
+
+    def __init__(self, stats, evaluador):
+        self.stats = stats
+        self.evaluador = evaluador
+
+    @property
+    def fields(self):
+        return list(self.stats.fields) + self.evaluador.columnas()
+
+    def compile(self, poblacion):
+        registro = self.stats.compile(poblacion)
+        registro.update(self.evaluador.estadisticas(poblacion))
+        return registro
@@ -0,0 +1,40 @@
+# --- Gráfico de la Evolución ---
+# Dibuja la aptitud promedio por generación, a partir del logbook de una corrida o
+# de un registro JSONL/CSV escrito con registro_corrida.py. matplotlib se importa
+# recién al graficar, así las corridas sin gráfico (servidores, barridos) no lo cargan.
+#
+# Uso:
+#   python graficar_piloto.py corrida.jsonl [grafico_piloto.png]
+
+
+def graficar_evolucion(registros, ruta_imagen="grafico_piloto.png"):
+    """
+    Grafica la aptitud promedio por generación y guarda la imagen. Acepta un
+    logbook o cualquier iterable de registros con las columnas "gen" y "avg".
+    """
+    import matplotlib.pyplot as plt
+
+    gen, avg_fitness = [], []
+    for registro in registros:
+        gen.append(registro["gen"])
+        avg_fitness.append(registro["avg"])
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(gen, avg_fitness, label="Aptitud Promedio", color='red')
+    plt.xlabel("Generación")
+    plt.ylabel("Aptitud")
+    plt.legend(loc="lower right")
+    plt.title("Evolución de la Aptitud a lo largo de las Generaciones")
+    plt.grid(True)
+    plt.savefig(ruta_imagen)
+    plt.close()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    import sys
+    from registro_corrida import leer_registro
+
+    if len(sys.argv) < 2:
+        sys.exit("Uso: python graficar_piloto.py corrida.jsonl [grafico_piloto.png]")
+    graficar_evolucion(leer_registro(sys.argv[1]), *sys.argv[2:3])
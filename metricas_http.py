@@ -0,0 +1,251 @@
+# --- Métricas en Vivo por HTTP (formato Prometheus) ---
+# Durante un barrido largo la única forma de ver el avance era el stdout de verbose=True.
+# Este módulo expone, solo con la biblioteca estándar, un endpoint HTTP local
+# (http://127.0.0.1:<puerto>/metrics) con el texto que lee Prometheus:
+#   ag_generacion, ag_evaluaciones_total, ag_evaluaciones_por_segundo, ag_aptitud_mejor,
+#   ag_aptitud_promedio, ag_genotipo_mejor, ag_cache_aciertos_total, ag_cache_fallos_total,
+#   ag_cache_tasa_aciertos, ag_corridas_terminadas_total, ag_trabajador_activo y
+#   ag_ultima_actualizacion_segundos, todas con la etiqueta trabajador="<n>", más
+#   ag_trabajadores y ag_corridas_planeadas.
+#
+# Sin locks en el bucle del AG: TablaMetricas es un arreglo de doubles en memoria
+# compartida (multiprocessing.RawArray) con una fila por trabajador. Cada trabajador
+# escribe solo su fila y el servidor (un hilo del proceso principal) la lee cuando
+# llega un pedido; como mucho puede ver una fila a medio actualizar, que en la
+# siguiente lectura ya está completa. Además SumideroMetricas (un sumidero de
+# ea_simple, ver registro_corrida.py) acumula las generaciones y publica la fila cada
+# `intervalo` segundos y al terminar la corrida.
+#
+# Uso:
+#   python piloto_ideal_ag.py --metricas-puerto 9100
+#   python barrido_parametros.py --torneo 3 10 40 --metricas-puerto 9100
+#   curl http://127.0.0.1:9100/metrics    (o leer_metricas("http://127.0.0.1:9100/metrics"))
+
+import math
+import multiprocessing
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config_piloto import empaquetar_cromosoma
+
+# Columnas de cada fila de la tabla
+CAMPOS = ("generacion", "evaluaciones", "evaluaciones_por_segundo", "mejor", "promedio", "genotipo_mejor",
+          "aciertos", "fallos", "corridas", "activo", "actualizado")
+_POSICION = {campo: i for i, campo in enumerate(CAMPOS)}
+
+# (nombre, tipo, ayuda, campo de la fila)
+METRICAS = [
+    ("ag_generacion", "gauge", "Generación actual de la corrida en curso.", "generacion"),
+    ("ag_evaluaciones_total", "counter", "Evaluaciones hechas por el trabajador.", "evaluaciones"),
+    ("ag_evaluaciones_por_segundo", "gauge", "Evaluaciones por segundo de la corrida en curso.",
+     "evaluaciones_por_segundo"),
+    ("ag_aptitud_mejor", "gauge", "Mejor aptitud del salón de la fama de la corrida.", "mejor"),
+    ("ag_aptitud_promedio", "gauge", "Aptitud promedio de la población.", "promedio"),
+    ("ag_genotipo_mejor", "gauge", "Genotipo empaquetado del mejor del salón de la fama.", "genotipo_mejor"),
+    ("ag_cache_aciertos_total", "counter", "Aciertos de la cache de aptitud.", "aciertos"),
+    ("ag_cache_fallos_total", "counter", "Evaluaciones reales de la cache de aptitud.", "fallos"),
+    ("ag_corridas_terminadas_total", "counter", "Corridas terminadas por el trabajador.", "corridas"),
+    ("ag_trabajador_activo", "gauge", "1 si el trabajador está en una corrida.", "activo"),
+    ("ag_ultima_actualizacion_segundos", "gauge", "Hora (Unix) de la última publicación.", "actualizado"),
+]
+
+
+def _formato(valor):
+    if math.isnan(valor):
+        return "NaN"
+    return str(int(valor)) if valor.is_integer() else repr(valor)
+
+
+class TablaMetricas:
+    """
+    Una fila de doubles en memoria compartida por trabajador (ver el comentario del módulo).
+    """
+
+    def __init__(self, trabajadores=1):
+        self.trabajadores = trabajadores
+        self.corridas_planeadas = None
+        self.arreglo = multiprocessing.RawArray("d", trabajadores * len(CAMPOS))
+        for i in range(trabajadores):
+            self.publicar(i, {"mejor": math.nan, "promedio": math.nan, "genotipo_mejor": math.nan})
+
+    def publicar(self, indice, valores):
+        """
+        Escribe en la fila indice los campos de valores (sin lock: solo la escribe su trabajador).
+        """
+        base = indice * len(CAMPOS)
+        for campo, valor in valores.items():
+            self.arreglo[base + _POSICION[campo]] = valor
+
+    def fila(self, indice):
+        base = indice * len(CAMPOS)
+        return dict(zip(CAMPOS, self.arreglo[base:base + len(CAMPOS)]))
+
+    def texto(self):
+        """
+        Todas las métricas en el formato de texto de Prometheus.
+        """
+        filas = [self.fila(i) for i in range(self.trabajadores)]
+        lineas = ["# HELP ag_trabajadores Trabajadores con fila de métricas.", "# TYPE ag_trabajadores gauge",
+                  f"ag_trabajadores {self.trabajadores}"]
+        if self.corridas_planeadas is not None:
+            lineas += ["# HELP ag_corridas_planeadas Corridas del barrido.", "# TYPE ag_corridas_planeadas gauge",
+                       f"ag_corridas_planeadas {self.corridas_planeadas}"]
+        for nombre, tipo, ayuda, campo in METRICAS:
+            lineas += [f"# HELP {nombre} {ayuda}", f"# TYPE {nombre} {tipo}"]
+            lineas += [f'{nombre}{{trabajador="{i}"}} {_formato(fila[campo])}' for i, fila in enumerate(filas)]
+        lineas += ["# HELP ag_cache_tasa_aciertos Aciertos / consultas de la cache de aptitud.",
+                   "# TYPE ag_cache_tasa_aciertos gauge"]
+        for i, fila in enumerate(filas):
+            consultas = fila["aciertos"] + fila["fallos"]
+            tasa = fila["aciertos"] / consultas if consultas else math.nan
+            lineas.append(f'ag_cache_tasa_aciertos{{trabajador="{i}"}} {_formato(tasa)}')
+        return "\n".join(lineas) + "\n"
+
+
+# --- Lado del AG ---
+class SumideroMetricas:
+    """
+    Sumidero para ea_simple que publica en la fila indice de una TablaMetricas, como
+    mucho cada intervalo segundos.
+    """
+
+    def __init__(self, tabla, indice=0, intervalo=0.5):
+        self.tabla = tabla
+        self.indice = indice
+        self.intervalo = intervalo
+        # Totales del trabajador (entre corridas)
+        self._valores = {"evaluaciones": 0, "aciertos": 0, "fallos": 0, "corridas": 0}
+        self.iniciar_corrida()
+
+    def iniciar_corrida(self):
+        # Los valores de la corrida anterior no se arrastran: una corrida que se sirve
+        # del almacén (sin salón de la fama) toma su mejor solo de sus registros
+        self._valores.update(generacion=0, mejor=math.nan, promedio=math.nan, genotipo_mejor=math.nan)
+        self._inicio = time.perf_counter()
+        self._evaluaciones_corrida = 0
+        self._publicado = None
+
+    def escribir(self, registro, halloffame=None):
+        valores = self._valores
+        valores["generacion"] = registro["gen"]
+        valores["evaluaciones"] += registro.get("nevals", 0) + registro.get("evals_locales", 0)
+        self._evaluaciones_corrida += registro.get("nevals", 0) + registro.get("evals_locales", 0)
+        valores["aciertos"] += registro.get("aciertos", 0)
+        valores["fallos"] += registro.get("fallos", 0)
+        if "avg" in registro:
+            valores["promedio"] = float(registro["avg"])
+        if halloffame is not None and len(halloffame):
+            mejor = halloffame[0]
+            valores["mejor"] = mejor.fitness.values[0]
+            genotipo = getattr(mejor, "genotipo", None)
+            valores["genotipo_mejor"] = genotipo if genotipo is not None else empaquetar_cromosoma(mejor)
+        elif "max" in registro:
+            mejor = valores["mejor"]
+            valores["mejor"] = float(registro["max"]) if math.isnan(mejor) else max(float(registro["max"]), mejor)
+        ahora = time.perf_counter()
+        if self._publicado is None or ahora - self._publicado >= self.intervalo:
+            self._publicar(ahora, activo=1)
+
+    def _publicar(self, ahora, activo):
+        self._publicado = ahora
+        transcurrido = ahora - self._inicio
+        self._valores.update(activo=activo, actualizado=time.time(),
+                             evaluaciones_por_segundo=self._evaluaciones_corrida / transcurrido if transcurrido else 0.0)
+        self.tabla.publicar(self.indice, self._valores)
+
+    def terminar_corrida(self):
+        """
+        Publica el estado final de la corrida y deja el trabajador como inactivo.
+        """
+        self._valores["corridas"] += 1
+        self._publicar(time.perf_counter(), activo=0)
+
+    def cerrar(self):
+        self.terminar_corrida()
+
+
+# Trabajador de un pool de procesos (ver conectar_trabajador)
+_TRABAJADOR = None
+
+
+def conectar_trabajador(tabla, contador):
+    """
+    Inicializador de los procesos de un pool: toma la siguiente fila libre de la tabla.
+    """
+    global _TRABAJADOR
+    with contador.get_lock():
+        indice = contador.value
+        contador.value += 1
+    _TRABAJADOR = SumideroMetricas(tabla, indice)
+
+
+def sumidero_trabajador():
+    """
+    Sumidero del proceso actual si se conectó con conectar_trabajador, o None.
+    """
+    return _TRABAJADOR
+
+
+# --- Servidor ---
+class ServidorMetricas:
+    """
+    Servidor HTTP en un hilo aparte que responde GET /metrics con tabla.texto().
+    Con puerto 0 el sistema elige uno libre (ver url).
+    """
+
+    def __init__(self, tabla, puerto=9100, host="127.0.0.1"):
+        class Manejador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                cuerpo = tabla.texto().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(cuerpo)))
+                self.end_headers()
+                self.wfile.write(cuerpo)
+
+            def log_message(self, *_):
+                pass
+
+        self.tabla = tabla
+        self._servidor = ThreadingHTTPServer((host, puerto), Manejador)
+        self._servidor.daemon_threads = True
+        self._hilo = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._hilo.start()
+
+    @property
+    def url(self):
+        host, puerto = self._servidor.server_address[:2]
+        return f"http://{host}:{puerto}/metrics"
+
+    def cerrar(self):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+
+def leer_metricas(url, tiempo_maximo=5):
+    """
+    Pide el endpoint y devuelve {(nombre, etiquetas): valor}, con etiquetas como
+    tupla de pares (por ejemplo (("trabajador", "0"),)).
+    """
+    with urllib.request.urlopen(url, timeout=tiempo_maximo) as respuesta:
+        texto = respuesta.read().decode("utf-8")
+    metricas = {}
+    for linea in texto.splitlines():
+        if not linea or linea.startswith("#"):
+            continue
+        nombre_etiquetas, valor = linea.rsplit(" ", 1)
+        nombre, _, etiquetas = nombre_etiquetas.partition("{")
+        pares = tuple(tuple(par.split("=", 1)) for par in etiquetas.rstrip("}").split(",") if par)
+        metricas[(nombre, tuple((clave, valor_etiqueta.strip('"')) for clave, valor_etiqueta in pares))] = float(valor)
+    return metricas
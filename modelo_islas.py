@@ -0,0 +1,268 @@
+# --- Modelo de Islas ---
+# En lugar de una sola población, evolucionan varias subpoblaciones ("islas"), cada una
+# en su propio proceso, con los mismos operadores que arma crear_contexto() en
+# piloto_ideal_ag.py. Cada cierto número de generaciones las islas intercambian a sus
+# mejores individuos (migración), que reemplazan a los peores de la isla que los recibe.
+# Así se mantiene la diversidad que el torneo grande (tournsize=40) hace perder rápido.
+#
+# Topologías:
+#   * "anillo":   la isla i envía sus migrantes solo a la isla i+1
+#   * "completa": cada isla envía sus migrantes a todas las demás
+#
+# La migración es sincrónica: cada isla espera a recibir los migrantes de todos sus
+# vecinos antes de seguir. Con la misma semilla el resultado es el mismo en paralelo
+# o en un solo proceso (en_paralelo=False), que es útil para depurar.
+#
+# Uso:
+#   python modelo_islas.py --islas 4 --tam-isla 50 --topologia anillo --intervalo 10 --migrantes 2
+
+import argparse
+import os
+import random
+import traceback
+import multiprocessing
+
+import numpy
+from deap import algorithms, tools
+
+from cache_aptitud import COLUMNAS_CACHE
+
+TOPOLOGIAS = ("anillo", "completa")
+
+
+def vecinos_destino(topologia, num_islas):
+    """
+    Devuelve, para cada isla, la lista de islas a las que envía migrantes.
+    """
+    if topologia == "anillo":
+        return {i: [(i + 1) % num_islas] for i in range(num_islas)} if num_islas > 1 else {0: []}
+    if topologia == "completa":
+        return {i: [j for j in range(num_islas) if j != i] for i in range(num_islas)}
+    raise ValueError(f"Topología desconocida: {topologia} (usar {', '.join(TOPOLOGIAS)}).")
+
+
+def vecinos_origen(topologia, num_islas):
+    """
+    Devuelve, para cada isla, la lista de islas de las que recibe migrantes.
+    """
+    origen = {i: [] for i in range(num_islas)}
+    for i, destinos in vecinos_destino(topologia, num_islas).items():
+        for j in destinos:
+            origen[j].append(i)
+    return origen
+
+
+class Isla:
+    """
+    Una subpoblación que evoluciona igual que en algorithms.eaSimple, pero de a
+    tramos de generaciones, para poder intercambiar migrantes entre tramos.
+    """
+
+    def __init__(self, indice, tam_isla, prob_cruce, prob_mutacion, seleccion, tam_torneo,
+                 tam_salon_fama, semilla):
+        # Cada isla arma su propio contexto (toolbox, estadísticas y cache de aptitud)
+        import piloto_ideal_ag
+        contexto = piloto_ideal_ag.crear_contexto()
+        self.toolbox = contexto.toolbox
+        self.stats = contexto.stats
+        self.cache_aptitud = contexto.cache_aptitud
+        piloto_ideal_ag.registrar_seleccion(self.toolbox, seleccion, tam_torneo)
+
+        self.indice = indice
+        self.prob_cruce = prob_cruce
+        self.prob_mutacion = prob_mutacion
+        self.generacion = 0
+        self.hof = tools.HallOfFame(tam_salon_fama)
+        self.logbook = tools.Logbook()
+        self.logbook.header = (["gen", "isla", "nevals", "migrantes"] + (self.stats.fields if self.stats else []) +
+                               (COLUMNAS_CACHE if self.cache_aptitud is not None else []))
+
+        random.seed(semilla)
+        self.poblacion = self.toolbox.population(n=tam_isla)
+        nevals = self._evaluar(self.poblacion)
+        self.hof.update(self.poblacion)
+        self._registrar(nevals, 0)
+        self.estado_rng = random.getstate()
+
+    def _evaluar(self, individuos):
+        invalidos = [ind for ind in individuos if not ind.fitness.valid]
+        for ind, aptitud in zip(invalidos, self.toolbox.map(self.toolbox.evaluate, invalidos)):
+            ind.fitness.values = aptitud
+        return len(invalidos)
+
+    def _registrar(self, nevals, migrantes):
+        registro = self.stats.compile(self.poblacion) if self.stats else {}
+        if self.cache_aptitud is not None:
+            registro.update(self.cache_aptitud.columnas_generacion())
+        self.logbook.record(gen=self.generacion, isla=self.indice, nevals=nevals, migrantes=migrantes, **registro)
+
+    def evolucionar(self, generaciones):
+        """
+        Avanza la isla la cantidad de generaciones indicada.
+        """
+        random.setstate(self.estado_rng)
+        for _ in range(generaciones):
+            self.generacion += 1
+            descendencia = self.toolbox.select(self.poblacion, len(self.poblacion))
+            descendencia = algorithms.varAnd(descendencia, self.toolbox, self.prob_cruce, self.prob_mutacion)
+            nevals = self._evaluar(descendencia)
+            self.hof.update(descendencia)
+            self.poblacion[:] = descendencia
+            self._registrar(nevals, 0)
+        self.estado_rng = random.getstate()
+
+    def emigrantes(self, cantidad):
+        """
+        Devuelve copias de los mejores individuos de la isla.
+        """
+        return [self.toolbox.clone(ind) for ind in tools.selBest(self.poblacion, cantidad)]
+
+    def recibir(self, migrantes):
+        """
+        Reemplaza a los peores individuos de la isla por los migrantes recibidos.
+        """
+        cantidad = min(len(migrantes), len(self.poblacion))
+        peores = sorted(range(len(self.poblacion)), key=lambda i: self.poblacion[i].fitness)[:cantidad]
+        for posicion, migrante in zip(peores, migrantes):
+            self.poblacion[posicion] = migrante
+        self.hof.update(migrantes)
+        # Dejamos constancia de la migración en el último registro del logbook
+        self.logbook[-1]["migrantes"] = cantidad
+
+
+def _tramos(num_generaciones, intervalo_migracion):
+    """
+    Devuelve la cantidad de generaciones de cada tramo entre migraciones.
+    """
+    tramos = []
+    restantes = num_generaciones
+    while restantes > 0:
+        tramos.append(min(intervalo_migracion, restantes))
+        restantes -= tramos[-1]
+    return tramos
+
+
+def _proceso_isla(indice, parametros, semilla, tramos, num_migrantes, destinos, origenes, bandejas, resultados):
+    """
+    Código que corre en el proceso de cada isla.
+    """
+    try:
+        isla = Isla(indice, semilla=semilla, **parametros)
+        for numero_tramo, generaciones in enumerate(tramos):
+            isla.evolucionar(generaciones)
+            if numero_tramo == len(tramos) - 1:
+                break
+            migrantes = isla.emigrantes(num_migrantes)
+            for destino in destinos:
+                bandejas[destino].put((indice, migrantes))
+            # Ordenamos por isla de origen para que el resultado no dependa de quién llegó primero
+            recibidos = sorted((bandejas[indice].get() for _ in origenes), key=lambda par: par[0])
+            isla.recibir([ind for _, grupo in recibidos for ind in grupo])
+        resultados.put((indice, isla.poblacion, isla.logbook, list(isla.hof), None))
+    except Exception:
+        resultados.put((indice, None, None, None, traceback.format_exc()))
+
+
+def ejecutar_islas(num_islas=4, tam_isla=50, prob_cruce=0.7, prob_mutacion=0.3, num_generaciones=100,
+                   seleccion="torneo", tam_torneo=40, tam_salon_fama=3, topologia="anillo",
+                   intervalo_migracion=10, num_migrantes=2, semilla=None, en_paralelo=True):
+    """
+    Ejecuta el AG con el modelo de islas. Devuelve (poblaciones, logbooks, hof),
+    con una población y un logbook por isla y un salón de la fama global.
+    """
+    destinos = vecinos_destino(topologia, num_islas)
+    origenes = vecinos_origen(topologia, num_islas)
+    tramos = _tramos(num_generaciones, intervalo_migracion)
+    semillas = [int(s.generate_state(1)[0]) for s in numpy.random.SeedSequence(semilla).spawn(num_islas)]
+    parametros = {"tam_isla": tam_isla, "prob_cruce": prob_cruce, "prob_mutacion": prob_mutacion,
+                  "seleccion": seleccion, "tam_torneo": tam_torneo, "tam_salon_fama": tam_salon_fama}
+
+    if en_paralelo:
+        # Para poder recibir los individuos de las islas tienen que existir los tipos de creator
+        from piloto_ideal_ag import crear_tipos
+        crear_tipos()
+        contexto = multiprocessing.get_context()
+        bandejas = [contexto.Queue() for _ in range(num_islas)]
+        resultados = contexto.Queue()
+        procesos = [contexto.Process(target=_proceso_isla,
+                                     args=(i, parametros, semillas[i], tramos, num_migrantes,
+                                           destinos[i], origenes[i], bandejas, resultados))
+                    for i in range(num_islas)]
+        for proceso in procesos:
+            proceso.start()
+        por_isla = {}
+        try:
+            for _ in range(num_islas):
+                indice, poblacion, logbook, hof_isla, error = resultados.get()
+                if error is not None:
+                    raise RuntimeError(f"Falló la isla {indice}:\n{error}")
+                por_isla[indice] = (poblacion, logbook, hof_isla)
+        finally:
+            for proceso in procesos:
+                if proceso.is_alive() and len(por_isla) < num_islas:
+                    proceso.terminate()
+                proceso.join()
+    else:
+        # Las islas avanzan por turnos en este mismo proceso, cada una con su propio estado aleatorio
+        estado_original = random.getstate()
+        islas = [Isla(i, semilla=semillas[i], **parametros) for i in range(num_islas)]
+        for numero_tramo, generaciones in enumerate(tramos):
+            for isla in islas:
+                isla.evolucionar(generaciones)
+            if numero_tramo == len(tramos) - 1:
+                break
+            salientes = {}
+            for isla in islas:
+                random.setstate(isla.estado_rng)
+                salientes[isla.indice] = isla.emigrantes(num_migrantes)
+            for isla in islas:
+                isla.recibir([isla.toolbox.clone(ind)
+                              for origen in sorted(origenes[isla.indice]) for ind in salientes[origen]])
+        random.setstate(estado_original)
+        por_isla = {isla.indice: (isla.poblacion, isla.logbook, list(isla.hof)) for isla in islas}
+
+    hof = tools.HallOfFame(tam_salon_fama)
+    for indice in range(num_islas):
+        hof.update(por_isla[indice][2])
+    poblaciones = [por_isla[i][0] for i in range(num_islas)]
+    logbooks = [por_isla[i][1] for i in range(num_islas)]
+    return poblaciones, logbooks, hof
+
+
+def _argumentos():
+    parser = argparse.ArgumentParser(description="AG con modelo de islas y migración entre procesos.")
+    parser.add_argument("--islas", type=int, default=os.cpu_count())
+    parser.add_argument("--tam-isla", type=int, default=50)
+    parser.add_argument("--generaciones", type=int, default=100)
+    parser.add_argument("--cruce", type=float, default=0.7)
+    parser.add_argument("--mutacion", type=float, default=0.3)
+    parser.add_argument("--seleccion", choices=["torneo", "ruleta"], default="torneo")
+    parser.add_argument("--torneo", type=int, default=40)
+    parser.add_argument("--topologia", choices=TOPOLOGIAS, default="anillo")
+    parser.add_argument("--intervalo", type=int, default=10, help="generaciones entre migraciones")
+    parser.add_argument("--migrantes", type=int, default=2, help="individuos que envía cada isla")
+    parser.add_argument("--semilla", type=int, default=None)
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    from config_piloto import imprimir_perfil_piloto
+
+    argumentos = _argumentos()
+    print(f"Modelo de islas: {argumentos.islas} islas de {argumentos.tam_isla} individuos, "
+          f"topología {argumentos.topologia}, {argumentos.migrantes} migrantes cada {argumentos.intervalo} generaciones")
+    poblaciones, logbooks, salon_fama = ejecutar_islas(
+        num_islas=argumentos.islas, tam_isla=argumentos.tam_isla, prob_cruce=argumentos.cruce,
+        prob_mutacion=argumentos.mutacion, num_generaciones=argumentos.generaciones,
+        seleccion=argumentos.seleccion, tam_torneo=argumentos.torneo, topologia=argumentos.topologia,
+        intervalo_migracion=argumentos.intervalo, num_migrantes=argumentos.migrantes, semilla=argumentos.semilla)
+
+    for logbook in logbooks:
+        ultimo = logbook[-1]
+        print(f"Isla {ultimo['isla']}: max {ultimo['max']}, avg {ultimo['avg']:.2f}, std {ultimo['std']:.2f}")
+
+    for piloto_hof in salon_fama:
+        print("\n --- SUGERENCIA PILOTO CANDIDATO ---")
+        imprimir_perfil_piloto(piloto_hof)
+        print(f"Aptitud del perfil sugerido: {piloto_hof.fitness.values[0]:.2f}")
@@ -0,0 +1,285 @@
+# --- Motor Vectorizado con NumPy ---
+# Alternativa a ejecutar_ag() (piloto_ideal_ag.py) en la que la población entera es un
+# único arreglo de enteros (un cromosoma empaquetado por individuo, ver
+# empaquetar_cromosoma) y cada paso de una generación de eaSimple es una operación
+# sobre todo el arreglo:
+#   * selección por torneo (o ruleta)
+#   * cruce de dos puntos entre los individuos 0-1, 2-3, ... con probabilidad CXPB
+#   * mutación por inversión de bits (indpb=0.05) con probabilidad MUTPB
+#   * evaluación por lotes (por defecto, leyendo la tabla exhaustiva de tabla_aptitud.py)
+#
+# Los operadores siguen las mismas reglas que los de DEAP (mismos puntos de corte
+# posibles, mismas probabilidades), pero usan el generador de NumPy, así que con la
+# misma semilla no dan la misma corrida que ejecutar_ag(). Devuelve un logbook con las
+# mismas columnas y un HallOfFame de IndividuoCompacto, así que sirve el mismo código
+# para imprimir los resultados. Con poblaciones de 10^6 cada generación tarda décimas
+# de segundo en un núcleo.
+#
+# Selección por torneo: el ganador de un torneo de k aspirantes sorteados con reposición
+# es el de mayor aptitud, así que su aptitud tiene distribución F(a)^k, donde F es la
+# proporción de la población con aptitud <= a. Se sortea directamente la aptitud del
+# ganador con esa distribución y después un individuo al azar entre los que la tienen.
+# Es exactamente la misma distribución que sortear los k aspirantes, pero el costo no
+# depende de k (con tournsize=40 y 10^6 individuos serían 4*10^7 sorteos).
+#
+# Uso:
+#   python motor_vectorizado.py --poblacion 1000000 --generaciones 50 --semilla 1
+
+import time
+
+import numpy
+from deap import tools
+
+from config_piloto import LONGITUD_CROMOSOMA
+
+INDPB = 0.05  # mismo valor que toolbox.register("mutate", tools.mutFlipBit, indpb=0.05)
+
+
+def _tipo_genotipo(longitud=LONGITUD_CROMOSOMA):
+    """
+    Tipo entero sin signo más chico en el que entra un cromosoma de esa longitud.
+    """
+    for tipo in (numpy.uint8, numpy.uint16, numpy.uint32, numpy.uint64):
+        if numpy.iinfo(tipo).bits >= longitud:
+            return tipo
+    raise ValueError(f"Cromosoma de {longitud} bits demasiado largo para un entero de NumPy.")
+
+
+def crear_evaluador_lote(nombre_funcion="nueva"):
+    """
+    Devuelve una función que recibe un arreglo de genotipos y devuelve sus aptitudes,
+    leyéndolas de la tabla exhaustiva (ver tabla_aptitud.py; se construye si no existe).
+    """
+    from tabla_aptitud import obtener_tabla
+
+    tabla = numpy.array(obtener_tabla(nombre_funcion))  # copia en memoria (128 KB), más rápida que el mmap
+
+    def evaluar_lote(genotipos):
+        return tabla[genotipos]
+    return evaluar_lote
+
+
+# --- Operadores sobre arreglos ---
+def poblacion_aleatoria(generador, tam_poblacion, longitud=LONGITUD_CROMOSOMA):
+    """
+    Genotipos al azar (cada bit 0 o 1 con la misma probabilidad).
+    """
+    return generador.integers(0, 1 << longitud, size=tam_poblacion, dtype=numpy.uint64).astype(_tipo_genotipo(longitud))
+
+
+def seleccion_torneo(generador, aptitudes, cantidad, tam_torneo):
+    """
+    Índices de los ganadores de cantidad torneos de tam_torneo aspirantes (con reposición).
+    """
+    # Con aptitudes enteras (int16 de la tabla) el orden estable usa radix sort, que es lineal
+    orden = numpy.argsort(aptitudes, kind="stable")
+    niveles, inicios, cuentas = numpy.unique(aptitudes[orden], return_index=True, return_counts=True)
+    acumulada = numpy.cumsum(cuentas) / len(aptitudes)
+    acumulada_ganador = acumulada ** tam_torneo
+    acumulada_ganador[-1] = 1.0
+    nivel = numpy.searchsorted(acumulada_ganador, generador.random(cantidad), side="right")
+    dentro = (generador.random(cantidad) * cuentas[nivel]).astype(numpy.int64)
+    return orden[inicios[nivel] + dentro]
+
+
+def seleccion_ruleta(generador, aptitudes, cantidad):
+    """
+    Índices elegidos con probabilidad proporcional a la aptitud (como tools.selRoulette).
+    """
+    acumulada = numpy.cumsum(aptitudes, dtype=numpy.float64)
+    if acumulada[-1] <= 0:
+        return generador.integers(0, len(aptitudes), size=cantidad)
+    return numpy.searchsorted(acumulada, generador.random(cantidad) * acumulada[-1], side="right")
+
+
+def mascaras_tramo(desde, hasta, longitud=LONGITUD_CROMOSOMA):
+    """
+    Máscaras con los bits en las posiciones [desde, hasta) (el bit 0 es el más significativo).
+    """
+    uno = numpy.uint64(1)
+    desde = numpy.asarray(desde, dtype=numpy.uint64)
+    hasta = numpy.asarray(hasta, dtype=numpy.uint64)
+    return ((uno << (numpy.uint64(longitud) - desde)) - uno) ^ ((uno << (numpy.uint64(longitud) - hasta)) - uno)
+
+
+def cruce_dos_puntos(generador, genotipos, prob_cruce, longitud=LONGITUD_CROMOSOMA):
+    """
+    Cruza (en el lugar) los pares 0-1, 2-3, ... con probabilidad prob_cruce, con los
+    mismos puntos de corte que tools.cxTwoPoint. Devuelve la máscara de individuos cruzados.
+    """
+    pares = len(genotipos) // 2
+    cruzan = numpy.flatnonzero(generador.random(pares) < prob_cruce)
+    punto1 = generador.integers(1, longitud + 1, size=len(cruzan))
+    punto2 = generador.integers(1, longitud, size=len(cruzan))
+    punto2 = numpy.where(punto2 >= punto1, punto2 + 1, punto2)
+    desde, hasta = numpy.minimum(punto1, punto2), numpy.maximum(punto1, punto2)
+
+    mascara = mascaras_tramo(desde, hasta, longitud).astype(genotipos.dtype)
+    pares_a, pares_b = 2 * cruzan, 2 * cruzan + 1
+    diferencia = (genotipos[pares_a] ^ genotipos[pares_b]) & mascara
+    genotipos[pares_a] ^= diferencia
+    genotipos[pares_b] ^= diferencia
+
+    cruzados = numpy.zeros(len(genotipos), dtype=bool)
+    cruzados[pares_a] = True
+    cruzados[pares_b] = True
+    return cruzados
+
+
+def mutacion_flip_bit(generador, genotipos, prob_mutacion, indpb=INDPB, longitud=LONGITUD_CROMOSOMA):
+    """
+    Con probabilidad prob_mutacion, invierte (en el lugar) cada bit del individuo con
+    probabilidad indpb, como tools.mutFlipBit. Devuelve la máscara de individuos mutados.
+    """
+    mutados = generador.random(len(genotipos)) < prob_mutacion
+    indices = numpy.flatnonzero(mutados)
+    invertir = generador.random((len(indices), longitud), dtype=numpy.float32) < indpb
+    genotipos[indices] ^= empaquetar_bits(invertir, genotipos.dtype)
+    return mutados
+
+
+def empaquetar_bits(bits, tipo):
+    """
+    Convierte una matriz (N, longitud) de bits (el primero es el más significativo)
+    en N enteros del tipo indicado.
+    """
+    bits_tipo = numpy.dtype(tipo).itemsize * 8
+    relleno = numpy.zeros((bits.shape[0], bits_tipo - bits.shape[1]), dtype=bool)
+    octetos = numpy.packbits(numpy.hstack([relleno, bits]), axis=1)
+    return octetos.view(numpy.dtype(tipo).newbyteorder(">")).ravel().astype(tipo)
+
+
+# --- Salón de la fama ---
+def actualizar_salon(salon_genotipos, salon_aptitudes, genotipos, aptitudes, tam_salon_fama):
+    """
+    Devuelve el nuevo salón de la fama (genotipos y aptitudes, del mejor al peor, sin
+    repetidos). Como en tools.HallOfFame, un individuo nuevo solo desplaza a uno del
+    salón si es estrictamente mejor.
+    """
+    if tam_salon_fama <= 0:
+        return salon_genotipos, salon_aptitudes
+    if len(salon_genotipos) == tam_salon_fama:
+        # Con el salón lleno solo pueden entrar los que superan al último
+        mejores = aptitudes > salon_aptitudes[-1]
+        genotipos, aptitudes = genotipos[mejores], aptitudes[mejores]
+    nuevos, primeros = numpy.unique(genotipos, return_index=True)
+    aptitudes_nuevos = aptitudes[primeros]
+    ya_estan = numpy.isin(nuevos, salon_genotipos)
+    todos_genotipos = numpy.concatenate([salon_genotipos, nuevos[~ya_estan]])
+    todos_aptitudes = numpy.concatenate([salon_aptitudes, aptitudes_nuevos[~ya_estan]])
+    # Orden estable: ante empates quedan primero los que ya estaban en el salón
+    orden = numpy.argsort(-todos_aptitudes, kind="stable")[:tam_salon_fama]
+    return todos_genotipos[orden], todos_aptitudes[orden]
+
+
+def salon_como_hall_of_fame(salon_genotipos, salon_aptitudes, tam_salon_fama):
+    """
+    Arma un tools.HallOfFame de IndividuoCompacto con el salón de la fama, para usarlo
+    igual que el que devuelve ejecutar_ag().
+    """
+    from cromosoma_compacto import poblacion_desde_arreglo
+
+    hof = tools.HallOfFame(tam_salon_fama)
+    # Insertando del peor al mejor queda el mismo orden (también entre empates)
+    for ind in reversed(poblacion_desde_arreglo(salon_genotipos, salon_aptitudes)):
+        hof.insert(ind)
+    return hof
+
+
+# --- Ejecución ---
+def ejecutar_ag_vectorizado(tam_poblacion=100, prob_cruce=0.7, prob_mutacion=0.3, num_generaciones=100,
+                            seleccion="torneo", tam_torneo=40, tam_salon_fama=3, semilla=None, verbose=True,
+                            evaluar_lote=None, indpb=INDPB, sumidero=None):
+    """
+    Mismos parámetros y mismo algoritmo que ejecutar_ag(), con la población como un
+    arreglo de genotipos. Devuelve (genotipos, logbook, hof); las aptitudes finales se
+    pueden obtener con evaluar_lote(genotipos) y los individuos con
+    cromosoma_compacto.poblacion_desde_arreglo. evaluar_lote recibe un arreglo de
+    genotipos y devuelve sus aptitudes (por defecto, crear_evaluador_lote("nueva")).
+    """
+    if seleccion not in ("torneo", "ruleta"):
+        raise ValueError(f"Selección desconocida: {seleccion} (usar 'torneo' o 'ruleta').")
+    evaluar_lote = evaluar_lote or crear_evaluador_lote("nueva")
+    generador = numpy.random.default_rng(semilla)
+
+    logbook = tools.Logbook()
+    logbook.header = ["gen", "nevals", "avg", "std", "min", "max"]
+    salon_genotipos = numpy.empty(0, dtype=_tipo_genotipo())
+    salon_aptitudes = numpy.empty(0, dtype=numpy.float64)
+
+    if verbose:
+        print(f"Iniciando evolución vectorizada con {num_generaciones} generaciones y población de "
+              f"{tam_poblacion} individuos...")
+        print(f"Probabilidad de Cruce: {prob_cruce}, Probabilidad de Mutación: {prob_mutacion}")
+
+    def registrar(gen, nevals):
+        logbook.record(gen=gen, nevals=nevals, avg=aptitudes.mean(), std=aptitudes.std(),
+                       min=numpy.float64(aptitudes.min()), max=numpy.float64(aptitudes.max()))
+        if sumidero is not None:
+            sumidero.escribir(logbook[-1], salon_como_hall_of_fame(salon_genotipos, salon_aptitudes, tam_salon_fama))
+        if verbose:
+            print(logbook.stream)
+
+    genotipos = poblacion_aleatoria(generador, tam_poblacion)
+    aptitudes = evaluar_lote(genotipos)
+    salon_genotipos, salon_aptitudes = actualizar_salon(salon_genotipos, salon_aptitudes, genotipos, aptitudes,
+                                                        tam_salon_fama)
+    registrar(0, tam_poblacion)
+
+    for gen in range(1, num_generaciones + 1):
+        if seleccion == "torneo":
+            elegidos = seleccion_torneo(generador, aptitudes, tam_poblacion, tam_torneo)
+        else:
+            elegidos = seleccion_ruleta(generador, aptitudes, tam_poblacion)
+        genotipos = genotipos[elegidos]
+        aptitudes = aptitudes[elegidos]
+
+        modificados = cruce_dos_puntos(generador, genotipos, prob_cruce)
+        modificados |= mutacion_flip_bit(generador, genotipos, prob_mutacion, indpb)
+        # Como en eaSimple, solo se evalúan los que cambiaron (aunque el cambio los haya dejado igual)
+        indices = numpy.flatnonzero(modificados)
+        aptitudes[indices] = evaluar_lote(genotipos[indices])
+
+        salon_genotipos, salon_aptitudes = actualizar_salon(salon_genotipos, salon_aptitudes, genotipos, aptitudes,
+                                                            tam_salon_fama)
+        registrar(gen, len(indices))
+
+    return genotipos, logbook, salon_como_hall_of_fame(salon_genotipos, salon_aptitudes, tam_salon_fama)
+
+
+def _argumentos():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="AG vectorizado con NumPy (población como un arreglo).")
+    parser.add_argument("--poblacion", type=int, default=1_000_000)
+    parser.add_argument("--generaciones", type=int, default=100)
+    parser.add_argument("--cruce", type=float, default=0.7)
+    parser.add_argument("--mutacion", type=float, default=0.3)
+    parser.add_argument("--seleccion", choices=["torneo", "ruleta"], default="torneo")
+    parser.add_argument("--torneo", type=int, default=40)
+    parser.add_argument("--salon", type=int, default=3, help="tamaño del salón de la fama")
+    parser.add_argument("--funcion", choices=["original", "nueva"], default="nueva")
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--silencioso", action="store_true")
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    from config_piloto import imprimir_perfil_piloto
+
+    argumentos = _argumentos()
+    inicio = time.perf_counter()
+    _, libro_estadisticas, salon_fama = ejecutar_ag_vectorizado(
+        tam_poblacion=argumentos.poblacion, prob_cruce=argumentos.cruce, prob_mutacion=argumentos.mutacion,
+        num_generaciones=argumentos.generaciones, seleccion=argumentos.seleccion, tam_torneo=argumentos.torneo,
+        tam_salon_fama=argumentos.salon, semilla=argumentos.semilla, verbose=not argumentos.silencioso,
+        evaluar_lote=crear_evaluador_lote(argumentos.funcion))
+    tiempo = time.perf_counter() - inicio
+
+    for piloto_hof in salon_fama:
+        print("\n --- SUGERENCIA PILOTO CANDIDATO ---")
+        imprimir_perfil_piloto(piloto_hof)
+        print(f"Aptitud del perfil sugerido: {piloto_hof.fitness.values[0]:.2f}")
+    print(f"\n{argumentos.generaciones} generaciones en {tiempo:.2f} s "
+          f"({argumentos.generaciones / tiempo:.1f} generaciones/s)")
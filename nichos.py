@@ -0,0 +1,124 @@
+# --- Nichos: Aptitud Compartida y Salón de la Fama por Nichos ---
+# tools.HallOfFame(3) suele llenarse con perfiles casi iguales (difieren en un solo
+# atributo), así que para tener sugerencias realmente distintas había que repetir la
+# corrida con otras semillas. Este módulo mide la distancia entre perfiles por atributos
+# (cuántos de los 8 atributos tienen un valor distinto) y la usa de dos formas:
+#
+#   * Aptitud compartida (fitness sharing) en la selección: cada individuo compite con
+#     aptitud / m, donde m = suma sobre la población de sh(d) = 1 - (d / radio) ** alfa
+#     para los individuos a distancia d < radio (él mismo incluido). Un nicho muy poblado
+#     reparte su aptitud y los perfiles de otros nichos tienen más chances en el torneo.
+#     La selección de DEAP se usa tal cual, con fit_attr apuntando a la aptitud compartida.
+#   * SalonNichos: salón de la fama que guarda el mejor perfil de cada nicho. Dos
+#     perfiles del salón difieren siempre en al menos distancia_minima atributos; un
+#     perfil nuevo demasiado cercano a otros solo entra si es mejor que todos ellos (y
+#     los reemplaza).
+#
+# Uso:
+#   ejecutar_ag(radio_nicho=3, distancia_salon=3, tam_salon_fama=5)
+#   python piloto_ideal_ag.py --radio-nicho 3 --distancia-salon 3 --tam-salon 5
+
+import numpy
+from deap import tools
+
+from config_piloto import ORDEN_ATRIBUTOS, LONGITUD_CROMOSOMA
+from diversidad import genotipo, genotipos_poblacion
+
+ATRIBUTO_COMPARTIDA = "aptitud_compartida"
+
+# Máscara de bits de cada atributo dentro del genotipo empaquetado
+MASCARAS_ATRIBUTOS = [((1 << num_bits) - 1) << (LONGITUD_CROMOSOMA - inicio_bit - num_bits)
+                      for _, inicio_bit, num_bits in ORDEN_ATRIBUTOS]
+
+
+def distancia_atributos(a, b):
+    """
+    Cantidad de atributos distintos entre genotipos empaquetados (enteros o arreglos
+    de NumPy, con broadcasting).
+    """
+    if isinstance(a, int) and isinstance(b, int):
+        diferencia = a ^ b
+        return sum(1 for mascara in MASCARAS_ATRIBUTOS if diferencia & mascara)
+    diferencia = numpy.bitwise_xor(a, b)
+    distancia = 0
+    for mascara in MASCARAS_ATRIBUTOS:
+        distancia = distancia + ((diferencia & mascara) != 0)
+    return distancia
+
+
+# --- Aptitud compartida ---
+def aptitud_compartida(genotipos, aptitudes, radio, alfa=1.0):
+    """
+    Aptitud de cada individuo dividida por el tamaño de su nicho (ver el comentario
+    del módulo). Las distancias se calculan entre genotipos únicos.
+    """
+    unicos, inversa, copias = numpy.unique(genotipos, return_inverse=True, return_counts=True)
+    distancias = distancia_atributos(unicos[:, None], unicos[None, :])
+    sh = numpy.where(distancias < radio, 1.0 - (distancias / radio) ** alfa, 0.0)
+    return numpy.asarray(aptitudes, dtype=numpy.float64) / (sh @ copias)[inversa]
+
+
+class _Candidato:
+    """
+    Lo que ve el operador de selección: la posición del individuo y su aptitud compartida.
+    """
+    __slots__ = ("indice", ATRIBUTO_COMPARTIDA)
+
+
+def seleccion_compartida(individuos, k, seleccion, radio, alfa=1.0, **argumentos):
+    """
+    Aplica un operador de selección de DEAP (tools.selTournament, tools.selRoulette, ...)
+    sobre la aptitud compartida en lugar de la aptitud. Para la toolbox:
+    toolbox.register("select", seleccion_compartida, seleccion=tools.selTournament, radio=3, tournsize=40)
+    """
+    aptitudes = [ind.fitness.values[0] for ind in individuos]
+    compartidas = aptitud_compartida(genotipos_poblacion(individuos), aptitudes, radio, alfa)
+    # El operador elige entre candidatos con la aptitud compartida (sin tocar los
+    # individuos, que pueden tener __slots__ o estar repetidos en la lista)
+    candidatos = []
+    for indice, (ind, valor) in enumerate(zip(individuos, compartidas.tolist())):
+        candidato = _Candidato()
+        candidato.indice = indice
+        candidato.aptitud_compartida = type(ind.fitness)()
+        candidato.aptitud_compartida.values = (valor,)
+        candidatos.append(candidato)
+    elegidos = seleccion(candidatos, k, fit_attr=ATRIBUTO_COMPARTIDA, **argumentos)
+    return [individuos[candidato.indice] for candidato in elegidos]
+
+
+# --- Salón de la fama por nichos ---
+class SalonNichos(tools.HallOfFame):
+    """
+    tools.HallOfFame que guarda hasta maxsize perfiles que difieren de a pares en al
+    menos distancia_minima atributos, el mejor de cada nicho.
+    """
+
+    def __init__(self, maxsize, distancia_minima=2):
+        super().__init__(maxsize)
+        self.distancia_minima = distancia_minima
+
+    def update(self, population):
+        if self.maxsize == 0:
+            return
+        guardados = [genotipo(guardado) for guardado in self.items]
+        vistos = set()
+        for ind in sorted(population, key=lambda ind: ind.fitness.wvalues, reverse=True):
+            if len(self) == self.maxsize and not ind.fitness > self[-1].fitness:
+                # Los que siguen no superan al peor del salón, así que no pueden entrar
+                break
+            clave = genotipo(ind)
+            if clave in vistos:
+                continue
+            vistos.add(clave)
+            cercanos = [i for i, otro in enumerate(guardados) if distancia_atributos(clave, otro) < self.distancia_minima]
+            if not cercanos:
+                if len(self) == self.maxsize:
+                    self.remove(-1)
+                self.insert(ind)
+            elif all(ind.fitness > self[i].fitness for i in cercanos):
+                for i in reversed(cercanos):
+                    self.remove(i)
+                self.insert(ind)
+            else:
+                continue
+            guardados = [genotipo(guardado) for guardado in self.items]
@@ -0,0 +1,218 @@
+# --- Análisis del Paisaje de Aptitud ---
+# No sabemos por qué algunas configuraciones (tournsize chico, selRoulette) fallan. Con
+# 16 bits el paisaje completo entra en la tabla exhaustiva (tabla_aptitud.py), así que se
+# puede medir entero con operaciones sobre arreglos, para cada vecindario de
+# busqueda_local.py ("bit": 16 vecinos de un bit, "campo": 24 vecinos que cambian un atributo):
+#   * óptimos locales: estrictos (todos los vecinos son peores) y en meseta (ningún
+#     vecino es mejor, alguno empata), con los mejores y el tamaño de su cuenca
+#   * cuencas de atracción: a qué óptimo llega el ascenso por el mejor vecino desde cada
+#     cromosoma (los 65.536 a la vez, saltando de a punteros) y qué fracción del espacio
+#     llega a un óptimo global
+#   * neutralidad: fracción de vecinos con la misma aptitud (mesetas del max(0, ...))
+# y además, para todo el espacio:
+#   * FDC: correlación entre la aptitud y la distancia (en bits y en atributos) al óptimo
+#     global más cercano; cuanto más negativa, más fácil es seguir la pendiente hacia él
+#   * autocorrelación de caminatas al azar de un bit (y su longitud de correlación)
+#   * fracción de cromosomas con aptitud 0
+# Al final resume qué configuraciones del AG conviene barrer (ver recomendaciones()).
+#
+# Uso:
+#   python paisaje_aptitud.py --funcion nueva
+#   python paisaje_aptitud.py --funcion original --json paisaje_original.json
+
+import json
+import time
+
+import numpy
+
+from busqueda_local import VECINDARIOS, mascaras_vecindario
+from config_piloto import LONGITUD_CROMOSOMA
+from nichos import distancia_atributos
+from tabla_aptitud import TAM_ESPACIO
+
+GENOTIPOS = numpy.arange(TAM_ESPACIO, dtype=numpy.int64)
+
+
+# --- Vecindarios y óptimos locales ---
+def aptitudes_vecinos(tabla, vecindario):
+    """
+    Devuelve (vecinos, aptitudes): arreglos (65.536, vecinos) con los cromosomas vecinos
+    de cada cromosoma y su aptitud.
+    """
+    mascaras = numpy.array([mascara for grupo in mascaras_vecindario(vecindario) for mascara in grupo],
+                           dtype=numpy.int64)
+    vecinos = GENOTIPOS[:, None] ^ mascaras
+    return vecinos, tabla[vecinos]
+
+
+def cuencas(tabla, vecinos, aptitudes_vecinos):
+    """
+    Óptimo local al que llega, desde cada cromosoma, el ascenso que siempre se mueve al
+    mejor vecino (el primero en caso de empate) mientras mejore.
+    """
+    mejor = aptitudes_vecinos.argmax(axis=1)
+    mejora = aptitudes_vecinos[GENOTIPOS, mejor] > tabla
+    destino = numpy.where(mejora, vecinos[GENOTIPOS, mejor], GENOTIPOS)
+    # Saltando de a punteros alcanzan log2(largo del ascenso más largo) pasos
+    while True:
+        siguiente = destino[destino]
+        if numpy.array_equal(siguiente, destino):
+            return destino
+        destino = siguiente
+
+
+def analizar_vecindario(tabla, vecindario, maximo, top_optimos=10):
+    """
+    Óptimos locales, cuencas y neutralidad de la tabla con un vecindario.
+    """
+    vecinos, aptitudes = aptitudes_vecinos(tabla, vecindario)
+    ninguno_mejor = (aptitudes <= tabla[:, None]).all(axis=1)
+    estrictos = (aptitudes < tabla[:, None]).all(axis=1)
+    destino = cuencas(tabla, vecinos, aptitudes)
+    tamanos = numpy.bincount(destino, minlength=TAM_ESPACIO)
+
+    optimos = numpy.flatnonzero(estrictos)
+    # Mejores óptimos estrictos primero (a igual aptitud, cuenca más grande)
+    orden = numpy.lexsort((-tamanos[optimos], -tabla[optimos].astype(numpy.int32)))[:top_optimos]
+    return {
+        "vecinos": vecinos.shape[1],
+        "optimos_estrictos": int(estrictos.sum()),
+        "optimos_meseta": int((ninguno_mejor & ~estrictos).sum()),
+        "optimos_globales_estrictos": int((estrictos & (tabla == maximo)).sum()),
+        "mejores_optimos": [{"cromosoma": int(g), "aptitud": int(tabla[g]), "cuenca": int(tamanos[g])}
+                            for g in optimos[orden]],
+        "atractores": int((tamanos > 0).sum()),
+        "cuenca_global": float((tabla[destino] == maximo).mean()),
+        "aptitud_media_alcanzada": float(tabla[destino].mean()),
+        "neutralidad": float((aptitudes == tabla[:, None]).mean()),
+    }
+
+
+# --- Medidas globales ---
+def correlacion_aptitud_distancia(tabla, optimos):
+    """
+    FDC con la distancia en bits y en atributos al óptimo global más cercano.
+    """
+    optimos = numpy.asarray(optimos, dtype=numpy.int64)
+    en_bits = numpy.bitwise_count(GENOTIPOS[:, None] ^ optimos).min(axis=1)
+    en_atributos = distancia_atributos(GENOTIPOS[:, None], optimos).min(axis=1)
+    aptitudes = tabla.astype(numpy.float64)
+    return {"fdc_bits": float(numpy.corrcoef(aptitudes, en_bits)[0, 1]),
+            "fdc_atributos": float(numpy.corrcoef(aptitudes, en_atributos)[0, 1])}
+
+
+def autocorrelacion_caminatas(tabla, caminatas=1000, largo=1000, retardos=(1, 2, 5, 10), semilla=None):
+    """
+    Autocorrelación de la aptitud a lo largo de caminatas al azar que invierten un bit
+    por paso (todas las caminatas a la vez), y longitud de correlación -1 / ln|r(1)|.
+    """
+    generador = numpy.random.default_rng(semilla)
+    inicios = generador.integers(0, TAM_ESPACIO, caminatas)
+    pasos = numpy.left_shift(1, generador.integers(0, LONGITUD_CROMOSOMA, (caminatas, largo - 1)))
+    recorridos = numpy.concatenate([inicios[:, None], inicios[:, None] ^ numpy.bitwise_xor.accumulate(pasos, axis=1)],
+                                   axis=1)
+    serie = tabla[recorridos].astype(numpy.float64)
+    serie -= serie.mean()
+    varianza = (serie * serie).mean()
+    resultado = {f"r{retardo}": float((serie[:, :-retardo] * serie[:, retardo:]).mean() / varianza)
+                 for retardo in retardos}
+    r1 = abs(resultado.get("r1", 0.0))
+    resultado["longitud_correlacion"] = float(-1 / numpy.log(r1)) if 0 < r1 < 1 else None
+    return resultado
+
+
+def analizar_paisaje(tabla, caminatas=1000, largo=1000, semilla=None):
+    """
+    Todas las medidas del paisaje de una tabla de aptitudes (ver el comentario del módulo).
+    """
+    tabla = numpy.asarray(tabla)
+    maximo = int(tabla.max())
+    optimos = numpy.flatnonzero(tabla == maximo)
+    resultado = {
+        "optimo": maximo,
+        "optimos_globales": optimos.tolist(),
+        "aptitud_media": float(tabla.mean()),
+        "fraccion_cero": float((tabla == 0).mean()),
+        "vecindarios": {vecindario: analizar_vecindario(tabla, vecindario, maximo) for vecindario in VECINDARIOS},
+        "caminatas": autocorrelacion_caminatas(tabla, caminatas, largo, semilla=semilla),
+    }
+    resultado.update(correlacion_aptitud_distancia(tabla, optimos))
+    return resultado
+
+
+def recomendaciones(resultado):
+    """
+    Lectura de las medidas en términos de qué configuraciones del AG vale la pena barrer.
+    """
+    bit, campo = resultado["vecindarios"]["bit"], resultado["vecindarios"]["campo"]
+    consejos = []
+    if resultado["fraccion_cero"] > 0.2:
+        consejos.append(f"{resultado['fraccion_cero']:.0%} del espacio tiene aptitud 0: con selRoulette esos "
+                        "individuos nunca se eligen y al inicio casi toda la presión cae en pocos; "
+                        "conviene barrer el torneo antes que la ruleta.")
+    if bit["cuenca_global"] < 0.5:
+        consejos.append(f"Solo {bit['cuenca_global']:.1%} de los cromosomas llega al óptimo subiendo de a un bit "
+                        f"({bit['optimos_estrictos']} óptimos locales): con tournsize alto la población se "
+                        "queda en el primero que encuentra; barrer tournsize chico (2-10), más mutación, "
+                        "--radio-nicho o --memetico.")
+    if campo["cuenca_global"] > bit["cuenca_global"]:
+        consejos.append(f"Cambiando un atributo entero la cuenca del óptimo pasa de {bit['cuenca_global']:.1%} "
+                        f"a {campo['cuenca_global']:.1%}: en modo memético conviene --vecindario campo.")
+    if resultado["fdc_bits"] > -0.15:
+        consejos.append(f"FDC en bits {resultado['fdc_bits']:.2f}: la aptitud casi no guía hacia el óptimo "
+                        "(paisaje engañoso); más diversidad (población grande, nichos) antes que más generaciones.")
+    if bit["neutralidad"] > 0.3:
+        consejos.append(f"{bit['neutralidad']:.0%} de los vecinos de un bit empatan: hay mesetas grandes, "
+                        "--estancamiento debería ser generoso para no cortar corridas que todavía derivan.")
+    return consejos
+
+
+def _argumentos():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Análisis del paisaje de aptitud del espacio de 16 bits.")
+    parser.add_argument("--funcion", choices=["original", "nueva"], default="nueva")
+    parser.add_argument("--caminatas", type=int, default=1000)
+    parser.add_argument("--largo", type=int, default=1000, help="pasos de cada caminata al azar")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--json", default=None, help="guardar todas las medidas en este archivo")
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    from tabla_aptitud import obtener_tabla
+
+    argumentos = _argumentos()
+    inicio = time.perf_counter()
+    resultado = analizar_paisaje(obtener_tabla(argumentos.funcion), argumentos.caminatas, argumentos.largo,
+                                 argumentos.semilla)
+    tiempo = time.perf_counter() - inicio
+
+    print(f"Paisaje de '{argumentos.funcion}' ({tiempo:.2f} s)")
+    print(f"  Óptimo global: {resultado['optimo']} en {len(resultado['optimos_globales'])} cromosoma(s); "
+          f"aptitud media {resultado['aptitud_media']:.2f}; aptitud 0 en {resultado['fraccion_cero']:.1%}")
+    print(f"  FDC: {resultado['fdc_bits']:.3f} (bits), {resultado['fdc_atributos']:.3f} (atributos)")
+    caminatas = resultado["caminatas"]
+    longitud = caminatas["longitud_correlacion"]
+    print("  Autocorrelación de caminatas: " +
+          ", ".join(f"{clave}={valor:.3f}" for clave, valor in caminatas.items() if clave.startswith("r")) +
+          (f"; longitud de correlación {longitud:.2f} pasos" if longitud is not None else ""))
+    for vecindario, datos in resultado["vecindarios"].items():
+        print(f"\n  Vecindario '{vecindario}' ({datos['vecinos']} vecinos):")
+        print(f"    óptimos locales estrictos: {datos['optimos_estrictos']} "
+              f"(globales: {datos['optimos_globales_estrictos']}), en meseta: {datos['optimos_meseta']}")
+        print(f"    ascenso por el mejor vecino: {datos['atractores']} atractores, {datos['cuenca_global']:.1%} "
+              f"llega al óptimo global, aptitud media alcanzada {datos['aptitud_media_alcanzada']:.2f}")
+        print(f"    vecinos con la misma aptitud: {datos['neutralidad']:.1%}")
+        for optimo in datos["mejores_optimos"][:5]:
+            print(f"      {optimo['cromosoma']:016b} -> {optimo['aptitud']} (cuenca {optimo['cuenca']})")
+
+    print("\nRecomendaciones:")
+    for consejo in recomendaciones(resultado) or ["El paisaje no muestra problemas marcados."]:
+        print(f"  * {consejo}")
+
+    if argumentos.json:
+        with open(argumentos.json, "w", encoding="utf-8") as archivo:
+            json.dump(resultado, archivo, indent=2)
+        print(f"\nMedidas guardadas en {argumentos.json}")
@@ -1,123 +1,314 @@
 import random
-from deap import base, creator, tools, algorithms # 
-import numpy # Para estadísticas
-import matplotlib.pyplot as plt # Para gráficos
+import time
+# DEAP, NumPy y matplotlib se importan recién al armar el contexto del AG (crear_contexto)
+# o al graficar, así importar este módulo (por ejemplo en cada proceso de un barrido) es rápido.
 # --- Importamos desde nuestro archivo de configuración del problema ---
 from config_piloto import LONGITUD_CROMOSOMA, evaluar_aptitud_piloto, imprimir_perfil_piloto, evaluar_aptitud_piloto_nueva
 
+# --- Parámetros por Defecto del Algoritmo ---
+# Parámetros por defecto del algoritmo genético. Para probar muchas combinaciones
+# de una vez (con varias semillas y en paralelo) usar barrido_parametros.py.
+TAM_POBLACION = 100  # Tamaño de la población 
+PROBABILIDAD_CRUCE = 0.7 # Probabilidad de que dos individuos se crucen (CXPB)
+PROBABILIDAD_MUTACION = 0.3 # Probabilidad de que un individuo mute (MUTPB)
+NUM_GENERACIONES = 100 # Número de generaciones a ejecutar (NGEN)
+SELECCION = "torneo" # "torneo" o "ruleta"
+TAM_TORNEO = 40 # tournsize, solo se usa con selección por torneo
+MEDIR_TIEMPOS = False # True para registrar el tiempo de cada fase por generación (ver bucle_evolutivo.py y --tiempos)
+
+# Salón de la Fama (Hall of Fame):
+#    'tools.HallOfFame(1)' crea un objeto que almacenará al mejor individuo encontrado
+#    a lo largo de todas las generaciones. El '1' significa que solo guardará al mejor.
+#    Si quisieras guardar los 5 mejores, usarías tools.HallOfFame(5).
+#    Se crea uno nuevo en cada llamada a ejecutar_ag(), así varias corridas no se mezclan.
+TAM_SALON_FAMA = 3
+
+
 # --- 1. Definición de Tipos  ---
-# El objetivo es MAXIMIZAR la aptitud, así que los pesos son positivos (1.0)
-creator.create("FitnessMax", base.Fitness, weights=(1.0,))
+def crear_tipos():
+    """
+    Crea en deap.creator los tipos FitnessMax e Individual, solo si todavía no existen
+    (así no aparece el aviso de DEAP de clase ya creada al llamarla varias veces).
+    """
+    from deap import base, creator
+
+    # El objetivo es MAXIMIZAR la aptitud, así que los pesos son positivos (1.0)
+    if not hasattr(creator, "FitnessMax"):
+        creator.create("FitnessMax", base.Fitness, weights=(1.0,))
+
+    # Cada individuo (cromosoma) será una lista de bits (0s y 1s),
+    # y tendrá asociada la función de aptitud que acabamos de crear.
+    if not hasattr(creator, "Individual"):
+        creator.create("Individual", list, fitness=creator.FitnessMax)
 
-# Cada individuo (cromosoma) será una lista de bits (0s y 1s),
-# y tendrá asociada la función de aptitud que acabamos de crear.
-creator.create("Individual", list, fitness=creator.FitnessMax)
 
-# --- 2. Inicialización y Registro en la Toolbox ---
-toolbox = base.Toolbox()
+class ContextoAG:
+    """
+    Todo lo que necesita una corrida: la toolbox con los operadores registrados, las
+    estadísticas y la cache de aptitud (o None). Cada contexto es independiente, así
+    que en un mismo proceso pueden convivir varias configuraciones del AG.
+    """
 
-# Generador de Atributos (cada bit del cromosoma):
-# 'attr_bool' generará un 0 o un 1 al azar.
-toolbox.register("attr_bool", random.randint, 0, 1)
+    def __init__(self, toolbox, stats, cache_aptitud=None):
+        self.toolbox = toolbox
+        self.stats = stats
+        self.cache_aptitud = cache_aptitud
 
-# Inicializador de Individuos (cromosomas):
-# 'individual' creará un individuo completo (lista de 16 bits)
-# usando 'attr_bool' 16 veces (LONGITUD_CROMOSOMA).
-toolbox.register("individual", tools.initRepeat, creator.Individual, toolbox.attr_bool, LONGITUD_CROMOSOMA)
 
-# Inicializador de Población:
-# 'population' creará una lista de individuos.
-toolbox.register("population", tools.initRepeat, list, toolbox.individual)
+def crear_contexto(funcion_evaluacion=evaluar_aptitud_piloto_nueva, usar_cache=True, compacto=False):
+    """
+    Arma una toolbox y sus estadísticas para la función de evaluación indicada
+    y devuelve el ContextoAG. Con compacto=True cada individuo es un único entero
+    de 16 bits (ver cromosoma_compacto.py).
+    """
+    import numpy # Para estadísticas
+    from deap import base, creator, tools
 
-# --- 3. Registro de los Operadores Genéticos ---
+    crear_tipos()
 
-# A. Función de Evaluación (Fitness Function):
-#    Le decimos a DEAP que la función que debe usar para evaluar la aptitud
-#    de cada individuo se llama 'evaluar_aptitud_piloto' (la que creamos en config_piloto.py).
-#    DEAP llamará a esta función pasándole un individuo (un cromosoma de 16 bits).
+    # --- 2. Inicialización y Registro en la Toolbox ---
+    toolbox = base.Toolbox()
 
-#toolbox.register("evaluate", evaluar_aptitud_piloto)
-toolbox.register("evaluate", evaluar_aptitud_piloto_nueva) # esta es la nueva, la original esta comentada arriba
+    # Generador de Atributos (cada bit del cromosoma):
+    # 'attr_bool' generará un 0 o un 1 al azar.
+    toolbox.register("attr_bool", random.randint, 0, 1)
 
+    # Inicializador de Individuos (cromosomas):
+    # 'individual' creará un individuo completo (lista de 16 bits)
+    # usando 'attr_bool' 16 veces (LONGITUD_CROMOSOMA).
+    toolbox.register("individual", tools.initRepeat, creator.Individual, toolbox.attr_bool, LONGITUD_CROMOSOMA)
 
-# B. Operador de Cruce (Crossover):
-#    Registramos la operación de cruce. 'tools.cxTwoPoint' es un cruce de dos puntos estándar.
-#    Cuando DEAP necesite cruzar dos individuos padres, usará esta función.
-#    Hay otros tipos de cruce como cxOnePoint (usado en el ejemplo de Halloween), cxUniform, etc.
-#    cxTwoPoint suele funcionar bien para cromosomas binarios.
-toolbox.register("mate", tools.cxTwoPoint) 
+    # Inicializador de Población:
+    # 'population' creará una lista de individuos.
+    toolbox.register("population", tools.initRepeat, list, toolbox.individual)
 
-# C. Operador de Mutación:
-toolbox.register("mutate", tools.mutFlipBit, indpb=0.05)
+    # --- 3. Registro de los Operadores Genéticos ---
 
-# D. Operador de Selección:
-# Método Torneo, ir modificando el tournsize según la configuración de cada corrida
-toolbox.register("select", tools.selTournament, tournsize=40) 
+    # A. Función de Evaluación (Fitness Function):
+    #    Le decimos a DEAP que la función que debe usar para evaluar la aptitud
+    #    de cada individuo es funcion_evaluacion (por defecto 'evaluar_aptitud_piloto_nueva',
+    #    de config_piloto.py; la original es 'evaluar_aptitud_piloto').
+    #    DEAP llamará a esta función pasándole un individuo (un cromosoma de 16 bits).
+    toolbox.register("evaluate", funcion_evaluacion)
 
-# Ir cambiando según la configuración de cada corrida
-# Selección por ruleta:
-#toolbox.register("select", tools.selRoulette)
+    #    Alternativa más rápida: leer la aptitud de la tabla precalculada de los 65.536
+    #    cromosomas (se genera con "python tabla_aptitud.py"). Da exactamente los mismos valores:
+    #    crear_contexto(crear_evaluador_tabla(obtener_tabla("nueva"))), con
+    #    from tabla_aptitud import obtener_tabla, crear_evaluador_tabla
+    #    Alternativa incremental: solo recalcula las reglas que leen los atributos que cambiaron
+    #    respecto del padre (ver evaluacion_incremental.py). También da los mismos valores:
+    #    crear_contexto(EvaluadorIncremental(REGLAS_NUEVA)), con
+    #    from evaluacion_incremental import EvaluadorIncremental; from reglas_piloto import REGLAS_NUEVA
 
-# --- 4. Configuración de Estadísticas y Salón de la Fama (Hall of Fame) ---
 
-# A. Salón de la Fama (Hall of Fame):
-#    'tools.HallOfFame(1)' crea un objeto que almacenará al mejor individuo encontrado
-#    a lo largo de todas las generaciones. El '1' significa que solo guardará al mejor.
-#    Si quisieras guardar los 5 mejores, usarías tools.HallOfFame(5).
-hof = tools.HallOfFame(3)
-
-# B. Estadísticas:
-#    'tools.Statistics' nos permite llevar un registro de ciertas métricas de la
-#    población en cada generación (como el promedio, mínimo, máximo de la aptitud).
-#    El argumento 'lambda ind: ind.fitness.values' le dice que las estadísticas
-#    se deben calcular sobre los valores de aptitud de los individuos.
-stats = tools.Statistics(lambda ind: ind.fitness.values)
-
-# Registramos las estadísticas específicas que queremos calcular:
-# - "avg": Calculará el promedio de las aptitudes.
-# - "std": Calculará la desviación estándar de las aptitudes.
-# - "min": Calculará la aptitud mínima.
-# - "max": Calculará la aptitud máxima.
-# 'numpy.mean', 'numpy.std', etc., son funciones de la librería NumPy que realizan estos cálculos.
-stats.register("avg", numpy.mean) 
-stats.register("std", numpy.std)
-stats.register("min", numpy.min)
-stats.register("max", numpy.max)
-
-# --- 5. Definición de Parámetros del Algoritmo y Ejecución ---
-def ejecutar_ag():
-    
-    # Parámetros del algoritmo genético
-    # TODO : empezar a iterar con distintos parametros
+    # B. Operador de Cruce (Crossover):
+    #    Registramos la operación de cruce. 'tools.cxTwoPoint' es un cruce de dos puntos estándar.
+    #    Cuando DEAP necesite cruzar dos individuos padres, usará esta función.
+    #    Hay otros tipos de cruce como cxOnePoint (usado en el ejemplo de Halloween), cxUniform, etc.
+    #    cxTwoPoint suele funcionar bien para cromosomas binarios.
+    toolbox.register("mate", tools.cxTwoPoint) 
+
+    # C. Operador de Mutación:
+    toolbox.register("mutate", tools.mutFlipBit, indpb=0.05)
+
+    # D. Operador de Selección:
+    # Método Torneo, ir modificando el tournsize según la configuración de cada corrida
+    # (ejecutar_ag() lo vuelve a registrar según sus parámetros seleccion y tam_torneo)
+    toolbox.register("select", tools.selTournament, tournsize=40) 
+
+    # Ir cambiando según la configuración de cada corrida
+    # Selección por ruleta:
+    #toolbox.register("select", tools.selRoulette)
+
+    # E. Cromosoma compacto (opcional, compacto=True o --compacto):
+    #    Reemplaza individuo, población, cruce, mutación y evaluación por la versión en la que
+    #    cada individuo es un único entero de 16 bits (ver cromosoma_compacto.py).
+    #    Con la misma semilla la evolución es idéntica a la de las listas de bits.
+    #    Las funciones "original" y "nueva" leen la aptitud de su tabla exhaustiva; cualquier
+    #    otra recibe el individuo compacto, que se comporta como una secuencia de bits.
+    if compacto:
+        from cromosoma_compacto import configurar_toolbox_compacto, crear_evaluador_compacto
+        from tabla_aptitud import FUNCIONES_APTITUD, obtener_tabla
+        for nombre, funcion in FUNCIONES_APTITUD.items():
+            if funcion is funcion_evaluacion:
+                funcion_evaluacion = crear_evaluador_compacto(obtener_tabla(nombre))
+        configurar_toolbox_compacto(toolbox, funcion_evaluacion)
+
+    # --- 4. Configuración de Estadísticas ---
+
+    # Estadísticas:
+    #    'tools.Statistics' nos permite llevar un registro de ciertas métricas de la
+    #    población en cada generación (como el promedio, mínimo, máximo de la aptitud).
+    #    El argumento 'lambda ind: ind.fitness.values' le dice que las estadísticas
+    #    se deben calcular sobre los valores de aptitud de los individuos.
+    stats = tools.Statistics(lambda ind: ind.fitness.values)
+
+    # Registramos las estadísticas específicas que queremos calcular:
+    # - "avg": Calculará el promedio de las aptitudes.
+    # - "std": Calculará la desviación estándar de las aptitudes.
+    # - "min": Calculará la aptitud mínima.
+    # - "max": Calculará la aptitud máxima.
+    # 'numpy.mean', 'numpy.std', etc., son funciones de la librería NumPy que realizan estos cálculos.
+    stats.register("avg", numpy.mean) 
+    stats.register("std", numpy.std)
+    stats.register("min", numpy.min)
+    stats.register("max", numpy.max)
+
+    # Cache de Aptitud:
+    #    Envolvemos la función de evaluación registrada para no volver a puntuar genotipos
+    #    que ya se evaluaron (ver cache_aptitud.py). Las columnas "aciertos" y "fallos"
+    #    del logbook muestran cuántas evaluaciones se ahorraron/hicieron en cada generación.
+    cache_aptitud = None
+    if usar_cache:
+        from cache_aptitud import CacheAptitud
+        cache_aptitud = CacheAptitud(toolbox.evaluate)
+        toolbox.register("evaluate", cache_aptitud)
+
+    return ContextoAG(toolbox, stats, cache_aptitud)
+
+
+_CONTEXTO = None
+
+
+def obtener_contexto():
+    """
+    Devuelve el contexto por defecto del módulo (se crea la primera vez que se usa).
+    """
+    global _CONTEXTO
+    if _CONTEXTO is None:
+        _CONTEXTO = crear_contexto()
+    return _CONTEXTO
+
+
+# --- 5. Ejecución del Algoritmo ---
+def registrar_seleccion(toolbox, seleccion, tam_torneo=TAM_TORNEO, radio_nicho=None):
+    """
+    Registra en la toolbox el operador de selección indicado ("torneo" o "ruleta").
+    Con radio_nicho la selección usa la aptitud compartida (ver nichos.py).
+    """
+    from deap import tools
+
+    if seleccion == "torneo":
+        operador, argumentos = tools.selTournament, {"tournsize": tam_torneo}
+    elif seleccion == "ruleta":
+        operador, argumentos = tools.selRoulette, {}
+    else:
+        raise ValueError(f"Selección desconocida: {seleccion} (usar 'torneo' o 'ruleta').")
+    if radio_nicho:
+        from nichos import seleccion_compartida
+        toolbox.register("select", seleccion_compartida, seleccion=operador, radio=radio_nicho, **argumentos)
+    else:
+        toolbox.register("select", operador, **argumentos)
+
 
-    TAM_POBLACION = 100  # Tamaño de la población 
-    PROBABILIDAD_CRUCE = 0.7 # Probabilidad de que dos individuos se crucen (CXPB)
-    PROBABILIDAD_MUTACION = 0.3 # Probabilidad de que un individuo mute (MUTPB)
-    NUM_GENERACIONES = 100 # Número de generaciones a ejecutar (NGEN)
+def crear_salon_fama(tam_salon_fama=TAM_SALON_FAMA, distancia_salon=None):
+    """
+    Devuelve un tools.HallOfFame o, con distancia_salon, un SalonNichos cuyos perfiles
+    difieren de a pares en al menos esa cantidad de atributos (ver nichos.py).
+    """
+    from deap import tools
+
+    if distancia_salon:
+        from nichos import SalonNichos
+        return SalonNichos(tam_salon_fama, distancia_salon)
+    return tools.HallOfFame(tam_salon_fama)
+
+
+def ejecutar_ag(tam_poblacion=TAM_POBLACION, prob_cruce=PROBABILIDAD_CRUCE, prob_mutacion=PROBABILIDAD_MUTACION,
+                num_generaciones=NUM_GENERACIONES, seleccion=SELECCION, tam_torneo=TAM_TORNEO,
+                tam_salon_fama=TAM_SALON_FAMA, semilla=None, verbose=True, medir_tiempos=MEDIR_TIEMPOS,
+                sumidero=None, conservar_logbook=True, contexto=None, punto_control=None, busqueda_local=None,
+                medir_diversidad=False, deduplicar=None, parada=None, radio_nicho=None, distancia_salon=None,
+                almacen=None):
+    """
+    Ejecuta el AG con los parámetros indicados y devuelve (poblacion, logbook, hof).
+    Si se pasa una semilla, la corrida es reproducible. Con medir_tiempos=True el
+    logbook incluye el tiempo de cada fase por generación (ver bucle_evolutivo.py).
+    Con un sumidero (ver registro_corrida.py) cada generación se escribe en disco al
+    calcularse; con conservar_logbook=False el logbook devuelto solo tiene la última.
+    Sin contexto se usa el del módulo (ver crear_contexto y obtener_contexto).
+    Con un punto_control (ver punto_control.py) el estado se guarda periódicamente
+    y la corrida se puede seguir con reanudar_ag().
+    Con una busqueda_local (ver busqueda_local.py) la élite de cada generación se
+    mejora con búsqueda local (modo memético).
+    Con medir_diversidad=True el logbook incluye la diversidad de la población y con
+    deduplicar ("compartir", "nuevos" o "mutar") se tratan los genotipos repetidos
+    antes de evaluar (ver diversidad.py).
+    Con un criterio de parada (ver criterios_parada.py) la corrida puede terminar
+    antes de num_generaciones; la columna parada del logbook dice por qué.
+    Con radio_nicho la selección usa aptitud compartida y con distancia_salon el salón
+    de la fama guarda el mejor perfil de cada nicho (ver nichos.py).
+    Con un almacen (ver almacen_resultados.py) una corrida con semilla que ya se hizo
+    con la misma configuración y las mismas reglas se devuelve sin volver a correr
+    (las generaciones guardadas se pasan igual al sumidero); si no estaba, se guarda.
+    """
+    from bucle_evolutivo import ea_simple
+
+    contexto = contexto or obtener_contexto()
+    toolbox = contexto.toolbox
+    if semilla is not None:
+        random.seed(semilla)
+    registrar_seleccion(toolbox, seleccion, tam_torneo, radio_nicho)
+    hof = crear_salon_fama(tam_salon_fama, distancia_salon)
+    parametros = {"tam_poblacion": tam_poblacion, "prob_cruce": prob_cruce,
+                  "prob_mutacion": prob_mutacion, "num_generaciones": num_generaciones,
+                  "seleccion": seleccion, "tam_torneo": tam_torneo,
+                  "tam_salon_fama": tam_salon_fama, "medir_tiempos": medir_tiempos,
+                  "medir_diversidad": medir_diversidad, "deduplicar": deduplicar,
+                  "radio_nicho": radio_nicho, "distancia_salon": distancia_salon}
+    if punto_control is not None:
+        punto_control.parametros = parametros
 
-    print(f"Iniciando evolución con {NUM_GENERACIONES} generaciones y población de {TAM_POBLACION} individuos...")
-    print(f"Probabilidad de Cruce: {PROBABILIDAD_CRUCE}, Probabilidad de Mutación: {PROBABILIDAD_MUTACION}")
+    configuracion = None
+    if almacen is not None and busqueda_local is None and punto_control is None:
+        from almacen_resultados import configuracion_corrida
+        configuracion = configuracion_corrida(contexto, parametros, semilla, parada)
+    if configuracion is not None:
+        guardado = almacen.buscar(configuracion)
+        if guardado is not None:
+            if verbose:
+                print(f"Resultado reutilizado del almacén ({guardado['meta']['clave'][:12]}, "
+                      f"la corrida original tardó {guardado['meta']['tiempo_s']:.2f} s)")
+            return restaurar_resultado(guardado, hof, sumidero, conservar_logbook)
+
+    if verbose:
+        print(f"Iniciando evolución con {num_generaciones} generaciones y población de {tam_poblacion} individuos...")
+        print(f"Probabilidad de Cruce: {prob_cruce}, Probabilidad de Mutación: {prob_mutacion}")
 
     # Creación de la población inicial
     # Llama a la función "population" que registramos en la toolbox,
-    # pasándole n=TAM_POBLACION para crear la cantidad deseada de individuos.
-    pop = toolbox.population(n=TAM_POBLACION)
+    # pasándole n=tam_poblacion para crear la cantidad deseada de individuos.
+    pop = toolbox.population(n=tam_poblacion)
 
     # Ejecución del algoritmo evolutivo
     # algorithms.eaSimple es uno de los algoritmos predefinidos en DEAP.
+    # Usamos ea_simple de bucle_evolutivo.py, que hace exactamente lo mismo (mismo
+    # resultado con la misma semilla) pero permite medir el tiempo de cada fase.
     # También podríamos usar algorithms.eaMuPlusLambda 
     # mu = número de individuos a seleccionar para la siguiente generación.
     # lambda_ = número de hijos a generar en cada generación.
     
     # El objeto 'logbook' registrará las estadísticas de cada generación.
-    pop, logbook = algorithms.eaSimple(
+    # Si la corrida va al almacén se conserva entero aunque conservar_logbook=False
+    # (el almacén guarda todas las generaciones) y se recorta después de guardarlo.
+    inicio = time.perf_counter()
+    pop, logbook = ea_simple(
         pop, toolbox,
-    cxpb=PROBABILIDAD_CRUCE,
-    mutpb=PROBABILIDAD_MUTACION,
-    ngen=NUM_GENERACIONES,
-    stats=stats,
+    cxpb=prob_cruce,
+    mutpb=prob_mutacion,
+    ngen=num_generaciones,
+    stats=contexto.stats,
     halloffame=hof,
-    verbose=True
+    verbose=verbose,
+    medir_tiempos=medir_tiempos,
+    sumidero=sumidero,
+    conservar_logbook=conservar_logbook or configuracion is not None,
+    punto_control=punto_control,
+    busqueda_local=busqueda_local,
+    medir_diversidad=medir_diversidad,
+    deduplicar=deduplicar,
+    parada=parada,
+    cache_aptitud=contexto.cache_aptitud
 #        pop,                     # La población inicial
  #       toolbox,                 # Nuestra caja de herramientas con los operadores registrados
   #      mu=TAM_POBLACION,        # Número de individuos a seleccionar para la siguiente generación
@@ -129,13 +320,232 @@ def ejecutar_ag():
   #      halloffame=hof,          # Objeto para guardar al mejor(es) individuo(s)
   #      verbose=True             # Imprime información del progreso en cada generación
     )
+    tiempo = time.perf_counter() - inicio
 
+    if configuracion is not None:
+        almacen.guardar(configuracion, pop, hof, logbook, tiempo)
+        if not conservar_logbook:
+            from deap import tools
+            ultima = tools.Logbook()
+            ultima.header = logbook.header
+            ultima.record(**logbook[-1])
+            logbook = ultima
     return pop, logbook, hof
 
+
+def restaurar_resultado(guardado, hof, sumidero=None, conservar_logbook=True):
+    """
+    Arma (poblacion, logbook, hof) a partir de una entrada de AlmacenResultados.buscar(),
+    pasando cada generación guardada al sumidero (sin salón de la fama por generación).
+    """
+    from deap import tools
+
+    # Insertando del peor al mejor queda el mismo orden que tenía (también entre empates)
+    for ind in reversed(guardado["salon_fama"]):
+        hof.insert(ind)
+    logbook = tools.Logbook()
+    logbook.header = guardado["header"]
+    for registro in guardado["registros"]:
+        if not conservar_logbook and len(logbook):
+            logbook.pop()
+        logbook.record(**registro)
+        if sumidero is not None:
+            sumidero.escribir(logbook[-1], None)
+    return guardado["poblacion"], logbook, hof
+
+
+def reanudar_ag(ruta, verbose=True, sumidero=None, conservar_logbook=True, contexto=None, punto_control=None,
+                busqueda_local=None, parada=None):
+    """
+    Sigue una corrida desde el punto de control guardado en ruta y devuelve
+    (poblacion, logbook, hof), igual que ejecutar_ag(). Los parámetros de la corrida
+    salen del archivo; la función de evaluación del contexto y la busqueda_local
+    tienen que ser las mismas (la búsqueda local sigue con los óptimos locales y los
+    contadores guardados). El criterio de parada, si se pasa, cuenta desde la
+    generación guardada.
+    """
+    from deap import tools
+    from bucle_evolutivo import ea_simple
+    from cache_aptitud import huella_funcion
+    from punto_control import cargar_punto_control
+
+    contexto = contexto or obtener_contexto()  # crea también los tipos de creator
+    toolbox = contexto.toolbox
+    estado = cargar_punto_control(ruta)
+    if huella_funcion(toolbox.evaluate) != estado["huella_evaluacion"]:
+        raise ValueError(f"La función de evaluación no es la misma con la que se guardó {ruta}.")
+    parametros = estado["parametros"]
+    registrar_seleccion(toolbox, parametros["seleccion"], parametros["tam_torneo"], parametros.get("radio_nicho"))
+
+    hof = None
+    if estado["salon_fama"] is not None:
+        hof = crear_salon_fama(parametros["tam_salon_fama"], parametros.get("distancia_salon"))
+        # Insertando del peor al mejor queda el mismo orden que tenía (también entre empates)
+        for ind in reversed(estado["salon_fama"]):
+            hof.insert(ind)
+    if contexto.cache_aptitud is not None and estado["cache"] is not None:
+        contexto.cache_aptitud.restaurar_estado(estado["cache"])
+    if busqueda_local is None and estado["busqueda_local"] is not None:
+        raise ValueError(f"{ruta} se guardó en modo memético; reanudarlo con la misma busqueda_local.")
+    if busqueda_local is not None:
+        if estado["busqueda_local"] is None:
+            raise ValueError(f"{ruta} no tiene el estado de la búsqueda local (se guardó sin modo memético "
+                             "o con una versión anterior), así que no se puede seguir igual.")
+        busqueda_local.restaurar_estado(estado["busqueda_local"])
+
+    logbook = tools.Logbook()
+    logbook.header = estado["header"]
+    for registro in estado["registros"]:
+        logbook.record(**registro)
+    if punto_control is not None:
+        punto_control.parametros = parametros
+
+    if verbose:
+        print(f"Reanudando desde la generación {estado['gen']} de {parametros['num_generaciones']} ({ruta})...")
+    random.setstate(estado["estado_rng"])
+    pop, logbook = ea_simple(
+        estado["poblacion"], toolbox,
+        cxpb=parametros["prob_cruce"],
+        mutpb=parametros["prob_mutacion"],
+        ngen=parametros["num_generaciones"],
+        stats=contexto.stats,
+        halloffame=hof,
+        verbose=verbose,
+        medir_tiempos=parametros["medir_tiempos"],
+        sumidero=sumidero,
+        conservar_logbook=conservar_logbook,
+        punto_control=punto_control,
+        reanudar_desde=(estado["gen"], logbook),
+        busqueda_local=busqueda_local,
+        medir_diversidad=parametros.get("medir_diversidad", False),
+        deduplicar=parametros.get("deduplicar"),
+        parada=parada,
+        cache_aptitud=contexto.cache_aptitud,
+    )
+    return pop, logbook, hof
+
+
+def _argumentos():
+    import argparse
+    from criterios_parada import agregar_argumentos as agregar_argumentos_parada
+
+    parser = argparse.ArgumentParser(description="AG para encontrar el perfil de piloto ideal.")
+    parser.add_argument("--generaciones", type=int, default=NUM_GENERACIONES)
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--registro", default=None,
+                        help="archivo .jsonl o .csv donde se escribe cada generación al calcularse")
+    parser.add_argument("--sin-grafico", action="store_true", help="no generar grafico_piloto.png")
+    parser.add_argument("--silencioso", action="store_true", help="no imprimir el logbook por generación")
+    parser.add_argument("--punto-control", default=None, help="archivo donde guardar el estado de la corrida")
+    parser.add_argument("--cada-generaciones", type=int, default=None,
+                        help="guardar el punto de control cada N generaciones (10 si no se indica ninguna frecuencia)")
+    parser.add_argument("--cada-segundos", type=float, default=None, help="guardar el punto de control cada S segundos")
+    parser.add_argument("--reanudar", default=None, help="seguir la corrida guardada en este punto de control")
+    parser.add_argument("--memetico", type=float, default=None, metavar="FRACCION",
+                        help="búsqueda local sobre esa fracción de mejores individuos en cada generación")
+    parser.add_argument("--vecindario", choices=["bit", "campo"], default="campo")
+    parser.add_argument("--estrategia", choices=["maximo", "primera"], default="maximo")
+    parser.add_argument("--tiempos", action="store_true", default=MEDIR_TIEMPOS,
+                        help="medir el tiempo de cada fase por generación (al reanudar, lo que diga el punto de control)")
+    parser.add_argument("--diversidad", action="store_true",
+                        help="agregar al logbook la diversidad de la población (únicos, Hamming, entropía)")
+    parser.add_argument("--deduplicar", choices=["compartir", "nuevos", "mutar"], default=None,
+                        help="qué hacer con los genotipos repetidos antes de evaluar")
+    parser.add_argument("--compacto", action="store_true",
+                        help="cada individuo es un único entero de 16 bits (ver cromosoma_compacto.py)")
+    parser.add_argument("--comparar", nargs="+", choices=["original"], default=None, metavar="MODELO",
+                        help="puntuar también con estos modelos en la misma pasada (el AG sigue guiado por 'nueva')")
+    parser.add_argument("--radio-nicho", type=float, default=None,
+                        help="selección con aptitud compartida entre perfiles a menos de esta cantidad de atributos")
+    parser.add_argument("--distancia-salon", type=int, default=None,
+                        help="los perfiles del salón de la fama difieren en al menos esta cantidad de atributos")
+    parser.add_argument("--tam-salon", type=int, default=TAM_SALON_FAMA)
+    parser.add_argument("--metricas-puerto", type=int, default=None,
+                        help="servir métricas en vivo (formato Prometheus) en http://127.0.0.1:PUERTO/metrics")
+    parser.add_argument("--almacen", nargs="?", const="resultados_ag", default=None, metavar="DIRECTORIO",
+                        help="reutilizar (o guardar) el resultado de corridas con semilla ya hechas")
+    agregar_argumentos_parada(parser)
+    return parser.parse_args()
+
+
 # --- Bloque Principal de Ejecución ---
 if __name__ == "__main__":
+    from bucle_evolutivo import resumen_tiempos, exportar_tiempos_json
+    from tabla_aptitud import tabla_vigente, obtener_tabla, comparar_hof_con_optimo
+    from graficar_piloto import graficar_evolucion # matplotlib se carga recién al graficar
+    from registro_corrida import SumideroCompuesto, crear_sumidero, leer_registro
+    from criterios_parada import CriterioParada, opciones_desde_argumentos
+
+    argumentos = _argumentos()
+    contexto = crear_contexto(compacto=True) if argumentos.compacto else obtener_contexto()
+
+    # Comparación de modelos: cada genotipo se decodifica una vez y se puntúa con "nueva"
+    # (que guía el AG) y con los modelos de --comparar (ver evaluacion_multiple.py)
+    evaluador_multiple = None
+    if argumentos.comparar:
+        from evaluacion_multiple import EvaluadorMultiple
+        evaluador_multiple = EvaluadorMultiple(["nueva"] + argumentos.comparar, primario="nueva")
+        contexto = crear_contexto(evaluador_multiple, usar_cache=False, compacto=argumentos.compacto)
+        evaluador_multiple.registrar(contexto)
+    cache_aptitud = contexto.cache_aptitud
+
+    # Modo memético: los vecinos se puntúan por lotes con la tabla de la función "nueva"
+    busqueda_local = None
+    if argumentos.memetico:
+        from busqueda_local import BusquedaLocal
+        from motor_vectorizado import crear_evaluador_lote
+        busqueda_local = BusquedaLocal(crear_evaluador_lote("nueva"), argumentos.vecindario, argumentos.estrategia,
+                                       argumentos.memetico)
+
+    # Parada anticipada (--estancamiento, --objetivo, ...; ver criterios_parada.py)
+    opciones_parada = opciones_desde_argumentos(argumentos, "nueva")
+    parada = CriterioParada(**opciones_parada) if opciones_parada else None
+
     # Ejecutamos el algoritmo genético
-    poblacion_final, libro_estadisticas, salon_fama = ejecutar_ag()
+    # Con --registro las estadísticas se escriben en el archivo a medida que avanzan y
+    # no se acumulan en memoria (el logbook devuelto solo tiene la última generación).
+    # Con --punto-control el estado se guarda periódicamente (al reanudar, por defecto en el mismo archivo).
+    # Con --metricas-puerto además se publica el avance por HTTP (ver metricas_http.py).
+    sumidero = crear_sumidero(argumentos.registro) if argumentos.registro else None
+    servidor_metricas = None
+    if argumentos.metricas_puerto is not None:
+        from metricas_http import ServidorMetricas, SumideroMetricas, TablaMetricas
+        tabla_metricas = TablaMetricas()
+        servidor_metricas = ServidorMetricas(tabla_metricas, argumentos.metricas_puerto)
+        print(f"Métricas en {servidor_metricas.url}")
+        sumidero = SumideroCompuesto(sumidero, SumideroMetricas(tabla_metricas))
+    # Con --almacen una corrida con --semilla ya hecha se toma de ahí (ver almacen_resultados.py)
+    almacen = None
+    if argumentos.almacen:
+        from almacen_resultados import AlmacenResultados
+        almacen = AlmacenResultados(argumentos.almacen)
+    punto_control = None
+    if argumentos.punto_control or argumentos.reanudar:
+        from punto_control import PuntoControl
+        cada_generaciones = argumentos.cada_generaciones
+        if cada_generaciones is None and argumentos.cada_segundos is None:
+            cada_generaciones = 10
+        punto_control = PuntoControl(argumentos.punto_control or argumentos.reanudar, cada_generaciones,
+                                     argumentos.cada_segundos)
+    try:
+        if argumentos.reanudar:
+            poblacion_final, libro_estadisticas, salon_fama = reanudar_ag(
+                argumentos.reanudar, verbose=not argumentos.silencioso, sumidero=sumidero,
+                conservar_logbook=argumentos.registro is None, punto_control=punto_control,
+                busqueda_local=busqueda_local, parada=parada, contexto=contexto)
+        else:
+            poblacion_final, libro_estadisticas, salon_fama = ejecutar_ag(
+                num_generaciones=argumentos.generaciones, semilla=argumentos.semilla,
+                verbose=not argumentos.silencioso, medir_tiempos=argumentos.tiempos, sumidero=sumidero,
+                conservar_logbook=argumentos.registro is None, punto_control=punto_control, busqueda_local=busqueda_local,
+                medir_diversidad=argumentos.diversidad, deduplicar=argumentos.deduplicar, parada=parada,
+                contexto=contexto, radio_nicho=argumentos.radio_nicho, distancia_salon=argumentos.distancia_salon,
+                tam_salon_fama=argumentos.tam_salon, almacen=almacen)
+    finally:
+        if sumidero is not None:
+            sumidero.cerrar()
+        if servidor_metricas is not None:
+            servidor_metricas.cerrar()
     """
     # Imprimimos el mejor individuo encontrado
     mejor_individuo = salon_fama[0] # El HallOfFame guarda al mejor en la posición 0
@@ -150,18 +560,40 @@ if __name__ == "__main__":
         imprimir_perfil_piloto(piloto_hof) # Usamos nuestra función de config_piloto.py
         print(f"Aptitud del perfil sugerido: {piloto_hof.fitness.values[0]:.2f}")
 
-    # Graficar la evolución de la aptitud
-    gen = libro_estadisticas.select("gen")
-    avg_fitness = libro_estadisticas.select("avg")
-    max_fitness = libro_estadisticas.select("max")
-
-    plt.figure(figsize=(10, 6))
-    plt.plot(gen, avg_fitness, label="Aptitud Promedio", color='red')
-    plt.xlabel("Generación")
-    plt.ylabel("Aptitud")
-    plt.legend(loc="lower right")
-    plt.title("Evolución de la Aptitud a lo largo de las Generaciones")
-    plt.grid(True)
-    plt.savefig("grafico_piloto.png")
-
-    print("\nEvolución completada.")
\ No newline at end of file
+    # Las generaciones completas están en el logbook o, si se usó --registro, en el archivo
+    def registros():
+        return leer_registro(argumentos.registro) if argumentos.registro else libro_estadisticas
+
+    # Los tiempos están si la corrida los midió (--tiempos o el punto de control reanudado)
+    if "t_generacion" in libro_estadisticas.header:
+        if not argumentos.registro:
+            exportar_tiempos_json(libro_estadisticas, "tiempos_piloto.json")
+        print(f"\nTiempo por fase (detalle por generación en {argumentos.registro or 'tiempos_piloto.json'}):")
+        for fase, datos in resumen_tiempos(registros()).items():
+            if isinstance(datos, dict):
+                print(f"  {fase:<13} {datos['segundos']:8.3f} s ({datos['porcentaje']:5.1f}%)")
+
+    if cache_aptitud is not None:
+        print(f"\nCache de aptitud: {cache_aptitud.aciertos} aciertos, {cache_aptitud.fallos} evaluaciones reales "
+              f"(tasa de aciertos {cache_aptitud.tasa_aciertos():.1%})")
+    if evaluador_multiple is not None:
+        print(f"\n{evaluador_multiple.evaluaciones} genotipos decodificados, puntuados con "
+              f"{', '.join(evaluador_multiple.nombres)}. Salón de la fama según cada modelo:")
+        for piloto_hof, puntajes in zip(salon_fama, evaluador_multiple.puntajes(salon_fama).tolist()):
+            print("  " + ", ".join(f"{nombre}={puntaje}" for nombre, puntaje in zip(evaluador_multiple.nombres, puntajes)))
+
+    # Si ya se generó la tabla exhaustiva (con las reglas actuales), verificamos el salón de la fama contra el óptimo exacto
+    if tabla_vigente("nueva"):
+        comparacion = comparar_hof_con_optimo(salon_fama, obtener_tabla("nueva"))
+        print(f"\nÓptimo global exacto: {comparacion['optimo']} "
+              f"(alcanzado: {'sí' if comparacion['alcanzo_optimo'] else 'no'}, "
+              f"{comparacion['hof_en_top_k']}/{len(salon_fama)} del salón de la fama en el top real)")
+
+    # Graficar la evolución de la aptitud (ver graficar_piloto.py)
+    if not argumentos.sin_grafico:
+        graficar_evolucion(registros(), "grafico_piloto.png")
+
+    if parada is not None:
+        print(f"\nParada en la generación {libro_estadisticas[-1]['gen']}: {libro_estadisticas[-1]['parada']}")
+
+    print("\nEvolución completada.")
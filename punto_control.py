@@ -0,0 +1,287 @@
+# --- Puntos de Control (Checkpoints) ---
+# Una corrida larga guarda todo en memoria hasta terminar, así que si se corta se
+# pierde. Con un PuntoControl, ea_simple (bucle_evolutivo.py) guarda cada tantas
+# generaciones y/o cada tantos segundos un archivo binario con todo lo necesario para
+# seguir exactamente desde ahí:
+#   * la población empaquetada (un entero de 16 bits por individuo) y sus aptitudes
+#   * el salón de la fama (genotipos y aptitudes, en orden)
+#   * el estado del generador random (Mersenne Twister, 625 enteros de 32 bits)
+#   * el logbook que hay en memoria y, si se usa, el contenido de la cache de aptitud
+#     (el logbook va aparte, ver abajo)
+#   * en modo memético, los óptimos locales conocidos y los contadores de la búsqueda
+#     local (ver busqueda_local.py)
+#   * los parámetros de la corrida y la huella de la función de evaluación
+#
+# El archivo es un .npz sin comprimir (arreglos de NumPy más un bloque JSON) y se
+# escribe primero a un temporal que después se renombra, así siempre queda el último
+# punto de control completo aunque la corrida se corte a mitad de la escritura.
+# Reanudando con reanudar_ag() (piloto_ideal_ag.py), la corrida sigue igual, bit a
+# bit, que si nunca se hubiera cortado (salvo las columnas de tiempos).
+#
+# Para que cada guardado cueste lo mismo al principio que al final de la corrida, las
+# generaciones del logbook van a <ruta>.logbook.jsonl (una línea JSON por generación) y
+# cada punto de control solo agrega las que aparecieron desde el anterior; el .npz
+# guarda cuántas líneas le corresponden (si se corta entre las dos escrituras, las
+# líneas de más se ignoran). Con conservar_logbook=False quedan solo las generaciones
+# que había en memoria en cada punto de control; el detalle completo está en el sumidero.
+#
+# Uso:
+#   ejecutar_ag(semilla=1, punto_control=PuntoControl("corrida.ckpt", cada_generaciones=10))
+#   reanudar_ag("corrida.ckpt")
+
+import json
+import os
+import random
+import time
+
+import numpy
+
+from config_piloto import empaquetar_cromosoma, desempaquetar_cromosoma
+from cache_aptitud import CacheAptitud, huella_funcion
+
+VERSION_FORMATO = 2
+
+
+def _genotipos(individuos):
+    """
+    Arreglo uint16 con los genotipos empaquetados (listas de bits o IndividuoCompacto).
+    """
+    return numpy.fromiter((ind.genotipo if hasattr(ind, "genotipo") else empaquetar_cromosoma(ind) for ind in individuos),
+                          dtype=numpy.uint16, count=len(individuos))
+
+
+def _aptitudes(valores):
+    """
+    Arreglo float64 (N, objetivos) con las aptitudes (tuplas de valores).
+    """
+    objetivos = len(valores[0]) if valores else 1
+    return numpy.array(valores, dtype=numpy.float64).reshape(len(valores), objetivos)
+
+
+def _aptitudes_individuos(individuos):
+    """
+    Igual que _aptitudes([ind.fitness.values ...]), pero leyendo wvalues (que no arma
+    una tupla nueva en cada acceso) y dividiendo por los pesos de una sola vez.
+    """
+    if not individuos:
+        return _aptitudes([])
+    pesos = numpy.array(individuos[0].fitness.weights, dtype=numpy.float64)
+    return _aptitudes([ind.fitness.wvalues for ind in individuos]) / pesos
+
+
+def _tipo_individuo(individuos):
+    return "compacto" if individuos and hasattr(individuos[0], "genotipo") else "lista"
+
+
+def _valor_simple(valor):
+    return valor.item() if hasattr(valor, "item") else valor
+
+
+def _cache_aptitud(evaluar):
+    """
+    La CacheAptitud registrada como toolbox.evaluate (toolbox.register la envuelve
+    en un functools.partial), o None si no hay cache.
+    """
+    while hasattr(evaluar, "func"):
+        evaluar = evaluar.func
+    return evaluar if isinstance(evaluar, CacheAptitud) else None
+
+
+def individuos_desde_arreglos(tipo, genotipos, aptitudes):
+    """
+    Reconstruye los individuos a partir de sus genotipos y aptitudes. Para el tipo
+    "lista" tienen que existir los tipos de creator (los crea crear_contexto()).
+    """
+    if tipo == "compacto":
+        from cromosoma_compacto import IndividuoCompacto
+        fabrica = IndividuoCompacto
+    else:
+        from deap import creator
+        fabrica = lambda genotipo: creator.Individual(desempaquetar_cromosoma(genotipo))
+
+    individuos = []
+    for genotipo, aptitud in zip(genotipos.tolist(), aptitudes.tolist()):
+        ind = fabrica(genotipo)
+        ind.fitness.values = tuple(aptitud)
+        individuos.append(ind)
+    return individuos
+
+
+class PuntoControl:
+    """
+    Guarda el estado de la corrida cada cada_generaciones generaciones y/o cada
+    cada_segundos segundos (lo que ocurra primero). Los parámetros de la corrida
+    (que llena ejecutar_ag) se guardan tal cual para poder reanudarla.
+    """
+
+    def __init__(self, ruta, cada_generaciones=None, cada_segundos=None):
+        if cada_generaciones is None and cada_segundos is None:
+            raise ValueError("Indicar cada_generaciones y/o cada_segundos.")
+        self.ruta = ruta
+        self.cada_generaciones = cada_generaciones
+        self.cada_segundos = cada_segundos
+        self.parametros = {}
+        self.guardados = 0
+        self._ultimo_guardado = time.monotonic()
+        self._huella = None
+        self.ruta_logbook = ruta_logbook(ruta)
+        # Última generación escrita en ruta_logbook y cantidad de líneas (None: todavía
+        # no se escribió en esta corrida, el primer guardado lo reescribe entero)
+        self._gen_logbook = None
+        self._registros_logbook = 0
+
+    def guardar_si_corresponde(self, gen, poblacion, halloffame, logbook, toolbox, busqueda_local=None):
+        """
+        Lo llama ea_simple al final de cada generación.
+        """
+        por_generaciones = self.cada_generaciones is not None and gen % self.cada_generaciones == 0
+        por_tiempo = (self.cada_segundos is not None and
+                      time.monotonic() - self._ultimo_guardado >= self.cada_segundos)
+        if por_generaciones or por_tiempo:
+            self.guardar(gen, poblacion, halloffame, logbook, toolbox, busqueda_local)
+
+    def _guardar_logbook(self, logbook):
+        """
+        Agrega a ruta_logbook las generaciones nuevas del logbook (o lo reescribe
+        entero, de forma atómica, en el primer guardado) y devuelve cuántas líneas
+        corresponden a este punto de control.
+        """
+        if self._gen_logbook is None:
+            nuevos, ruta, modo = list(logbook), self.ruta_logbook + ".tmp", "w"
+            self._registros_logbook = 0
+        else:
+            nuevos = [registro for registro in logbook if registro["gen"] > self._gen_logbook]
+            ruta, modo = self.ruta_logbook, "a"
+        directorio = os.path.dirname(self.ruta_logbook)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        with open(ruta, modo, encoding="utf-8") as archivo:
+            for registro in nuevos:
+                archivo.write(json.dumps({clave: _valor_simple(valor) for clave, valor in registro.items()}) + "\n")
+        if modo == "w":
+            os.replace(ruta, self.ruta_logbook)
+        self._registros_logbook += len(nuevos)
+        if len(logbook):
+            self._gen_logbook = logbook[-1]["gen"]
+        elif self._gen_logbook is None:
+            self._gen_logbook = -1
+        return self._registros_logbook
+
+    def guardar(self, gen, poblacion, halloffame, logbook, toolbox, busqueda_local=None):
+        """
+        Escribe el punto de control de la generación gen (de forma atómica).
+        """
+        evaluar = toolbox.evaluate
+        if self._huella is None:
+            self._huella = huella_funcion(evaluar)
+        salon = list(halloffame) if halloffame is not None else []
+        version_rng, estado_rng, gauss_siguiente = random.getstate()
+
+        meta = {
+            "version": VERSION_FORMATO,
+            "gen": gen,
+            "tipo": _tipo_individuo(poblacion),
+            "parametros": self.parametros,
+            "huella_evaluacion": self._huella,
+            "version_rng": version_rng,
+            "gauss_siguiente": gauss_siguiente,
+            "salon_fama": halloffame is not None,
+            "logbook": {"header": logbook.header, "registros": self._guardar_logbook(logbook)},
+        }
+        arreglos = {
+            "poblacion": _genotipos(poblacion),
+            "aptitudes": _aptitudes_individuos(poblacion),
+            "hof_genotipos": _genotipos(salon),
+            "hof_aptitudes": _aptitudes_individuos(salon),
+            "rng": numpy.array(estado_rng, dtype=numpy.uint32),
+        }
+        cache = _cache_aptitud(evaluar)
+        if cache is not None:
+            estado_cache = cache.exportar_estado()
+            entradas = estado_cache.pop("entradas")
+            meta["cache"] = estado_cache
+            arreglos["cache_genotipos"] = numpy.fromiter(
+                (genotipo if isinstance(genotipo, int) else empaquetar_cromosoma(genotipo) for genotipo, _ in entradas),
+                dtype=numpy.uint16, count=len(entradas))
+            arreglos["cache_aptitudes"] = _aptitudes([valor for _, valor in entradas])
+        if busqueda_local is not None:
+            estado_busqueda = busqueda_local.exportar_estado()
+            arreglos["optimos_locales"] = estado_busqueda.pop("optimos")
+            meta["busqueda_local"] = estado_busqueda
+        arreglos["meta"] = numpy.frombuffer(json.dumps(meta).encode("utf-8"), dtype=numpy.uint8)
+
+        directorio = os.path.dirname(self.ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        ruta_temporal = self.ruta + ".tmp"
+        with open(ruta_temporal, "wb") as archivo:
+            numpy.savez(archivo, **arreglos)
+        os.replace(ruta_temporal, self.ruta)
+        self.guardados += 1
+        self._ultimo_guardado = time.monotonic()
+
+
+def ruta_logbook(ruta):
+    """
+    Archivo JSONL con las generaciones del logbook de un punto de control.
+    """
+    return ruta + ".logbook.jsonl"
+
+
+def _leer_logbook(ruta, cantidad):
+    """
+    Las primeras cantidad generaciones guardadas en ruta_logbook(ruta).
+    """
+    registros = []
+    if cantidad:
+        with open(ruta_logbook(ruta), encoding="utf-8") as archivo:
+            for linea in archivo:
+                registros.append(json.loads(linea))
+                if len(registros) == cantidad:
+                    break
+    if len(registros) < cantidad:
+        raise ValueError(f"{ruta_logbook(ruta)} tiene {len(registros)} generaciones y el punto de control "
+                         f"espera {cantidad}.")
+    return registros
+
+
+def cargar_punto_control(ruta):
+    """
+    Lee un punto de control y devuelve un diccionario con gen, tipo, parametros,
+    huella_evaluacion, poblacion, salon_fama (lista de individuos o None),
+    registros y header del logbook, estado_rng (para random.setstate), cache
+    (estado para CacheAptitud.restaurar_estado, o None) y busqueda_local (estado para
+    BusquedaLocal.restaurar_estado, o None si la corrida no era memética).
+    """
+    with numpy.load(ruta) as datos:
+        meta = json.loads(datos["meta"].tobytes().decode("utf-8"))
+        # La versión 1 guardaba el logbook completo dentro del .npz
+        if meta["version"] not in (1, VERSION_FORMATO):
+            raise ValueError(f"Versión de punto de control no soportada: {meta['version']}")
+        registros = meta["logbook"]["registros"]
+        if not isinstance(registros, list):
+            registros = _leer_logbook(ruta, registros)
+        tipo = meta["tipo"]
+        estado = {
+            "gen": meta["gen"],
+            "tipo": tipo,
+            "parametros": meta["parametros"],
+            "huella_evaluacion": meta["huella_evaluacion"],
+            "poblacion": individuos_desde_arreglos(tipo, datos["poblacion"], datos["aptitudes"]),
+            "salon_fama": (individuos_desde_arreglos(tipo, datos["hof_genotipos"], datos["hof_aptitudes"])
+                           if meta["salon_fama"] else None),
+            "header": meta["logbook"]["header"],
+            "registros": registros,
+            "estado_rng": (meta["version_rng"], tuple(datos["rng"].tolist()), meta["gauss_siguiente"]),
+            "cache": None,
+            "busqueda_local": None,
+        }
+        if "cache" in meta:
+            genotipos = datos["cache_genotipos"].tolist()
+            if tipo == "lista":
+                genotipos = [tuple(desempaquetar_cromosoma(genotipo)) for genotipo in genotipos]
+            aptitudes = [tuple(aptitud) for aptitud in datos["cache_aptitudes"].tolist()]
+            estado["cache"] = dict(meta["cache"], entradas=list(zip(genotipos, aptitudes)))
+        if "busqueda_local" in meta:
+            estado["busqueda_local"] = dict(meta["busqueda_local"], optimos=datos["optimos_locales"])
+    return estado
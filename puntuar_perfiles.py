@@ -0,0 +1,238 @@
+# --- Puntuación por Lotes de Perfiles Externos ---
+# Puntúa archivos de perfiles candidatos (datos de scouting, pools sintéticos, ...)
+# sin armar a mano la lista de 16 bits de cada uno. Lee el archivo por bloques, puntúa
+# cada bloque de una vez con la tabla exhaustiva (tabla_aptitud.py) y va escribiendo
+# el resultado, así la memoria no depende del tamaño del archivo.
+#
+# Formatos de entrada (según la extensión):
+#   * .csv   -> una fila por perfil, con encabezado
+#   * .jsonl -> un objeto JSON por línea
+#   * .bin   -> cromosomas empaquetados (ver empaquetar_cromosoma) como enteros de
+#               16 bits sin signo little-endian, uno detrás de otro (numpy "<u2")
+# En CSV y JSONL cada perfil trae una columna por atributo de ATRIBUTOS_CONFIG
+# (A1_Experiencia, ..., A8_ExigenciaSalarial) con la etiqueta ("Veterano") o los bits
+# ("11"), o una sola columna "cromosoma" con los 16 bits ("0110...") o el entero
+# empaquetado. Si hay una columna "id" se copia a la salida; si no, se usa el número
+# de perfil (desde 0).
+#
+# La salida (.csv o .jsonl) tiene por perfil: id, cromosoma, aptitud y el valor legible
+# de cada atributo.
+#
+# Uso:
+#   python puntuar_perfiles.py candidatos.csv puntajes.jsonl --funcion nueva
+
+import csv
+import itertools
+import json
+import time
+
+import numpy
+
+from config_piloto import ATRIBUTOS_CONFIG, ORDEN_ATRIBUTOS, LONGITUD_CROMOSOMA
+
+TAM_BLOQUE = 65536  # perfiles por bloque
+
+NOMBRES_ATRIBUTOS = [nombre_attr for nombre_attr, _, _ in ORDEN_ATRIBUTOS]
+
+# Código (0-3) de cada etiqueta y de cada cadena de bits, por atributo
+CODIGO_POR_VALOR = {
+    nombre_attr: {clave: int(bits, 2) for bits, etiqueta in ATRIBUTOS_CONFIG[nombre_attr].items()
+                  for clave in (bits, etiqueta)}
+    for nombre_attr in NOMBRES_ATRIBUTOS
+}
+
+# Etiquetas de cada atributo indexadas por código, para decodificar un bloque entero
+ETIQUETAS_POR_CODIGO = [
+    numpy.array([ATRIBUTOS_CONFIG[nombre_attr][format(codigo, f"0{num_bits}b")] for codigo in range(1 << num_bits)],
+                dtype=object)
+    for nombre_attr, _, num_bits in ORDEN_ATRIBUTOS
+]
+
+
+# --- Lectura ---
+def genotipo_de_perfil(perfil):
+    """
+    Cromosoma empaquetado de un perfil (diccionario con "cromosoma" o con un valor
+    por atributo, ver el comentario del módulo).
+    """
+    cromosoma = perfil.get("cromosoma")
+    if cromosoma is not None and cromosoma != "":
+        if isinstance(cromosoma, int):
+            genotipo = cromosoma
+        elif isinstance(cromosoma, str) and len(cromosoma) == LONGITUD_CROMOSOMA and set(cromosoma) <= {"0", "1"}:
+            genotipo = int(cromosoma, 2)
+        elif isinstance(cromosoma, str) and cromosoma.isdigit():
+            genotipo = int(cromosoma)
+        else:
+            raise ValueError(f"Cromosoma inválido: {cromosoma!r} (usar {LONGITUD_CROMOSOMA} bits o el entero).")
+        if not 0 <= genotipo < 1 << LONGITUD_CROMOSOMA:
+            raise ValueError(f"Cromosoma fuera de rango: {genotipo}")
+        return genotipo
+
+    genotipo = 0
+    for nombre_attr, _, num_bits in ORDEN_ATRIBUTOS:
+        valor = perfil.get(nombre_attr)
+        if valor is None:
+            raise ValueError(f"Falta el atributo {nombre_attr} (o la columna 'cromosoma').")
+        codigo = CODIGO_POR_VALOR[nombre_attr].get(str(valor).strip())
+        if codigo is None:
+            raise ValueError(f"Valor desconocido para {nombre_attr}: {valor!r}")
+        genotipo = (genotipo << num_bits) | codigo
+    return genotipo
+
+
+def _bloques_de_perfiles(perfiles, tam_bloque, omitir_invalidos):
+    """
+    Agrupa un iterable de diccionarios en bloques (ids, genotipos uint16).
+    """
+    numero = 0
+    while True:
+        bloque = list(itertools.islice(perfiles, tam_bloque))
+        if not bloque:
+            return
+        ids, genotipos = [], []
+        for perfil in bloque:
+            try:
+                genotipos.append(genotipo_de_perfil(perfil))
+            except ValueError as error:
+                if not omitir_invalidos:
+                    raise ValueError(f"Perfil {numero}: {error}") from None
+            else:
+                ids.append(perfil.get("id", numero))
+            numero += 1
+        yield ids, numpy.array(genotipos, dtype=numpy.uint16)
+
+
+def _perfiles_jsonl(archivo):
+    for linea in archivo:
+        if linea.strip():
+            yield json.loads(linea)
+
+
+def leer_bloques(ruta, tam_bloque=TAM_BLOQUE, omitir_invalidos=False):
+    """
+    Recorre un archivo de perfiles (.csv, .jsonl o .bin) y devuelve bloques
+    (ids, genotipos) de hasta tam_bloque perfiles. Con omitir_invalidos=True los
+    perfiles que no se pueden leer se saltean en lugar de cortar con ValueError.
+    """
+    if ruta.endswith(".bin"):
+        with open(ruta, "rb") as archivo:
+            inicio = 0
+            while True:
+                genotipos = numpy.fromfile(archivo, dtype="<u2", count=tam_bloque)
+                if not len(genotipos):
+                    return
+                yield range(inicio, inicio + len(genotipos)), genotipos.astype(numpy.uint16)
+                inicio += len(genotipos)
+    elif ruta.endswith(".csv") or ruta.endswith(".jsonl"):
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            perfiles = csv.DictReader(archivo) if ruta.endswith(".csv") else _perfiles_jsonl(archivo)
+            yield from _bloques_de_perfiles(perfiles, tam_bloque, omitir_invalidos)
+    else:
+        raise ValueError(f"Extensión no soportada para los perfiles: {ruta} (usar .csv, .jsonl o .bin)")
+
+
+def guardar_binario(ruta, genotipos):
+    """
+    Agrega genotipos empaquetados a un archivo .bin (el formato que lee leer_bloques).
+    """
+    with open(ruta, "ab") as archivo:
+        numpy.asarray(genotipos).astype("<u2").tofile(archivo)
+
+
+# --- Puntuación y escritura ---
+def decodificar_bloque(genotipos):
+    """
+    Columnas de etiquetas (una lista por atributo) de un arreglo de genotipos.
+    """
+    columnas = []
+    for (_, inicio_bit, num_bits), etiquetas in zip(ORDEN_ATRIBUTOS, ETIQUETAS_POR_CODIGO):
+        codigos = (genotipos >> (LONGITUD_CROMOSOMA - inicio_bit - num_bits)) & ((1 << num_bits) - 1)
+        columnas.append(etiquetas[codigos].tolist())
+    return columnas
+
+
+def _completar_fragmentos(fragmentos, tabla, genotipos):
+    """
+    Agrega a fragmentos el resto de la línea JSONL (después del id) de los genotipos
+    que todavía no están.
+    """
+    nuevos = numpy.array([g for g in numpy.unique(genotipos).tolist() if g not in fragmentos], dtype=numpy.uint16)
+    filas = zip(nuevos.tolist(), tabla[nuevos].tolist(), *decodificar_bloque(nuevos))
+    for genotipo, aptitud, *etiquetas in filas:
+        fila = {"cromosoma": format(genotipo, f"0{LONGITUD_CROMOSOMA}b"), "aptitud": aptitud}
+        fila.update(zip(NOMBRES_ATRIBUTOS, etiquetas))
+        fragmentos[genotipo] = json.dumps(fila, ensure_ascii=False)[1:]
+
+
+def puntuar_archivo(ruta_entrada, ruta_salida, nombre_funcion="nueva", tam_bloque=TAM_BLOQUE,
+                    omitir_invalidos=False):
+    """
+    Puntúa todos los perfiles de ruta_entrada y escribe los resultados en ruta_salida
+    (.csv o .jsonl) a medida que avanza. Devuelve un resumen con la cantidad de
+    perfiles y el mejor (id, genotipo y aptitud; el primero en caso de empate).
+    """
+    from tabla_aptitud import obtener_tabla
+
+    if not (ruta_salida.endswith(".csv") or ruta_salida.endswith(".jsonl")):
+        raise ValueError(f"Extensión no soportada para la salida: {ruta_salida} (usar .csv o .jsonl)")
+    tabla = numpy.array(obtener_tabla(nombre_funcion))
+    columnas = ["id", "cromosoma", "aptitud"] + NOMBRES_ATRIBUTOS
+    fragmentos = {}
+    resumen = {"perfiles": 0, "mejor_id": None, "mejor_genotipo": None, "mejor_aptitud": None}
+
+    with open(ruta_salida, "w", newline="", encoding="utf-8") as salida:
+        escritor = csv.writer(salida) if ruta_salida.endswith(".csv") else None
+        if escritor is not None:
+            escritor.writerow(columnas)
+
+        for ids, genotipos in leer_bloques(ruta_entrada, tam_bloque, omitir_invalidos):
+            if not len(genotipos):
+                continue
+            aptitudes = tabla[genotipos]
+            if escritor is not None:
+                filas = zip(ids, (format(g, f"0{LONGITUD_CROMOSOMA}b") for g in genotipos.tolist()),
+                            aptitudes.tolist(), *decodificar_bloque(genotipos))
+                escritor.writerows(filas)
+            else:
+                # Todo salvo el id depende solo del genotipo: se arma el JSON una vez por genotipo distinto
+                _completar_fragmentos(fragmentos, tabla, genotipos)
+                salida.writelines(f'{{"id": {json.dumps(id_perfil)}, {fragmentos[genotipo]}\n'
+                                  for id_perfil, genotipo in zip(ids, genotipos.tolist()))
+
+            mejor = int(aptitudes.argmax())
+            if resumen["mejor_aptitud"] is None or aptitudes[mejor] > resumen["mejor_aptitud"]:
+                resumen.update(mejor_id=ids[mejor], mejor_genotipo=int(genotipos[mejor]),
+                               mejor_aptitud=int(aptitudes[mejor]))
+            resumen["perfiles"] += len(genotipos)
+    return resumen
+
+
+def _argumentos():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Puntúa por lotes un archivo de perfiles de pilotos.")
+    parser.add_argument("entrada", help="perfiles (.csv, .jsonl o .bin)")
+    parser.add_argument("salida", help="resultados (.csv o .jsonl)")
+    parser.add_argument("--funcion", choices=["original", "nueva"], default="nueva")
+    parser.add_argument("--tam-bloque", type=int, default=TAM_BLOQUE)
+    parser.add_argument("--omitir-invalidos", action="store_true",
+                        help="saltear los perfiles que no se pueden leer en lugar de cortar")
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    from config_piloto import desempaquetar_cromosoma, imprimir_perfil_piloto
+
+    argumentos = _argumentos()
+    inicio = time.perf_counter()
+    resumen = puntuar_archivo(argumentos.entrada, argumentos.salida, argumentos.funcion, argumentos.tam_bloque,
+                              argumentos.omitir_invalidos)
+    tiempo = time.perf_counter() - inicio
+
+    print(f"{resumen['perfiles']} perfiles puntuados en {tiempo:.2f} s "
+          f"({resumen['perfiles'] / (tiempo or 1.0):.0f} perfiles/s) -> {argumentos.salida}")
+    if resumen["mejor_genotipo"] is not None:
+        print(f"\nMejor perfil (id {resumen['mejor_id']}), aptitud {resumen['mejor_aptitud']}:")
+        imprimir_perfil_piloto(desempaquetar_cromosoma(resumen["mejor_genotipo"]))
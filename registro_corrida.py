@@ -0,0 +1,157 @@
+# --- Registro en Streaming de una Corrida ---
+# En vez de guardar todo el logbook en memoria hasta el final, cada generación se
+# escribe apenas se calcula en un archivo JSONL (una línea JSON por generación) o CSV.
+# Se hace flush cada tantas generaciones, así el archivo se puede seguir mientras la
+# corrida avanza (por ejemplo con "tail -f") y no se pierde lo escrito si se corta.
+#
+# Cada línea tiene las columnas del logbook (gen, nevals, avg, std, min, max, ...) más
+# la mejor aptitud del salón de la fama hasta esa generación y su genotipo empaquetado.
+#
+# Uso:
+#   with crear_sumidero("corrida.jsonl") as sumidero:
+#       ejecutar_ag(sumidero=sumidero, conservar_logbook=False)
+#   for registro in leer_registro("corrida.jsonl"): ...
+
+import csv
+import json
+
+from config_piloto import empaquetar_cromosoma
+
+
+def _valor_simple(valor):
+    """
+    Convierte escalares de NumPy a int/float de Python para poder escribirlos.
+    """
+    return valor.item() if hasattr(valor, "item") else valor
+
+
+def _genotipo(individuo):
+    """
+    Genotipo empaquetado de un individuo (lista de bits o IndividuoCompacto).
+    """
+    genotipo = getattr(individuo, "genotipo", None)
+    return genotipo if genotipo is not None else empaquetar_cromosoma(individuo)
+
+
+def completar_registro(registro, halloffame=None):
+    """
+    Devuelve una copia del registro con valores simples y, si hay salón de la
+    fama, las columnas mejor_hof y genotipo_hof.
+    """
+    fila = {clave: _valor_simple(valor) for clave, valor in registro.items()}
+    if halloffame is not None and len(halloffame):
+        fila["mejor_hof"] = _valor_simple(halloffame[0].fitness.values[0])
+        fila["genotipo_hof"] = _genotipo(halloffame[0])
+    return fila
+
+
+class SumideroJSONL:
+    """
+    Escribe una línea JSON por generación.
+    """
+
+    def __init__(self, ruta, cada=1):
+        self.ruta = ruta
+        self.cada = cada
+        self._archivo = open(ruta, "w", newline="", encoding="utf-8")
+        self._pendientes = 0
+
+    def escribir(self, registro, halloffame=None):
+        self._archivo.write(json.dumps(completar_registro(registro, halloffame)) + "\n")
+        self._pendientes += 1
+        if self._pendientes >= self.cada:
+            self._archivo.flush()
+            self._pendientes = 0
+
+    def cerrar(self):
+        if not self._archivo.closed:
+            self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+
+class SumideroCSV(SumideroJSONL):
+    """
+    Escribe una fila CSV por generación. Las columnas se fijan con el primer registro.
+    """
+
+    def __init__(self, ruta, cada=1):
+        super().__init__(ruta, cada)
+        self._escritor = None
+
+    def escribir(self, registro, halloffame=None):
+        fila = completar_registro(registro, halloffame)
+        if self._escritor is None:
+            self._escritor = csv.DictWriter(self._archivo, fieldnames=list(fila), extrasaction="ignore")
+            self._escritor.writeheader()
+        self._escritor.writerow(fila)
+        self._pendientes += 1
+        if self._pendientes >= self.cada:
+            self._archivo.flush()
+            self._pendientes = 0
+
+
+class SumideroCompuesto:
+    """
+    Reparte cada generación entre varios sumideros (por ejemplo un archivo y las
+    métricas de metricas_http.py).
+    """
+
+    def __init__(self, *sumideros):
+        self.sumideros = [sumidero for sumidero in sumideros if sumidero is not None]
+
+    def escribir(self, registro, halloffame=None):
+        for sumidero in self.sumideros:
+            sumidero.escribir(registro, halloffame)
+
+    def cerrar(self):
+        for sumidero in self.sumideros:
+            sumidero.cerrar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+
+def crear_sumidero(ruta, cada=1):
+    """
+    Crea el sumidero que corresponde a la extensión del archivo (.jsonl o .csv).
+    """
+    if ruta.endswith(".csv"):
+        return SumideroCSV(ruta, cada)
+    if ruta.endswith(".jsonl"):
+        return SumideroJSONL(ruta, cada)
+    raise ValueError(f"Extensión no soportada para el registro: {ruta} (usar .jsonl o .csv)")
+
+
+def _numero(texto):
+    """
+    Convierte un valor leído de un CSV a int o float si se puede.
+    """
+    for tipo in (int, float):
+        try:
+            return tipo(texto)
+        except ValueError:
+            pass
+    return texto
+
+
+def leer_registro(ruta):
+    """
+    Recorre (sin cargarlo entero en memoria) un registro JSONL o CSV y devuelve
+    un diccionario por generación.
+    """
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        if ruta.endswith(".csv"):
+            for fila in csv.DictReader(archivo):
+                yield {clave: _numero(valor) for clave, valor in fila.items()}
+        else:
+            for linea in archivo:
+                if linea.strip():
+                    yield json.loads(linea)
@@ -0,0 +1,511 @@
+# --- Reglas de Aptitud como Datos ---
+# Las reglas de las dos funciones de aptitud (la original y la nueva) escritas como
+# tablas de datos en lugar de cadenas de if. Es la única definición de las reglas:
+# evaluar_aptitud_piloto y evaluar_aptitud_piloto_nueva (config_piloto.py) puntúan con
+# estas tablas, y de ellas salen también la tabla exhaustiva de tabla_aptitud.py y las
+# huellas de cache_aptitud.py. Para cambiar un peso alcanza con editar la tabla.
+#
+# Un compilador convierte cada tabla en operaciones con máscaras de NumPy que puntúan
+# de una sola vez un arreglo (N, 8) con los códigos (0-3) de los atributos de N perfiles.
+# Para un solo cromosoma (lo que pide toolbox.evaluate) el motor usa las mismas reglas
+# compiladas a enteros de Python, que para uno solo es mucho más rápido que NumPy.
+#
+# Tipos de regla (cada una es un diccionario):
+#   * Por valor:   {"id", "atributo", "puntos": {valor: peso, ...}}
+#                  Suma el peso del valor que tenga el atributo (equivale a un if/elif).
+#   * Conjunción:  {"id", "peso", "si": [condicion, ...]}
+#                  Suma "peso" (negativo si es penalización) si se cumplen todas las condiciones.
+#   * Escalonada:  {"id", "peso", "escalon", "minimo", "conteo": [condicion, ...], "si": [...]}
+#                  Cuenta cuántas condiciones de "conteo" se cumplen; si son al menos "minimo"
+#                  (y se cumple "si", que es opcional) suma peso + escalon * (cuenta - minimo).
+#
+# Una condición es (atributo, [valores permitidos]), o una lista de esas tuplas que se
+# cumple si se cumple alguna (O lógico).
+
+import itertools
+
+import numpy
+from config_piloto import ATRIBUTOS_CONFIG, ORDEN_ATRIBUTOS, LONGITUD_CROMOSOMA
+
+# Atajos para las listas de valores que más se repiten
+SALARIO_BARATO = ["Salario Muy Bajo", "Salario Bajo"]
+POCA_EXPERIENCIA = ["Novato", "Joven Promesa"]
+MUCHA_EXPERIENCIA = ["Establecido", "Veterano"]
+VELOCIDAD_ALTA = ["Muy Buena", "Excepcional"]
+CONSISTENCIA_ALTA = ["Muy Consistente", "Extremadamente Consistente"]
+FEEDBACK_ALTO = ["Fuerte", "Excepcional"]
+MENTALIDAD_EQUIPO = ["Jugador de Equipo Nato", "Totalmente Alineado con el Equipo"]
+BUEN_ENCAJE = ["Buen Encaje", "Encaje Perfecto"]
+
+# --- Reglas de la función original (evaluar_aptitud_piloto) ---
+REGLAS_ORIGINAL = [
+    # --- A. Bonificaciones por Atributos Individuales Positivos (BIs) ---
+    {"id": "BI1", "atributo": "A1_Experiencia", "puntos": {"Joven Promesa": 2, "Establecido": 2, "Veterano": 1}},
+    {"id": "BI2", "atributo": "A2_EstiloConduccion", "puntos": {"Agresivo Controlado": 4, "Adaptable Camaleónico": 2}}, # antes era 2
+    {"id": "BI3", "atributo": "A3_VelocidadPura", "puntos": {"Excepcional": 4, "Muy Buena": 2}},
+    {"id": "BI4", "atributo": "A4_ConsistenciaCarrera", "puntos": {"Extremadamente Consistente": 4, "Muy Consistente": 2}},
+    {"id": "BI5", "atributo": "A5_FeedbackTecnico", "puntos": {"Excepcional": 4, "Fuerte": 2}},
+    {"id": "BI6", "atributo": "A6_MentalidadEquipo", "puntos": {"Jugador de Equipo Nato": 2, "Totalmente Alineado con el Equipo": 3, "Equilibrado": 1}},
+    {"id": "BI7", "atributo": "A7_EncajeMarca", "puntos": {"Encaje Perfecto": 3, "Buen Encaje": 2}},
+    {"id": "BI8", "atributo": "A8_ExigenciaSalarial", "puntos": {"Salario Muy Bajo": 2, "Salario Bajo": 1}}, # antes 3 y 2
+
+    # --- B. Bonificaciones por Sinergias (BDs) ---
+    {"id": "BD1", "peso": 10, "si": [("A3_VelocidadPura", VELOCIDAD_ALTA), ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA)]},
+    {"id": "BD2", "peso": 8, "si": [("A6_MentalidadEquipo", MENTALIDAD_EQUIPO), ("A5_FeedbackTecnico", FEEDBACK_ALTO)]},
+    {"id": "BD3", "peso": 6, "si": [[("A1_Experiencia", ["Novato"]), ("A7_EncajeMarca", BUEN_ENCAJE)], # antes 7
+                                    ("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+    {"id": "BD4", "peso": 9, "si": [("A5_FeedbackTecnico", ["Fuerte"]), ("A6_MentalidadEquipo", ["Jugador de Equipo Nato"])]},
+    {"id": "BD5", "peso": 7, "si": [("A1_Experiencia", ["Joven Promesa"]), ("A7_EncajeMarca", BUEN_ENCAJE),
+                                    ("A8_ExigenciaSalarial", ["Salario Bajo"])]},
+    {"id": "BD6", "peso": 6, "si": [("A2_EstiloConduccion", ["Adaptable Camaleónico"]), ("A4_ConsistenciaCarrera", ["Muy Consistente"])]},
+    {"id": "BD7", "peso": 10, "si": [("A1_Experiencia", MUCHA_EXPERIENCIA), ("A5_FeedbackTecnico", ["Excepcional"]),
+                                     ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA)]},
+    {"id": "BD8", "peso": 8, "si": [("A1_Experiencia", ["Veterano"]), ("A7_EncajeMarca", ["Buen Encaje"]),
+                                    ("A6_MentalidadEquipo", MENTALIDAD_EQUIPO)]},
+    {"id": "BD9", "peso": 4, "si": [[("A3_VelocidadPura", ["Excepcional"]), ("A5_FeedbackTecnico", ["Excepcional"])],
+                                    ("A8_ExigenciaSalarial", ["Salario Medio"])]},
+
+    # --- C. Reglas de Incompatibilidad (Penalizaciones - INCs) ---
+    {"id": "INC1", "peso": -9, "si": [("A1_Experiencia", ["Veterano"]), ("A8_ExigenciaSalarial", SALARIO_BARATO)]}, # antes era 6
+    {"id": "INC2", "peso": -5, "si": [("A3_VelocidadPura", ["Excepcional"]), ("A6_MentalidadEquipo", ["Totalmente Alineado con el Equipo"])]},
+    {"id": "INC3", "peso": -4, "si": [("A1_Experiencia", ["Novato"]), ("A5_FeedbackTecnico", ["Excepcional"])]},
+    {"id": "INC4", "peso": -3, "si": [("A6_MentalidadEquipo", MENTALIDAD_EQUIPO), ("A2_EstiloConduccion", ["Agresivo Controlado"])]},
+    {"id": "INC5", "peso": -13, "escalon": 0, "minimo": 2, # antes 9
+     "conteo": [("A3_VelocidadPura", ["Excepcional"]), ("A4_ConsistenciaCarrera", ["Extremadamente Consistente"]),
+                ("A5_FeedbackTecnico", ["Excepcional"]), ("A7_EncajeMarca", ["Encaje Perfecto"])],
+     "si": [("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+    {"id": "INC6", "peso": -4, "si": [("A2_EstiloConduccion", ["Adaptable Camaleónico"]), ("A5_FeedbackTecnico", ["Limitada"])]},
+    {"id": "INC7", "peso": -5, "si": [("A8_ExigenciaSalarial", ["Salario Alto"]), ("A7_EncajeMarca", ["Bajo Encaje"])]},
+    {"id": "INC8", "peso": -4, "si": [("A1_Experiencia", MUCHA_EXPERIENCIA), ("A4_ConsistenciaCarrera", ["Inconsistente"])]},
+    {"id": "INC9", "peso": -3, "si": [("A2_EstiloConduccion", ["Consistente y Calculador"]), ("A3_VelocidadPura", ["Excepcional"])]},
+    {"id": "INC10", "peso": -2, "si": [("A1_Experiencia", POCA_EXPERIENCIA), ("A5_FeedbackTecnico", FEEDBACK_ALTO)]},
+    {"id": "INC11", "peso": -3, "si": [("A3_VelocidadPura", ["Excepcional"]), ("A4_ConsistenciaCarrera", ["Extremadamente Consistente"])]},
+    {"id": "INC12", "peso": -6, "si": [("A1_Experiencia", ["Joven Promesa"]), ("A2_EstiloConduccion", ["Adaptable Camaleónico"]), # antes era 3
+                                       ("A7_EncajeMarca", BUEN_ENCAJE),
+                                       [("A3_VelocidadPura", VELOCIDAD_ALTA), ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA)]]},
+    {"id": "INC13", "peso": -4, "si": [("A6_MentalidadEquipo", MENTALIDAD_EQUIPO), ("A3_VelocidadPura", VELOCIDAD_ALTA)]},
+    {"id": "INC14", "peso": -8, "si": [("A1_Experiencia", POCA_EXPERIENCIA), ("A3_VelocidadPura", VELOCIDAD_ALTA), # antes era 5
+                                       ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA), ("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+    {"id": "INC15", "peso": -9, "si": [("A1_Experiencia", ["Veterano"]), ("A3_VelocidadPura", ["Excepcional"]),
+                                       ("A8_ExigenciaSalarial", ["Salario Alto"]),
+                                       ("A6_MentalidadEquipo", ["Equilibrado", "Primariamente Individualista"])]},
+    {"id": "INC16", "peso": -6, "si": [("A1_Experiencia", MUCHA_EXPERIENCIA), ("A3_VelocidadPura", VELOCIDAD_ALTA),
+                                       ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA)]},
+    {"id": "INC17", "peso": -7, "si": [("A1_Experiencia", MUCHA_EXPERIENCIA), ("A5_FeedbackTecnico", FEEDBACK_ALTO),
+                                       ("A8_ExigenciaSalarial", ["Salario Medio", "Salario Alto"])]},
+    {"id": "INC18", "peso": -5, "si": [("A1_Experiencia", ["Veterano"]), ("A2_EstiloConduccion", ["Agresivo Controlado"])]},
+    # INC19: consistencia distinta de "Extremadamente Consistente"
+    {"id": "INC19", "peso": -4, "si": [("A2_EstiloConduccion", ["Agresivo Controlado"]), ("A3_VelocidadPura", VELOCIDAD_ALTA),
+                                       ("A4_ConsistenciaCarrera", ["Inconsistente", "Algo Consistente", "Muy Consistente"])]},
+    {"id": "INC20", "peso": -9, "si": [("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA), ("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+    {"id": "INC21", "peso": -5, "si": [("A1_Experiencia", ["Veterano"]), ("A7_EncajeMarca", ["Encaje Perfecto"])]},
+]
+
+# --- Reglas de la función nueva (evaluar_aptitud_piloto_nueva) ---
+REGLAS_NUEVA = [
+    # --- Bonificaciones Individuales ---
+    {"id": "BI1", "atributo": "A1_Experiencia", "puntos": {"Joven Promesa": 2, "Establecido": 1, "Veterano": 2}},
+    {"id": "BI2", "atributo": "A2_EstiloConduccion", "puntos": {"Agresivo Controlado": 2, "Adaptable Camaleónico": 1, "Consistente y Calculador": 1}},
+    {"id": "BI2_Tecnico", "peso": 1, "si": [("A2_EstiloConduccion", ["Técnico y Metódico"]), ("A5_FeedbackTecnico", ["Adecuada", "Fuerte"])]},
+    {"id": "BI3", "atributo": "A3_VelocidadPura", "puntos": {"Excepcional": 3, "Muy Buena": 2}},
+    {"id": "BI4", "atributo": "A4_ConsistenciaCarrera", "puntos": {"Extremadamente Consistente": 4, "Muy Consistente": 2}},
+    {"id": "BI4_Aprendizaje", "peso": 1, "si": [("A4_ConsistenciaCarrera", ["Algo Consistente"]), ("A1_Experiencia", POCA_EXPERIENCIA)]},
+    {"id": "BI5", "atributo": "A5_FeedbackTecnico", "puntos": {"Excepcional": 4, "Fuerte": 2}},
+    # BI5_Adecuada: experiencia distinta de "Veterano"
+    {"id": "BI5_Adecuada", "peso": 1, "si": [("A5_FeedbackTecnico", ["Adecuada"]), ("A1_Experiencia", ["Novato", "Joven Promesa", "Establecido"])]},
+    {"id": "BI6", "atributo": "A6_MentalidadEquipo", "puntos": {"Jugador de Equipo Nato": 2, "Totalmente Alineado con el Equipo": 3}},
+    # BI6_Equilibrado: estilo distinto de "Agresivo Controlado"
+    {"id": "BI6_Equilibrado", "peso": 1, "si": [("A6_MentalidadEquipo", ["Equilibrado"]),
+                                                ("A2_EstiloConduccion", ["Consistente y Calculador", "Técnico y Metódico", "Adaptable Camaleónico"])]},
+    {"id": "BI7", "atributo": "A7_EncajeMarca", "puntos": {"Encaje Perfecto": 3, "Buen Encaje": 2}},
+    {"id": "BI8", "atributo": "A8_ExigenciaSalarial", "puntos": {"Salario Muy Bajo": 2, "Salario Bajo": 1}},
+
+    # --- Bonificaciones por Sinergia ---
+    {"id": "BD1", "peso": 10, "si": [("A3_VelocidadPura", VELOCIDAD_ALTA), ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA)]},
+    {"id": "BD2", "peso": 10, "si": [("A5_FeedbackTecnico", FEEDBACK_ALTO), ("A6_MentalidadEquipo", MENTALIDAD_EQUIPO)]},
+    {"id": "BD3", "peso": 6, "si": [("A1_Experiencia", POCA_EXPERIENCIA), ("A7_EncajeMarca", BUEN_ENCAJE),
+                                    ("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+    {"id": "BD4", "peso": 5, "si": [("A2_EstiloConduccion", ["Adaptable Camaleónico"]), ("A4_ConsistenciaCarrera", ["Muy Consistente"]),
+                                    ("A5_FeedbackTecnico", FEEDBACK_ALTO)]},
+    {"id": "BD5", "peso": 6, "si": [("A1_Experiencia", MUCHA_EXPERIENCIA), ("A5_FeedbackTecnico", ["Excepcional"]),
+                                    ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA), ("A6_MentalidadEquipo", MENTALIDAD_EQUIPO)]},
+    {"id": "BD6", "peso": 8, "si": [("A1_Experiencia", ["Veterano"]), ("A7_EncajeMarca", ["Buen Encaje"]),
+                                    ("A6_MentalidadEquipo", MENTALIDAD_EQUIPO)]},
+    {"id": "BD7", "peso": 4, "si": [("A3_VelocidadPura", ["Excepcional"]), ("A5_FeedbackTecnico", ["Excepcional"]),
+                                    ("A8_ExigenciaSalarial", ["Salario Medio"])]},
+    {"id": "BD8", "peso": 6, "si": [("A1_Experiencia", ["Establecido"]), ("A5_FeedbackTecnico", ["Fuerte"]),
+                                    ("A6_MentalidadEquipo", ["Jugador de Equipo Nato"]), ("A8_ExigenciaSalarial", ["Salario Medio"])]},
+    {"id": "BD9", "peso": 5, "si": [("A1_Experiencia", ["Novato"]), ("A5_FeedbackTecnico", ["Adecuada"]),
+                                    ("A6_MentalidadEquipo", ["Equilibrado"]), ("A8_ExigenciaSalarial", ["Salario Muy Bajo"])]},
+    {"id": "BD10", "peso": 6, "si": [("A1_Experiencia", ["Joven Promesa", "Establecido"]), ("A5_FeedbackTecnico", ["Adecuada"]),
+                                     ("A6_MentalidadEquipo", ["Jugador de Equipo Nato"]), ("A8_ExigenciaSalarial", ["Salario Bajo"])]},
+    #{"id": "BD11", "peso": 2, "si": [("A8_ExigenciaSalarial", ["Salario Medio"]), ("A1_Experiencia", ["Establecido"])]},
+    {"id": "BD12", "peso": 5, "si": [("A1_Experiencia", ["Joven Promesa"]), ("A5_FeedbackTecnico", ["Adecuada"]),
+                                     ("A4_ConsistenciaCarrera", ["Algo Consistente"]), ("A6_MentalidadEquipo", MENTALIDAD_EQUIPO),
+                                     ("A8_ExigenciaSalarial", ["Salario Bajo"])]},
+    {"id": "BD13", "peso": 4, "si": [("A2_EstiloConduccion", ["Técnico y Metódico"]), ("A5_FeedbackTecnico", ["Fuerte", "Adecuada"]),
+                                     ("A7_EncajeMarca", ["Encaje Aceptable"])]},
+    {"id": "BD14", "peso": 5, "si": [("A6_MentalidadEquipo", ["Equilibrado"]), ("A5_FeedbackTecnico", ["Adecuada", "Fuerte"]),
+                                     ("A8_ExigenciaSalarial", ["Salario Medio"]), ("A1_Experiencia", ["Establecido", "Joven Promesa"])]},
+    {"id": "BD15", "peso": 4, "si": [("A1_Experiencia", ["Novato"]), ("A6_MentalidadEquipo", ["Equilibrado", "Jugador de Equipo Nato"]),
+                                     ("A8_ExigenciaSalarial", ["Salario Muy Bajo"]), ("A4_ConsistenciaCarrera", ["Algo Consistente"])]},
+    {"id": "BD16", "peso": 5, "si": [("A1_Experiencia", ["Joven Promesa"]), ("A3_VelocidadPura", ["Buena", "Muy Buena"]),
+                                     ("A5_FeedbackTecnico", ["Adecuada", "Fuerte"]), ("A8_ExigenciaSalarial", ["Salario Bajo", "Salario Medio"])]},
+    {"id": "BD17", "peso": 5, "si": [("A3_VelocidadPura", ["Muy Buena"]), ("A5_FeedbackTecnico", FEEDBACK_ALTO),
+                                     ("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+
+    # --- Penalizaciones agrupadas escalonadas ---
+    {"id": "INC_AVANZADA1", "peso": -10, "escalon": -2, "minimo": 2,
+     "conteo": [("A3_VelocidadPura", ["Excepcional"]), ("A4_ConsistenciaCarrera", ["Extremadamente Consistente"]),
+                ("A5_FeedbackTecnico", ["Excepcional"]), ("A7_EncajeMarca", ["Encaje Perfecto"])],
+     "si": [("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+    {"id": "INC_AVANZADA2", "peso": -9, "escalon": -2, "minimo": 2, # perfil incoherente
+     "conteo": [("A1_Experiencia", MUCHA_EXPERIENCIA), ("A5_FeedbackTecnico", FEEDBACK_ALTO),
+                ("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+
+    # --- Penalizaciones ---
+    # INC3 (perfil Dios): requiere BD1, que ya queda implicado por estas dos condiciones
+    {"id": "INC3", "peso": -6, "si": [("A3_VelocidadPura", ["Excepcional"]), ("A4_ConsistenciaCarrera", ["Extremadamente Consistente"])]},
+    {"id": "INC4", "peso": -6, "si": [("A1_Experiencia", ["Veterano"]), ("A3_VelocidadPura", VELOCIDAD_ALTA), # veterano perfecto es raro
+                                      ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA), ("A5_FeedbackTecnico", ["Excepcional"]),
+                                      ("A6_MentalidadEquipo", MENTALIDAD_EQUIPO)]},
+    {"id": "INC_5", "peso": -2, "si": [("A2_EstiloConduccion", ["Adaptable Camaleónico"]), ("A1_Experiencia", ["Veterano"])]},
+    {"id": "INC6", "peso": -3, "si": [("A2_EstiloConduccion", ["Adaptable Camaleónico"]), ("A1_Experiencia", POCA_EXPERIENCIA)]},
+    {"id": "INC7", "peso": -4, "si": [("A8_ExigenciaSalarial", ["Salario Medio"]), ("A1_Experiencia", POCA_EXPERIENCIA),
+                                      ("A5_FeedbackTecnico", ["Adecuada", "Limitada"])]},
+    {"id": "INC8", "peso": -1, "si": [("A8_ExigenciaSalarial", ["Salario Medio"])]},
+    {"id": "INC9", "peso": -4, "si": [("A1_Experiencia", POCA_EXPERIENCIA), ("A5_FeedbackTecnico", ["Excepcional"])]},
+    {"id": "INC10", "peso": -6, "si": [("A1_Experiencia", ["Joven Promesa"]), ("A3_VelocidadPura", VELOCIDAD_ALTA),
+                                       ("A4_ConsistenciaCarrera", CONSISTENCIA_ALTA), ("A8_ExigenciaSalarial", SALARIO_BARATO)]},
+    {"id": "INC11", "peso": -3, "si": [("A1_Experiencia", ["Establecido"]), ("A2_EstiloConduccion", ["Adaptable Camaleónico"]),
+                                       ("A5_FeedbackTecnico", ["Limitada", "Adecuada"])]},
+    {"id": "INC12", "peso": -4, "si": [("A8_ExigenciaSalarial", ["Salario Medio"]), ("A1_Experiencia", ["Establecido"]),
+                                       [("A4_ConsistenciaCarrera", ["Extremadamente Consistente"]), ("A3_VelocidadPura", ["Excepcional"])],
+                                       ("A5_FeedbackTecnico", ["Adecuada", "Fuerte"])]},
+    {"id": "INC13", "peso": -4, "si": [("A3_VelocidadPura", ["Excepcional"]), ("A1_Experiencia", POCA_EXPERIENCIA),
+                                       ("A5_FeedbackTecnico", ["Limitada", "Adecuada"])]},
+    {"id": "INC14", "peso": -3, "si": [("A3_VelocidadPura", ["Excepcional"]),
+                                       ("A6_MentalidadEquipo", ["Primariamente Individualista", "Equilibrado"])]},
+]
+
+# Tablas de reglas disponibles, con los mismos nombres que usa tabla_aptitud.py
+REGLAS_POR_FUNCION = {
+    "original": REGLAS_ORIGINAL,
+    "nueva": REGLAS_NUEVA,
+}
+
+# Posición de cada atributo en el arreglo de códigos (mismo orden que ORDEN_ATRIBUTOS)
+INDICE_ATRIBUTO = {nombre_attr: i for i, (nombre_attr, _, _) in enumerate(ORDEN_ATRIBUTOS)}
+
+
+# --- Conversión de cromosomas a códigos de atributos ---
+def codigos_desde_enteros(enteros):
+    """
+    Convierte un arreglo de N cromosomas empaquetados (ver empaquetar_cromosoma)
+    en un arreglo (N, 8) uint8 con el código 0-3 de cada atributo.
+    """
+    enteros = numpy.asarray(enteros, dtype=numpy.uint32)
+    codigos = numpy.empty((enteros.shape[0], len(ORDEN_ATRIBUTOS)), dtype=numpy.uint8)
+    for i, (_, inicio_bit, num_bits) in enumerate(ORDEN_ATRIBUTOS):
+        desplazamiento = LONGITUD_CROMOSOMA - inicio_bit - num_bits
+        codigos[:, i] = (enteros >> desplazamiento) & ((1 << num_bits) - 1)
+    return codigos
+
+
+def codigos_desde_cromosomas(cromosomas):
+    """
+    Convierte una lista de cromosomas (listas de 16 bits) en un arreglo (N, 8) de códigos.
+    """
+    bits = numpy.asarray(cromosomas, dtype=numpy.uint8).reshape(-1, LONGITUD_CROMOSOMA)
+    codigos = numpy.empty((bits.shape[0], len(ORDEN_ATRIBUTOS)), dtype=numpy.uint8)
+    for i, (_, inicio_bit, num_bits) in enumerate(ORDEN_ATRIBUTOS):
+        codigos[:, i] = 0
+        for bit in range(inicio_bit, inicio_bit + num_bits):
+            codigos[:, i] = (codigos[:, i] << 1) | bits[:, bit]
+    return codigos
+
+
+# --- Compilador de reglas ---
+def _codigo_de_valor(nombre_attr, valor):
+    """
+    Devuelve el código entero (0-3) de un valor legible de un atributo.
+    """
+    for bits_valor, valor_legible in ATRIBUTOS_CONFIG[nombre_attr].items():
+        if valor_legible == valor:
+            return int(bits_valor, 2)
+    raise ValueError(f"El valor '{valor}' no existe para el atributo {nombre_attr}.")
+
+
+def _compilar_condicion(condicion):
+    """
+    Convierte una condición en una lista de pares (indice_atributo, mascara_bits),
+    donde el bit c de mascara_bits indica si el código c está permitido. La
+    condición se cumple si se cumple alguno de los pares.
+    """
+    alternativas = condicion if isinstance(condicion, list) else [condicion]
+    compilada = []
+    for nombre_attr, valores in alternativas:
+        if nombre_attr not in INDICE_ATRIBUTO:
+            raise ValueError(f"Atributo desconocido en la regla: {nombre_attr}")
+        mascara_bits = 0
+        for valor in valores:
+            mascara_bits |= 1 << _codigo_de_valor(nombre_attr, valor)
+        compilada.append((INDICE_ATRIBUTO[nombre_attr], numpy.uint8(mascara_bits)))
+    return compilada
+
+
+def _alternativas_disjuntas(condicion):
+    """
+    Parte una condición compilada (un O de pares) en alternativas que no se solapan:
+    la j-ésima pide su par y que no se cumpla ninguno de los anteriores. Cada
+    alternativa es una tupla de pares (indice_atributo, mascara_bits) con máscaras int.
+    """
+    alternativas, anteriores = [], []
+    for indice, mascara_bits in condicion:
+        alternativas.append(tuple(anteriores) + ((indice, int(mascara_bits)),))
+        todos = (1 << (1 << ORDEN_ATRIBUTOS[indice][2])) - 1
+        anteriores.append((indice, ~int(mascara_bits) & todos))
+    return alternativas
+
+
+def _clausulas(condiciones):
+    """
+    Cláusulas (tuplas de pares que se cumplen todos a la vez) que no se solapan y que
+    juntas equivalen a cumplir todas las condiciones: se cumple una sola o ninguna.
+    """
+    return [tuple(par for alternativa in combinacion for par in alternativa)
+            for combinacion in itertools.product(*[_alternativas_disjuntas(c) for c in condiciones])]
+
+
+class MotorReglas:
+    """
+    Tabla de reglas compilada a máscaras de NumPy. puntuar() recibe un arreglo
+    (N, 8) de códigos de atributos y devuelve las N aptitudes de una sola vez.
+
+    Internamente cada columna de códigos se pasa a "one-hot" (1 << codigo), así
+    cada condición es un AND de bits contra la máscara de valores permitidos.
+    puntuar_cromosoma() puntúa un solo cromosoma con las mismas reglas sin NumPy.
+    """
+
+    def __init__(self, reglas):
+        self.reglas = reglas
+        # (peso, condicion) por cada valor con puntos de las reglas por valor
+        self.por_valor = []
+        # (peso, condiciones) por cada conjunción
+        self.conjunciones = []
+        # (peso, escalon, minimo, condiciones_conteo, condiciones_si) por cada escalonada
+        self.escalonadas = []
+        # Nombre de cada peso, en el orden de las columnas de activaciones()
+        nombres_valor, nombres_conjuncion, nombres_escalonada = [], [], []
+
+        cota = 0
+        for regla in reglas:
+            if "puntos" in regla:
+                for valor, peso in regla["puntos"].items():
+                    self.por_valor.append((peso, _compilar_condicion((regla["atributo"], [valor]))))
+                    nombres_valor.append(f"{regla['id']}={valor}")
+                cota += max(abs(peso) for peso in regla["puntos"].values())
+            elif "conteo" in regla:
+                self.escalonadas.append((regla["peso"], regla.get("escalon", 0), regla.get("minimo", 1),
+                                         [_compilar_condicion(c) for c in regla["conteo"]],
+                                         [_compilar_condicion(c) for c in regla.get("si", [])]))
+                nombres_escalonada += [regla["id"], f"{regla['id']}.escalon"]
+                cota += abs(regla["peso"]) + abs(regla.get("escalon", 0)) * len(regla["conteo"])
+            elif "si" in regla:
+                self.conjunciones.append((regla["peso"], [_compilar_condicion(c) for c in regla["si"]]))
+                nombres_conjuncion.append(regla["id"])
+                cota += abs(regla["peso"])
+            else:
+                raise ValueError(f"La regla {regla.get('id')} no tiene 'puntos', 'si' ni 'conteo'.")
+
+        self.terminos = nombres_valor + nombres_conjuncion + nombres_escalonada
+
+        self._compilar_cromosoma()
+
+        # Con los pesos actuales la suma entra de sobra en int16, que es bastante más rápido
+        self.dtype = numpy.int16 if cota < 2 ** 15 else numpy.int32
+
+    # --- Un solo cromosoma, sin NumPy ---
+    # Para puntuar un cromosoma a la vez (toolbox.evaluate) los arreglos de NumPy cuestan
+    # más que las reglas. Las conjunciones y las condiciones de las escalonadas se pasan a
+    # cláusulas que no se solapan (ver _clausulas); la cláusula r es el bit r de un entero
+    # y, por cada atributo y código, se precalcula el entero con las cláusulas que ese
+    # valor no descarta. Las cláusulas que se cumplen son el AND de esos 8 enteros.
+    def _compilar_cromosoma(self):
+        clausulas, pesos = [], []
+
+        def agregar(condiciones, peso=0):
+            bits = 0
+            for clausula in _clausulas(condiciones):
+                bits |= 1 << len(clausulas)
+                clausulas.append(clausula)
+                pesos.append(peso)
+            return bits
+
+        for peso, condiciones in self.conjunciones:
+            agregar(condiciones, peso)
+        # (peso, escalon, minimo, bits de las condiciones de conteo, bits de "si") por escalonada
+        self._escalonadas_bits = [(peso, escalon, minimo, sum(agregar([condicion]) for condicion in conteo),
+                                   agregar(condiciones))
+                                  for peso, escalon, minimo, conteo, condiciones in self.escalonadas]
+
+        # (inicio_bit, num_bits, puntos por código, cláusulas permitidas por código) por atributo
+        self._atributos_bits = []
+        for indice, (_, inicio_bit, num_bits) in enumerate(ORDEN_ATRIBUTOS):
+            puntos = [0] * (1 << num_bits)
+            for peso, ((indice_valor, mascara_bits),) in self.por_valor:
+                if indice_valor == indice:
+                    puntos[int(mascara_bits).bit_length() - 1] += peso
+            permitidas = [0] * (1 << num_bits)
+            for r, clausula in enumerate(clausulas):
+                valores = (1 << (1 << num_bits)) - 1
+                for indice_par, mascara_bits in clausula:
+                    if indice_par == indice:
+                        valores &= mascara_bits
+                for codigo in range(1 << num_bits):
+                    if valores >> codigo & 1:
+                        permitidas[codigo] |= 1 << r
+            self._atributos_bits.append((inicio_bit, num_bits, puntos, permitidas))
+        self._peso_clausula = {1 << r: peso for r, peso in enumerate(pesos) if peso}
+        self._clausulas_con_peso = sum(self._peso_clausula)
+
+    def puntuar_cromosoma(self, cromosoma_bits):
+        """
+        Aptitud (recortada en 0) de un solo cromosoma (lista de 16 bits), sin NumPy.
+        """
+        total = 0
+        cumplidas = -1
+        for inicio_bit, num_bits, puntos, permitidas in self._atributos_bits:
+            codigo = 0
+            for bit in cromosoma_bits[inicio_bit:inicio_bit + num_bits]:
+                codigo = (codigo << 1) | bit
+            total += puntos[codigo]
+            cumplidas &= permitidas[codigo]
+
+        for peso, escalon, minimo, conteo, condiciones in self._escalonadas_bits:
+            cuenta = (cumplidas & conteo).bit_count()
+            if cuenta >= minimo and cumplidas & condiciones:
+                total += peso + escalon * (cuenta - minimo)
+
+        con_peso = cumplidas & self._clausulas_con_peso
+        while con_peso:
+            bit = con_peso & -con_peso
+            total += self._peso_clausula[bit]
+            con_peso ^= bit
+        return max(0, total)
+
+    @staticmethod
+    def _cumple(onehot, condicion):
+        """
+        Evalúa una condición compilada sobre todas las filas a la vez.
+        """
+        indice, mascara_bits = condicion[0]
+        resultado = (onehot[indice] & mascara_bits) != 0
+        for indice, mascara_bits in condicion[1:]:
+            resultado |= (onehot[indice] & mascara_bits) != 0
+        return resultado
+
+    def _cumple_todas(self, onehot, condiciones, n):
+        resultado = numpy.ones(n, dtype=bool)
+        for condicion in condiciones:
+            resultado &= self._cumple(onehot, condicion)
+        return resultado
+
+    def puntuar(self, codigos, recortar=True):
+        """
+        Devuelve un arreglo con la aptitud (ya recortada en 0) de cada fila de codigos.
+        Con recortar=False devuelve la suma tal cual, que puede ser negativa.
+        """
+        codigos = numpy.asarray(codigos, dtype=numpy.uint8)
+        n = codigos.shape[0]
+        onehot = [numpy.left_shift(numpy.uint8(1), codigos[:, i]) for i in range(codigos.shape[1])]
+        total = numpy.zeros(n, dtype=self.dtype)
+
+        for peso, condicion in self.por_valor:
+            total += self._cumple(onehot, condicion).astype(self.dtype) * self.dtype(peso)
+
+        for peso, condiciones in self.conjunciones:
+            total += self._cumple_todas(onehot, condiciones, n).astype(self.dtype) * self.dtype(peso)
+
+        for peso, escalon, minimo, conteo, condiciones in self.escalonadas:
+            cuenta = numpy.zeros(n, dtype=self.dtype)
+            for condicion in conteo:
+                cuenta += self._cumple(onehot, condicion)
+            activa = (cuenta >= minimo) & self._cumple_todas(onehot, condiciones, n)
+            total += activa.astype(self.dtype) * (self.dtype(peso) + self.dtype(escalon) * (cuenta - self.dtype(minimo)))
+
+        return numpy.maximum(total, 0) if recortar else total
+
+    def pesos_terminos(self):
+        """
+        Pesos de las columnas de activaciones(): el de cada valor, el de cada
+        conjunción y, por cada escalonada, su peso y su escalón.
+        """
+        pesos = [peso for peso, _ in self.por_valor] + [peso for peso, _ in self.conjunciones]
+        for peso, escalon, _, _, _ in self.escalonadas:
+            pesos += [peso, escalon]
+        return numpy.array(pesos, dtype=numpy.int32)
+
+    def activaciones(self, codigos):
+        """
+        Matriz (N, len(terminos)) int8 con la activación de cada término para cada fila
+        de codigos: 1 si se cumple el valor o la conjunción y, en las escalonadas, 1 en
+        la columna del peso y (cuenta - minimo) en la del escalón cuando se activan.
+        La puntuación sin recortar es activaciones(codigos) @ pesos_terminos().
+        """
+        codigos = numpy.asarray(codigos, dtype=numpy.uint8)
+        n = codigos.shape[0]
+        onehot = [numpy.left_shift(numpy.uint8(1), codigos[:, i]) for i in range(codigos.shape[1])]
+        matriz = numpy.zeros((n, len(self.terminos)), dtype=numpy.int8)
+
+        columna = 0
+        for _, condicion in self.por_valor:
+            matriz[:, columna] = self._cumple(onehot, condicion)
+            columna += 1
+        for _, condiciones in self.conjunciones:
+            matriz[:, columna] = self._cumple_todas(onehot, condiciones, n)
+            columna += 1
+        for _, _, minimo, conteo, condiciones in self.escalonadas:
+            cuenta = numpy.zeros(n, dtype=numpy.int8)
+            for condicion in conteo:
+                cuenta += self._cumple(onehot, condicion)
+            activa = (cuenta >= minimo) & self._cumple_todas(onehot, condiciones, n)
+            matriz[:, columna] = activa
+            matriz[:, columna + 1] = activa * (cuenta - minimo)
+            columna += 2
+        return matriz
+
+    def puntuar_enteros(self, enteros):
+        """
+        Igual que puntuar() pero recibiendo cromosomas empaquetados.
+        """
+        return self.puntuar(codigos_desde_enteros(enteros))
+
+
+def compilar_reglas(reglas):
+    """
+    Compila una tabla de reglas (lista de diccionarios) a un MotorReglas.
+    """
+    return MotorReglas(reglas)
+
+
+_MOTORES = {}
+
+def obtener_motor(nombre_funcion):
+    """
+    Devuelve (compilándolo una sola vez) el motor de la función "original" o "nueva".
+    """
+    if nombre_funcion not in _MOTORES:
+        _MOTORES[nombre_funcion] = compilar_reglas(REGLAS_POR_FUNCION[nombre_funcion])
+    return _MOTORES[nombre_funcion]
+
+
+def crear_evaluador_reglas(motor):
+    """
+    Devuelve una función de evaluación compatible con DEAP que puntúa un solo
+    cromosoma con el motor. Conviene más puntuar poblaciones enteras con
+    motor.puntuar(), pero esto permite usar el motor desde la toolbox.
+    """
+    def evaluar_aptitud_reglas(cromosoma_bits):
+        return (motor.puntuar_cromosoma(cromosoma_bits),)
+    return evaluar_aptitud_reglas
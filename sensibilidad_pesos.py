@@ -0,0 +1,179 @@
+# --- Análisis de Sensibilidad de los Pesos ---
+# Los pesos de las reglas se ajustaron a mano ("antes era 2", "antes 9", ...) y para ver
+# si un cambio mueve el perfil ideal había que correr el AG de nuevo. Acá se calcula una
+# sola vez, para los 65.536 cromosomas, qué términos de las reglas se activan (la matriz
+# de MotorReglas.activaciones(): una columna por valor con puntos, por conjunción y, en
+# las escalonadas, una para el peso y otra con la cuenta para el escalón). Así la
+# aptitud de todo el espacio con otro vector de pesos es un producto matriz-vector, y
+# miles de escenarios de pesos se resuelven en segundos.
+#
+# analizar_sensibilidad() varía cada peso por separado dentro de un rango y reporta, para
+# cada variación, el nuevo óptimo y cuántos del top-k original siguen en el top-k.
+#
+# Uso:
+#   python sensibilidad_pesos.py --funcion nueva --desde -5 --hasta 5 --top-k 10 --csv sensibilidad.csv
+
+import csv
+import time
+
+import numpy
+
+from config_piloto import desempaquetar_cromosoma, imprimir_perfil_piloto
+from reglas_piloto import codigos_desde_enteros, obtener_motor
+from tabla_aptitud import TAM_ESPACIO
+
+ESCENARIOS_POR_BLOQUE = 128  # columnas de puntajes por producto (65.536 x 128 float64 = 64 MB)
+DECIMALES_APTITUD = 9  # las aptitudes se comparan redondeadas a esta cantidad de decimales
+
+
+class MatrizActivacion:
+    """
+    Activaciones de los términos de un MotorReglas para todos los cromosomas, con los
+    nombres y los pesos actuales de cada término.
+    """
+
+    def __init__(self, motor):
+        self.terminos = list(motor.terminos)
+        self.pesos = motor.pesos_terminos()
+        # float64: el producto usa BLAS y con pesos enteros el resultado es exacto
+        self.matriz = motor.activaciones(codigos_desde_enteros(numpy.arange(TAM_ESPACIO))).astype(numpy.float64)
+
+    def puntuar(self, pesos=None):
+        """
+        Aptitud (recortada en 0) de los 65.536 cromosomas con el vector de pesos dado
+        (por defecto, los actuales).
+        """
+        pesos = self.pesos if pesos is None else pesos
+        return numpy.maximum(self.matriz @ numpy.asarray(pesos, dtype=numpy.float64), 0)
+
+
+def mejores_por_escenario(matriz_activacion, escenarios, top_k=10):
+    """
+    Para cada fila de escenarios (S, terminos) con un vector de pesos, devuelve los
+    top_k cromosomas y sus aptitudes como arreglos (S, top_k), ordenados como
+    tabla_aptitud.top_k (de mayor a menor aptitud; a igual aptitud, menor entero primero).
+    """
+    escenarios = numpy.atleast_2d(numpy.asarray(escenarios, dtype=numpy.float64))
+    cromosomas = numpy.empty((len(escenarios), top_k), dtype=numpy.int64)
+    aptitudes = numpy.empty((len(escenarios), top_k), dtype=numpy.float64)
+    transpuesta = numpy.ascontiguousarray(matriz_activacion.matriz.T)
+
+    for inicio in range(0, len(escenarios), ESCENARIOS_POR_BLOQUE):
+        bloque = escenarios[inicio:inicio + ESCENARIOS_POR_BLOQUE]
+        # Una fila de puntajes por escenario, así cada búsqueda recorre memoria contigua
+        puntajes = numpy.maximum(bloque @ transpuesta, 0)
+        # Con pesos fraccionarios la suma deja diferencias de redondeo (~1e-16) entre
+        # aptitudes iguales; redondeando vuelven a empatar y se desempata por el entero
+        puntajes = numpy.round(puntajes, DECIMALES_APTITUD, out=puntajes)
+        # La k-ésima mejor aptitud de cada escenario: entran todos los que la superan y,
+        # de los empatados con ella, los de menor entero
+        umbrales = numpy.take_along_axis(puntajes, numpy.argpartition(puntajes, -top_k, axis=1)[:, -top_k:],
+                                         axis=1).min(axis=1)
+        for fila, (valores, umbral) in enumerate(zip(puntajes, umbrales)):
+            mayores = numpy.flatnonzero(valores > umbral)
+            candidatos = numpy.concatenate([mayores, numpy.flatnonzero(valores == umbral)[:top_k - len(mayores)]])
+            elegidos = candidatos[numpy.lexsort((candidatos, -valores[candidatos]))]
+            cromosomas[inicio + fila] = elegidos
+            aptitudes[inicio + fila] = valores[elegidos]
+    return cromosomas, aptitudes
+
+
+def analizar_sensibilidad(nombre_funcion="nueva", variaciones=range(-5, 6), top_k=10, terminos=None):
+    """
+    Varía cada término (por defecto, todos) sumándole cada valor de variaciones a su
+    peso, con el resto de los pesos fijos. Devuelve (base, filas): base tiene el óptimo
+    y el top-k con los pesos actuales, y cada fila es un diccionario con termino,
+    peso_base, variacion, peso, optimo, aptitud_optimo, optimo_cambia (si el óptimo
+    original dejó de ser óptimo) y top_k_comunes (cuántos del top-k original siguen en
+    el nuevo top-k).
+    """
+    matriz_activacion = MatrizActivacion(obtener_motor(nombre_funcion))
+    terminos = matriz_activacion.terminos if terminos is None else terminos
+    variaciones = list(variaciones)
+
+    escenarios, descripcion = [matriz_activacion.pesos], []
+    for termino in terminos:
+        columna = matriz_activacion.terminos.index(termino)
+        for variacion in variaciones:
+            pesos = matriz_activacion.pesos.astype(numpy.float64)
+            pesos[columna] += variacion
+            escenarios.append(pesos)
+            descripcion.append((termino, columna, variacion))
+
+    cromosomas, aptitudes = mejores_por_escenario(matriz_activacion, escenarios, top_k)
+    top_base = set(cromosomas[0].tolist())
+    # Aptitud del óptimo original en cada escenario (redondeada como las del top-k): si
+    # empata con el nuevo máximo, sigue siendo óptimo
+    aptitud_optimo_base = numpy.maximum(numpy.asarray(escenarios) @ matriz_activacion.matriz[cromosomas[0, 0]], 0)
+    aptitud_optimo_base = numpy.round(aptitud_optimo_base, DECIMALES_APTITUD)
+    base = {"optimo": int(cromosomas[0, 0]), "aptitud_optimo": float(aptitudes[0, 0]),
+            "top_k": list(zip(cromosomas[0].tolist(), aptitudes[0].tolist()))}
+
+    filas = []
+    for (termino, columna, variacion), top, aptitudes_top, aptitud_base in zip(descripcion, cromosomas[1:], aptitudes[1:],
+                                                                             aptitud_optimo_base[1:]):
+        peso_base = int(matriz_activacion.pesos[columna])
+        filas.append({
+            "termino": termino,
+            "peso_base": peso_base,
+            "variacion": variacion,
+            "peso": peso_base + variacion,
+            "optimo": int(top[0]),
+            "aptitud_optimo": float(aptitudes_top[0]),
+            "optimo_cambia": bool(aptitud_base < aptitudes_top[0]),
+            "top_k_comunes": len(top_base.intersection(top.tolist())),
+        })
+    return base, filas
+
+
+def rango_estable(filas, termino):
+    """
+    Menor y mayor variación (contiguas alrededor de 0) del término con las que el
+    óptimo no cambia.
+    """
+    estables = {fila["variacion"]: not fila["optimo_cambia"] for fila in filas if fila["termino"] == termino}
+    desde = hasta = 0
+    while estables.get(desde - 1):
+        desde -= 1
+    while estables.get(hasta + 1):
+        hasta += 1
+    return desde, hasta
+
+
+def _argumentos():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sensibilidad del óptimo a los pesos de las reglas.")
+    parser.add_argument("--funcion", choices=["original", "nueva"], default="nueva")
+    parser.add_argument("--desde", type=int, default=-5, help="menor variación de cada peso")
+    parser.add_argument("--hasta", type=int, default=5, help="mayor variación de cada peso")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--terminos", nargs="+", default=None, help="términos a variar (por defecto, todos)")
+    parser.add_argument("--csv", default=None, help="archivo donde guardar una fila por escenario")
+    return parser.parse_args()
+
+
+# --- Bloque Principal ---
+if __name__ == "__main__":
+    argumentos = _argumentos()
+    inicio = time.perf_counter()
+    base, filas = analizar_sensibilidad(argumentos.funcion, range(argumentos.desde, argumentos.hasta + 1),
+                                        argumentos.top_k, argumentos.terminos)
+    tiempo = time.perf_counter() - inicio
+
+    print(f"Óptimo con los pesos actuales: {base['optimo']:016b} -> {base['aptitud_optimo']:.0f}")
+    imprimir_perfil_piloto(desempaquetar_cromosoma(base["optimo"]))
+    print(f"\n{'Término':<40} {'Peso':>5} {'Óptimo estable':>15} {'Top-k mínimo':>13}")
+    for termino in dict.fromkeys(fila["termino"] for fila in filas):
+        peso_base = next(fila["peso_base"] for fila in filas if fila["termino"] == termino)
+        desde, hasta = rango_estable(filas, termino)
+        comunes = min(fila["top_k_comunes"] for fila in filas if fila["termino"] == termino)
+        print(f"{termino:<40} {peso_base:>5} {f'[{desde:+d}, {hasta:+d}]':>15} {f'{comunes}/{argumentos.top_k}':>13}")
+    print(f"\n{len(filas) + 1} escenarios de pesos en {tiempo:.2f} s")
+
+    if argumentos.csv:
+        with open(argumentos.csv, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=list(filas[0]))
+            escritor.writeheader()
+            escritor.writerows(filas)
+        print(f"Escenarios guardados en {argumentos.csv}")
@@ -0,0 +1,191 @@
+# --- Tabla Exhaustiva de Aptitudes ---
+# El cromosoma tiene solo 16 bits, así que hay 2**16 = 65.536 perfiles posibles.
+# En lugar de decodificar y puntuar el mismo perfil una y otra vez durante el AG,
+# puntuamos todo el espacio una sola vez por función de aptitud y guardamos el
+# resultado en un archivo .npy (int16) indexado por el cromosoma empaquetado.
+#
+# Al lado de cada tabla se guarda la huella de su función (cache_aptitud.huella_funcion,
+# que cubre el código de config_piloto.py y reglas_piloto.py) en aptitud_<nombre>.huella.
+# Si las reglas cambiaron desde que se construyó, obtener_tabla() la reconstruye.
+#
+# Uso:
+#   python tabla_aptitud.py          -> construye las tablas y muestra el óptimo y el top 10
+
+import os
+import numpy
+from cache_aptitud import huella_funcion
+from config_piloto import (LONGITUD_CROMOSOMA, empaquetar_cromosoma, desempaquetar_cromosoma,
+                           evaluar_aptitud_piloto, evaluar_aptitud_piloto_nueva, imprimir_perfil_piloto)
+
+# Funciones de aptitud que sabemos tabular, con el nombre usado para su archivo
+FUNCIONES_APTITUD = {
+    "original": evaluar_aptitud_piloto,
+    "nueva": evaluar_aptitud_piloto_nueva,
+}
+
+DIRECTORIO_TABLAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tablas")
+
+TAM_ESPACIO = 2 ** LONGITUD_CROMOSOMA
+
+
+def ruta_tabla(nombre_funcion):
+    """
+    Devuelve la ruta del archivo .npy de la tabla de una función de aptitud.
+    """
+    return os.path.join(DIRECTORIO_TABLAS, f"aptitud_{nombre_funcion}.npy")
+
+
+def ruta_huella(ruta):
+    """
+    Ruta del archivo con la huella de las reglas de una tabla .npy.
+    """
+    return os.path.splitext(ruta)[0] + ".huella"
+
+
+def huella_tabla(nombre_funcion):
+    """
+    Huella actual de la función de aptitud ("original" o "nueva").
+    """
+    return huella_funcion(FUNCIONES_APTITUD[nombre_funcion])
+
+
+def leer_huella(ruta):
+    """
+    Huella guardada junto a la tabla, o None si no hay.
+    """
+    try:
+        with open(ruta_huella(ruta), encoding="utf-8") as archivo:
+            return archivo.read().strip()
+    except OSError:
+        return None
+
+
+def tabla_vigente(nombre_funcion):
+    """
+    True si la tabla existe y se construyó con las reglas actuales.
+    """
+    ruta = ruta_tabla(nombre_funcion)
+    return os.path.exists(ruta) and leer_huella(ruta) == huella_tabla(nombre_funcion)
+
+
+def construir_tabla(funcion_aptitud):
+    """
+    Evalúa los 65.536 cromosomas posibles y devuelve un arreglo int16 donde
+    la posición i contiene la aptitud del cromosoma empaquetado i.
+    """
+    tabla = numpy.empty(TAM_ESPACIO, dtype=numpy.int16)
+    for entero in range(TAM_ESPACIO):
+        aptitud = funcion_aptitud(desempaquetar_cromosoma(entero))[0]
+        if not -32768 <= aptitud <= 32767:
+            raise ValueError(f"La aptitud {aptitud} del cromosoma {entero} no entra en int16.")
+        tabla[entero] = aptitud
+    return tabla
+
+
+def guardar_tabla(tabla, ruta, huella=None):
+    """
+    Guarda la tabla en disco (y su huella, si se indica). Se escribe a un archivo
+    temporal y luego se renombra, así nunca queda una tabla a medio escribir.
+    La huella se escribe después de la tabla: si falta o no coincide, la tabla
+    se vuelve a construir.
+    """
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    # Temporal por proceso: varios procesos de un barrido pueden reconstruirla a la vez
+    ruta_temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(ruta_temporal, "wb") as archivo:
+        numpy.save(archivo, tabla)
+    os.replace(ruta_temporal, ruta)
+    if huella is not None:
+        with open(ruta_temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(huella)
+        os.replace(ruta_temporal, ruta_huella(ruta))
+
+
+def cargar_tabla(ruta, huella=None):
+    """
+    Abre una tabla guardada como arreglo mapeado en memoria (solo lectura).
+    Con huella, verifica que la tabla se haya construido con esas reglas.
+    """
+    if huella is not None and leer_huella(ruta) != huella:
+        raise ValueError(f"La tabla {ruta} se construyó con otras reglas de aptitud; "
+                         "reconstruirla con obtener_tabla(..., reconstruir=True) o python tabla_aptitud.py.")
+    tabla = numpy.load(ruta, mmap_mode="r")
+    if tabla.shape != (TAM_ESPACIO,):
+        raise ValueError(f"La tabla {ruta} debe tener {TAM_ESPACIO} posiciones y tiene {tabla.shape}.")
+    return tabla
+
+
+def obtener_tabla(nombre_funcion, reconstruir=False):
+    """
+    Devuelve la tabla de la función indicada ("original" o "nueva"),
+    construyéndola y guardándola si todavía no existe o si las reglas
+    cambiaron desde que se construyó.
+    """
+    ruta = ruta_tabla(nombre_funcion)
+    huella = huella_tabla(nombre_funcion)
+    if reconstruir or not os.path.exists(ruta) or leer_huella(ruta) != huella:
+        guardar_tabla(construir_tabla(FUNCIONES_APTITUD[nombre_funcion]), ruta, huella)
+    return cargar_tabla(ruta, huella)
+
+
+def crear_evaluador_tabla(tabla):
+    """
+    Devuelve una función de evaluación compatible con DEAP
+    (toolbox.register("evaluate", ...)) que solo lee la aptitud de la tabla.
+    """
+    def evaluar_aptitud_tabla(cromosoma_bits):
+        return (int(tabla[empaquetar_cromosoma(cromosoma_bits)]),)
+    return evaluar_aptitud_tabla
+
+
+def optimo_global(tabla):
+    """
+    Devuelve la aptitud máxima exacta y la lista de cromosomas empaquetados que la alcanzan.
+    """
+    maximo = int(tabla.max())
+    return maximo, [int(entero) for entero in numpy.flatnonzero(tabla == maximo)]
+
+
+def top_k(tabla, k):
+    """
+    Devuelve los k mejores cromosomas como lista de tuplas (entero, aptitud),
+    ordenada de mayor a menor aptitud (a igual aptitud, menor entero primero).
+    """
+    # argsort estable sobre la aptitud negada mantiene el orden por entero en los empates
+    indices = numpy.argsort(-tabla.astype(numpy.int32), kind="stable")[:k]
+    return [(int(entero), int(tabla[entero])) for entero in indices]
+
+
+def comparar_hof_con_optimo(hof, tabla):
+    """
+    Compara los individuos de un HallOfFame con el top exacto de la tabla.
+    Devuelve un diccionario con el óptimo, la mejor aptitud encontrada y
+    cuántos individuos del salón de la fama están en el top-k real (k = len(hof)).
+    Un individuo empatado con el k-ésimo mejor también cuenta como parte del top.
+    """
+    maximo, optimos = optimo_global(tabla)
+    aptitudes_hof = [int(tabla[empaquetar_cromosoma(ind)]) for ind in hof]
+    if not aptitudes_hof:
+        return {"optimo": maximo, "cromosomas_optimos": optimos, "mejor_hof": None,
+                "alcanzo_optimo": False, "hof_en_top_k": 0}
+    umbral_top_k = top_k(tabla, len(aptitudes_hof))[-1][1]
+    return {
+        "optimo": maximo,
+        "cromosomas_optimos": optimos,
+        "mejor_hof": max(aptitudes_hof),
+        "alcanzo_optimo": max(aptitudes_hof) == maximo,
+        "hof_en_top_k": sum(1 for aptitud in aptitudes_hof if aptitud >= umbral_top_k),
+    }
+
+
+# --- Bloque Principal: construir las tablas y mostrar el óptimo exacto ---
+if __name__ == "__main__":
+    for nombre in FUNCIONES_APTITUD:
+        tabla = obtener_tabla(nombre, reconstruir=True)
+        maximo, optimos = optimo_global(tabla)
+        print(f"\n=== Función '{nombre}' ({ruta_tabla(nombre)}) ===")
+        print(f"Aptitud máxima exacta: {maximo} ({len(optimos)} cromosoma/s)")
+        print("Top 10:")
+        for entero, aptitud in top_k(tabla, 10):
+            print(f"  {entero:016b} -> {aptitud}")
+        imprimir_perfil_piloto(desempaquetar_cromosoma(optimos[0]))